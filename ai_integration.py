@@ -1,61 +1,128 @@
-# ai.py
+# ai_integration.py
 # Developer: G A RAZA
-# AI model interactions for the Telegram bot
-
-import requests
-from textblob import TextBlob
-
-# AI API configuration
-AI_API_URL = "https://api.example.com/v1/completions"
-AI_API_KEY = "YOUR_AI_API_KEY"
-
-def humanize_text(text, lang="en"):
-    """Humanize AI-generated text."""
-    prompt = f"Make this text sound more natural and human-like in {'English' if lang == 'en' else 'Hindi'}: {text}"
-    try:
-        response = requests.post(
-            AI_API_URL,
-            headers={"Authorization": f"Bearer {AI_API_KEY}"},
-            json={"prompt": prompt, "max_tokens": 500}
-        )
-        response.raise_for_status()
-        return response.json().get("choices", [{}])[0].get("text", "Error")
-    except Exception as e:
-        return f"{'Error' if lang == 'en' else 'तृटि'}: {e}"
-
-def generate_seo_article(topic, lang="en"):
-    """Generate an SEO-optimized article."""
-    prompt = f"Write a 500-word SEO-optimized article in {'English' if lang == 'en' else 'Hindi'} on {topic}. Include keywords and headings."
-    try:
-        response = requests.post(
-            AI_API_URL,
-            headers={"Authorization": f"Bearer {AI_API_KEY}"},
-            json={"prompt": prompt, "max_tokens": 1000}
-        )
-        response.raise_for_status()
-        return response.json().get("choices", [{}])[0].get("text", "Error")
-    except Exception as e:
-        return f"{'Error' if lang == 'en' else 'तृटि'}: {e}"
-
-def check_grammar(text):
-    """Check grammar using TextBlob (English only)."""
-    blob = TextBlob(text)
-    corrections = []
-    for sentence in blob.sentences:
-        if sentence.correct() != sentence:
-            corrections.append(f"Original: {sentence}\nCorrected: {sentence.correct()}")
-    return "\n".join(corrections) if corrections else "No grammar issues found."
-
-def assist_writing(text, lang="en"):
-    """Provide writing suggestions."""
-    prompt = f"Improve the clarity and style of this text in {'English' if lang == 'en' else 'Hindi'}: {text}"
-    try:
-        response = requests.post(
-            AI_API_URL,
-            headers={"Authorization": f"Bearer {AI_API_KEY}"},
-            json={"prompt": prompt, "max_tokens": 500}
-        )
-        response.raise_for_status()
-        return response.json().get("choices", [{}])[0].get("text", "Error")
-    except Exception as e:
-        return f"{'Error' if lang == 'en' else 'तृटि'}: {e}"
+# AI writing tools for the Telegram bot (/humanize, /seo, /improve) over a shared async HTTP client
+
+import asyncio
+import logging
+import random
+from types import SimpleNamespace
+from typing import Optional, Tuple
+
+import httpx
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AIToolError(Exception):
+    """The writing-tools API failed after all retries or returned no text"""
+
+
+class AIToolsClient:
+    """One pooled httpx client for every writing tool, with timeouts, retries and a concurrency cap"""
+
+    def __init__(self, base_url: str = Config.AI_TOOLS_API_URL, api_key: Optional[str] = None,
+                 max_concurrent: int = Config.AI_TOOLS_MAX_CONCURRENT, retries: int = Config.MAX_RETRIES):
+        self.url = base_url
+        self.api_key = api_key or Config.AI_TOOLS_API_KEY
+        self.retries = retries
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Connection pool, opened on first request"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=httpx.Timeout(Config.AI_TOOLS_TIMEOUT, connect=5.0),
+                # slots caps concurrency; a pool cap would pin it at the startup value after resize()
+                limits=httpx.Limits(max_connections=None,
+                                    max_keepalive_connections=Config.AI_TOOLS_MAX_CONCURRENT)
+            )
+        return self._client
+
+    def resize(self, max_concurrent: int):
+        """New concurrency cap; requests already holding a slot finish under the old one"""
+        self.slots = asyncio.Semaphore(max_concurrent)
+
+    async def complete(self, prompt: str, max_tokens: int) -> Tuple[str, Optional[SimpleNamespace]]:
+        """Run one prompt through the chat-completions endpoint; returns the text and its token usage"""
+        payload = {
+            "model": Config.AI_TOOLS_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+        }
+
+        last_error = None
+        async with self.slots:
+            for attempt in range(self.retries):
+                if attempt:
+                    # Exponential backoff with jitter: ~0.5s, 1s, 2s ...
+                    await asyncio.sleep(0.5 * 2 ** (attempt - 1) * (0.5 + random.random()))
+                try:
+                    response = await self.client.post(self.url, json=payload)
+                except httpx.TransportError as e:
+                    last_error = e
+                    continue
+
+                if response.status_code in RETRY_STATUSES:
+                    last_error = AIToolError(f"HTTP {response.status_code}")
+                    continue
+                if response.is_error:
+                    raise AIToolError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+                body = response.json()
+                choice = (body.get("choices") or [{}])[0]
+                text = (choice.get("message") or {}).get("content") or choice.get("text")
+                if not text:
+                    raise AIToolError("Response had no text")
+                # Same attribute shape as Groq's response.usage, for UsageTracker.record
+                usage = body.get("usage")
+                return text.strip(), SimpleNamespace(**usage) if isinstance(usage, dict) else None
+
+        raise AIToolError(f"Gave up after {self.retries} attempts: {last_error}")
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_tools_client: Optional[AIToolsClient] = None
+
+
+def get_tools_client() -> AIToolsClient:
+    """Get the shared writing-tools client"""
+    global _tools_client
+    if _tools_client is None:
+        _tools_client = AIToolsClient()
+    return _tools_client
+
+
+async def humanize_text(text, language="English"):
+    """Humanize AI-generated text; returns (text, usage)."""
+    prompt = f"Make this text sound more natural and human-like in {language}: {text}"
+    return await get_tools_client().complete(prompt, max_tokens=500)
+
+
+async def generate_seo_article(topic, language="English"):
+    """Generate an SEO-optimized article; returns (text, usage)."""
+    prompt = f"Write a 500-word SEO-optimized article in {language} on {topic}. Include keywords and headings."
+    return await get_tools_client().complete(prompt, max_tokens=1000)
+
+
+async def check_grammar(text):
+    """Check grammar using TextBlob (English only), off the event loop with cached sentences."""
+    from grammar_service import get_grammar_service
+    return await get_grammar_service().check_report(text)
+
+
+async def assist_writing(text, language="English"):
+    """Provide writing suggestions; returns (text, usage)."""
+    prompt = f"Improve the clarity and style of this text in {language}: {text}"
+    return await get_tools_client().complete(prompt, max_tokens=500)
@@ -6,30 +6,62 @@
 import asyncio
 import logging
 import re
-import random
+import time
 from typing import List, Dict, Optional
-from groq import Groq
+from circuit_breaker import CircuitBreaker, CircuitOpenError
 from config import Config
+from generation_profiles import GenerationProfiles, enforce_length
+from message_analyzer import get_analyzer
+from message_catalog import get_catalog
+from perf_tracing import record, span
+from response_postprocessor import get_postprocessor
+from usage_tracker import get_usage_tracker
 
 logger = logging.getLogger(__name__)
 
 class OstaadAIService:
     def __init__(self):
-        self.client = Groq(api_key=Config.GROQ_API_KEY)
+        self._client = None
         self.conversation_history = {}
         self.user_knowledge_levels = {}
         self.user_moods = {}  # Track user emotional state
+        self._prompt_cache = {}  # (language, mood) -> system prompt
+        self.generation_profiles = GenerationProfiles()
+        self.postprocessor = get_postprocessor()
+        self.usage = get_usage_tracker()
+        self.groq_breaker = CircuitBreaker("groq")
+        self.in_flight = 0  # Groq calls waiting for or running on a thread
         
-    async def get_ai_response(self, user_id: int, message: str, language: str = "auto") -> str:
+    @property
+    def client(self):
+        """Groq client, created (and the groq SDK imported) on first use"""
+        if self._client is None:
+            from groq import Groq
+            self._client = Groq(api_key=Config.GROQ_API_KEY, base_url=Config.GROQ_BASE_URL)
+        return self._client
+    
+    async def get_ai_response(self, user_id: int, message: str, language: str = "auto",
+                              analysis: Optional[dict] = None, length_preference: Optional[str] = None) -> str:
         """Get Ostaad AI response with pure desi expertise"""
         try:
+            # Mood and identity come from the caller's analysis when it already has one
+            if analysis is None:
+                analysis = get_analyzer().analyze(message, language)
+            
             # Check for identity questions first - ONLY for very specific developer questions
-            identity_response = self._check_identity_questions(message, language)
-            if identity_response:
-                return identity_response
+            if analysis['identity']:
+                return self._get_developer_response(language)
+            
+            # Users past their daily token quota get a friendly reply instead of a model call
+            if self.usage.over_quota(user_id):
+                return self._get_quota_message(language)
+            
+            # While Groq keeps failing, answer at once instead of queueing more doomed calls
+            if not self.groq_breaker.allow():
+                return self._get_error_message(language)
             
             # Detect user mood and adjust response style
-            user_mood = self._detect_user_mood(message)
+            user_mood = analysis['mood']
             self.user_moods[user_id] = user_mood
             
             # Get or create conversation history
@@ -42,80 +74,110 @@ class OstaadAIService:
                 "content": message
             })
             
-            # Keep only last 20 messages to manage token usage
-            if len(self.conversation_history[user_id]) > 40:
-                self.conversation_history[user_id] = self.conversation_history[user_id][-40:]
+            # Keep only the last CONVERSATION_MEMORY messages to manage token usage
+            if len(self.conversation_history[user_id]) > Config.CONVERSATION_MEMORY:
+                self.conversation_history[user_id] = self.conversation_history[user_id][-Config.CONVERSATION_MEMORY:]
             
             # Create enhanced Ostaad AI system prompt
             system_prompt = self._get_ostaad_ai_system_prompt(language, user_mood)
             
+            # Budget (tokens, temperature, model) for this kind of query and user
+            params = self.generation_profiles.select(
+                analysis.get('category'), analysis.get('domain'), length_preference
+            )
+            
             # Prepare messages for API
-            messages = [{"role": "system", "content": system_prompt}]
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": self.generation_profiles.length_instruction(params)}
+            ]
             messages.extend(self.conversation_history[user_id])
             
-            # Get response from Groq with enhanced parameters
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=Config.DEFAULT_MODEL,
-                messages=messages,
-                max_tokens=4000,
-                temperature=0.8,  # Higher creativity for more human-like responses
-                top_p=0.9,
-                frequency_penalty=0.1,
-                presence_penalty=0.1,
-                stream=False
-            )
+            # Get response from Groq with the profile's parameters
+            response = await self._create_completion(params, messages)
             
-            ai_response = response.choices[0].message.content
+            self.usage.record(user_id, analysis.get('category'), language, params["model"], response.usage)
             
-            # Enhance response with desi context and emojis
-            ai_response = self._enhance_desi_response(ai_response, user_mood, language)
+            choice = response.choices[0]
+            ai_response = enforce_length(choice.message.content, params["max_chars"])
+            self.generation_profiles.record(
+                params["profile"],
+                ai_response,
+                getattr(response.usage, "completion_tokens", None),
+                choice.finish_reason,
+                truncated=len(ai_response) < len(choice.message.content)
+            )
             
-            # Add AI response to history
+            # Add the raw AI response to history - decorations are for display only
             self.conversation_history[user_id].append({
                 "role": "assistant",
                 "content": ai_response
             })
             
-            return ai_response
+            # Opening, category emoji, tips and signature in one pass
+            with span("postprocess"):
+                return self.postprocessor.process(ai_response, mood=user_mood, category=analysis.get('category'))
             
         except Exception as e:
             logger.error(f"Ostaad AI Service Error: {e}")
             return self._get_error_message(language)
     
+    async def _create_completion(self, params: Dict, messages: List[Dict], executor=None):
+        """One Groq call with a profile's parameters, on `executor` (default: asyncio's), counted in
+        in_flight and reported to the circuit breaker; the caller has already been allowed through"""
+        # groq_queue is the wait for a free executor thread, groq_generation the API call itself
+        submitted = time.perf_counter()
+
+        def create_completion():
+            record("groq_queue", time.perf_counter() - submitted)
+            with span("groq_generation"):
+                return self.client.chat.completions.create(
+                    model=params["model"],
+                    messages=messages,
+                    max_tokens=params["max_tokens"],
+                    temperature=params["temperature"],
+                    top_p=params["top_p"],
+                    frequency_penalty=params["frequency_penalty"],
+                    presence_penalty=params["presence_penalty"],
+                    timeout=params["timeout"],
+                    stream=False
+                )
+
+        self.in_flight += 1
+        try:
+            if executor is None:
+                response = await asyncio.to_thread(create_completion)
+            else:
+                response = await asyncio.get_running_loop().run_in_executor(executor, create_completion)
+        except Exception:
+            self.groq_breaker.record_failure()
+            raise
+        finally:
+            self.in_flight -= 1
+        self.groq_breaker.record_success()
+        return response
+
+    async def complete(self, params: Dict, messages: List[Dict], executor=None):
+        """Groq call for background work (long-form jobs); raises CircuitOpenError while Groq is failing"""
+        if not self.groq_breaker.allow():
+            raise CircuitOpenError("Groq circuit is open")
+        return await self._create_completion(params, messages, executor)
+    
     def _detect_user_mood(self, message: str) -> str:
         """Detect user's emotional state from message"""
-        message_lower = message.lower()
-        
-        # Sad/Depressed indicators
-        sad_keywords = ['sad', 'depressed', 'upset', 'crying', 'hurt', 'pain', 'breakup', 
-                       'udaas', 'dukhi', 'pareshan', 'tension', 'problem', 'mushkil']
-        
-        # Happy/Excited indicators  
-        happy_keywords = ['happy', 'excited', 'great', 'awesome', 'amazing', 'love',
-                         'khush', 'maza', 'badhiya', 'accha', 'sahi', 'perfect']
-        
-        # Confused/Help indicators
-        confused_keywords = ['confused', 'help', 'samjha', 'kaise', 'how', 'what', 'why',
-                           'samjhao', 'bataao', 'explain', 'doubt', 'question']
-        
-        # Angry/Frustrated indicators
-        angry_keywords = ['angry', 'frustrated', 'hate', 'stupid', 'worst', 'bad',
-                         'gussa', 'pagal', 'bakwas', 'faltu', 'bekar']
-        
-        if any(keyword in message_lower for keyword in sad_keywords):
-            return "sad"
-        elif any(keyword in message_lower for keyword in happy_keywords):
-            return "happy"
-        elif any(keyword in message_lower for keyword in angry_keywords):
-            return "angry"
-        elif any(keyword in message_lower for keyword in confused_keywords):
-            return "confused"
-        else:
-            return "neutral"
+        return get_analyzer().analyze(message)['mood']
     
     def _get_ostaad_ai_system_prompt(self, language: str, user_mood: str) -> str:
-        """Get enhanced Ostaad AI system prompt"""
+        """Get enhanced Ostaad AI system prompt (built once per language and mood)"""
+        cache_key = (language, user_mood)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is None:
+            cached = self._build_system_prompt(language, user_mood)
+            self._prompt_cache[cache_key] = cached
+        return cached
+    
+    def _build_system_prompt(self, language: str, user_mood: str) -> str:
+        """Build the Ostaad AI system prompt"""
         
         base_prompt = f"""You are **Ustad AI** - a smart, friendly, emotional, and highly human-like assistant. You exist inside a Telegram bot where users ask all kinds of questions - serious, funny,[...]
 
@@ -214,112 +276,46 @@ Remember: You are Ustad AI, a real digital ustad who understands emotions, speak
     
     def _enhance_desi_response(self, response: str, user_mood: str, language: str) -> str:
         """Enhance response with desi context and appropriate emojis"""
-        
-        # Add mood-appropriate opening if not already present
-        mood_openings = {
-            "sad": ["Are bhai", "Kya hua yaar", "Samjh gaya bhai"],
-            "happy": ["Waah bhai!", "Bahut badhiya!", "Sahi hai yaar!"],
-            "angry": ["Arre shaant ho jao", "Samjha bhai", "Thoda relax karo"],
-            "confused": ["Chalo samjhaata hoon", "Dekho bhai", "Aise samjho"],
-            "neutral": ["Suno bhai", "Dekho", "Samjhao"]
-        }
-        
-        # Check if response already has a good opening
-        has_opening = any(opening.split()[0].lower() in response.lower()[:20] 
-                         for openings in mood_openings.values() 
-                         for opening in openings)
-        
-        if not has_opening and user_mood in mood_openings:
-            opening = random.choice(mood_openings[user_mood])
-            response = f"{opening}, {response}"
-        
-        # Add category-specific tips for certain topics
-        if any(word in response.lower() for word in ['algorithm', 'programming', 'code']):
-            response += "\n\nTech Tip: Practice daily coding karo bhai - consistency is key!"
-        
-        if any(word in response.lower() for word in ['study', 'exam', 'padhai']):
-            response += "\n\nPadhai Tip: Time table banao aur regular revision karte raho!"
-        
-        if any(word in response.lower() for word in ['love', 'relationship', 'breakup']):
-            response += "\n\nDil Ki Baat: Sabr rakho bhai, sab theek ho jaayega!"
-        
-        if any(word in response.lower() for word in ['job', 'career', 'interview']):
-            response += "\n\nCareer Advice: Confidence rakho aur preparation solid karo!"
-        
-        # Add signature for longer responses
-        if len(response) > 200:
-            response += f"\n\n**Ustad AI** | Always here to help!"
-        
-        return response
+        return self.postprocessor.process(response, mood=user_mood)
     
     def _check_identity_questions(self, message: str, language: str) -> Optional[str]:
         """Enhanced identity response for Ustad AI - ONLY for very specific developer questions"""
-        message_lower = message.lower()
-        
-        # Very specific developer questions only
-        developer_keywords = [
-            'who made you', 'who created you', 'who is your developer', 'who built you',
-            'tumhe kisne banaya', 'developer kaun hai', 'creator kaun hai', 'banane wala kaun',
-            'ahmad kaun hai', 'ahmad ke bare me', 'ahmad about'
-        ]
-        
-        # ONLY respond if user specifically asks about developer/creator
-        if any(keyword in message_lower for keyword in developer_keywords):
+        if get_analyzer().analyze(message)['identity']:
             return self._get_developer_response(language)
         
         return None
     
     def _get_developer_response(self, language: str) -> str:
         """Enhanced developer response"""
-        return f"""**Mere Creator ke baare mein**
-
-**Developer**: **{Config.DEVELOPER}** (Mere Boss!)
-**Contact**: Available through Telegram
-**Expertise**: Advanced AI Development & Telegram Bot Architecture
-
-**Unki specialization:**
-* **AI Engineering**: Cutting-edge AI model integration
-* **Bot Development**: Enterprise-level Telegram bots
-* **System Architecture**: Scalable, robust backend systems
-* **Innovation**: Latest tech trends mein hamesha ahead
-
-**Unka vision:**
-India mein AI ko accessible banana aur har person ko digital empowerment dena!
-
-**Meri creation story:**
-{Config.DEVELOPER} ne mujhe isliye banaya taaki har Indian ko world-class AI assistance mil sake - bilkul human-like, lekin Indian context ke saath!
-
-**Recognition**: 
-Wo AI development community mein respected name hain aur innovative solutions ke liye jaane jaate hain!
-
-**Unse connect karna chahte ho?** Message karo Telegram pe!
-
-{Config.POWERED_BY} | {Config.VERSION}"""
+        return get_catalog().render('developer_info', language)
     
     def _get_error_message(self, language: str) -> str:
         """Enhanced error message in desi style"""
-        messages = {
-            "hi": f"""Arre yaar, mujhe thoda technical problem ho raha hai!
-
-**Kya karna hai:**
-* Thoda wait karo aur phir try karo 
-* Agar problem continue kare to developer ko batao
-
-**Meanwhile**: Main jaldi wapas aa jaunga tumhari help ke liye!
-
-{Config.POWERED_BY} | Hamesha seekhta rehta hoon!""",
-            
-            "default": f"""Arre bhai, I'm having some technical difficulties!
-
-**What to do:**
-* Wait a bit and try again
-* If problem continues, contact the developer
-
-**Meanwhile**: I'll be back to help you soon!
-
-{Config.POWERED_BY} | Always learning, always improving!"""
-        }
-        return messages.get(language, messages["default"])
+        return get_catalog().render('ai_error', language)
+    
+    def asked_question(self, user_id: int) -> bool:
+        """Whether the last reply to the user ends by asking them something"""
+        history = self.conversation_history.get(user_id)
+        if not history or history[-1]["role"] != "assistant":
+            return False
+        lines = history[-1]["content"].strip().splitlines()
+        return bool(lines) and ("?" in lines[-1] or "؟" in lines[-1])
+
+    def _get_quota_message(self, language: str) -> str:
+        """Over-quota reply with the hours left until the daily reset"""
+        hours = max(1, round(self.usage.seconds_until_reset() / 3600))
+        return get_catalog().render('quota_exceeded', language, quota=f"{self.usage.daily_quota:,}", hours=hours)
+    
+    def warm_up(self, languages: List[str]):
+        """Create the Groq client, open its connection and fill the prompt cache"""
+        for language in languages:
+            for mood in Config.MOOD_EMOJIS:
+                self._get_ostaad_ai_system_prompt(language, mood)
+        self.ping_upstream()
+    
+    def ping_upstream(self):
+        """Cheap authenticated Groq call that (re)opens and keeps the TLS connection alive"""
+        self.client.models.list()
     
     def clear_conversation(self, user_id: int):
         """Clear conversation history for a user"""
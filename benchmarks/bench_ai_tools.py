@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# benchmarks/bench_ai_tools.py
+# Developer: Ahmad Raza
+# Writing-tools client against a local stub API: concurrency cap, retries and event-loop latency
+#
+# Usage: python -m benchmarks.bench_ai_tools [--requests 40] [--delay 0.2] [--fail-every 5]
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ai_integration import AIToolsClient
+
+
+def _start_stub(delay: float, fail_every: int) -> ThreadingHTTPServer:
+    """Chat-completions stub that answers after `delay` and fails every Nth request with 503"""
+    state = {"requests": 0, "in_flight": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                state["requests"] += 1
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                failing = fail_every and state["requests"] % fail_every == 0
+            time.sleep(delay)
+            with lock:
+                state["in_flight"] -= 1
+
+            if failing:
+                self.send_response(503)
+                self.end_headers()
+                return
+            reply = {"choices": [{"message": {"content": f"stub: {body['messages'][0]['content'][:40]}"}}]}
+            data = json.dumps(reply).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(url: str, requests: int, max_concurrent: int):
+    client = AIToolsClient(base_url=url, api_key="stub", max_concurrent=max_concurrent)
+    lags = []
+
+    async def heartbeat(stop: asyncio.Event):
+        # How late a 10 ms sleep wakes up while the tools run = how blocked the loop is
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stop))
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(client.complete(f"prompt {i}", max_tokens=50) for i in range(requests)), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    await client.close()
+    return results, elapsed, max(lags) if lags else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the writing-tools HTTP client")
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--fail-every", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    server = _start_stub(args.delay, args.fail_every)
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    try:
+        results, elapsed, lag = asyncio.run(_run(url, args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    state = server.state
+    print(f"{args.requests} tool calls in {elapsed:.2f}s ({args.requests / elapsed:.1f}/s)")
+    print(f"  succeeded {len(results) - len(failures)}, failed {len(failures)}, "
+          f"upstream requests {state['requests']} (retries {state['requests'] - args.requests})")
+    print(f"  peak upstream concurrency {state['peak']} (cap {args.concurrency})")
+    print(f"  worst event-loop lag {lag * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# benchmarks/bench_chunker.py
+# Developer: Ahmad Raza
+# UTF-16-aware streaming chunker versus the old concatenating splitter
+#
+# Usage: python -m benchmarks.bench_chunker [--repeat 5]
+# Rates are per character of the reply.
+
+import argparse
+
+from benchmarks.common import format_rate, time_call
+from config import Config
+from message_chunker import iter_chunks, split_message, utf16_len
+
+
+def _legacy_split(text, max_length=Config.MAX_MESSAGE_LENGTH):
+    """Utils.split_long_message as it was before message_chunker"""
+    if len(text) <= max_length:
+        return [text]
+    chunks = []
+    current_chunk = ""
+    for paragraph in text.split('\n\n'):
+        if len(current_chunk + paragraph) <= max_length:
+            current_chunk += paragraph + '\n\n'
+        else:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+                current_chunk = ""
+            if len(paragraph) > max_length:
+                for sentence in paragraph.split('. '):
+                    if len(current_chunk + sentence) <= max_length:
+                        current_chunk += sentence + '. '
+                    else:
+                        if current_chunk:
+                            chunks.append(current_chunk.strip())
+                        current_chunk = sentence + '. '
+            else:
+                current_chunk = paragraph + '\n\n'
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def _sample_reply(paragraphs: int) -> str:
+    paragraph = ("Bhai 🚀🔥 yeh **important point** hai 💯. Har din `practice` karo aur notes banao 📚✍️. "
+                 "Interview se pehle [roadmap](https://example.com/roadmap) dekh lo! 🎯🙌 ") * 6
+    code = "```python\n" + "\n".join(f"print('step {i}')  # 🔥" for i in range(40)) + "\n```"
+    return "\n\n".join(code if i % 10 == 9 else paragraph for i in range(paragraphs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Telegram message chunking")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    limit = Config.MAX_MESSAGE_LENGTH
+    replies = [_sample_reply(paragraphs) for paragraphs in (10, 100, 1000)]
+    replies.append("Shabash 🎉🔥 " * 400)                 # Under 4096 code points, over 4096 UTF-16 units
+    replies.append("ek bahut lambi line bina full stop ke " * 300)
+    for reply in replies:
+        stream = [reply[i:i + 40] for i in range(0, len(reply), 40)]
+
+        legacy = time_call(lambda: _legacy_split(reply), repeat=args.repeat)
+        whole = time_call(lambda: split_message(reply), repeat=args.repeat)
+        streamed = time_call(lambda: list(iter_chunks(stream)), repeat=args.repeat)
+
+        legacy_over = sum(utf16_len(chunk) > limit for chunk in _legacy_split(reply))
+        chunks = split_message(reply)
+        print(f"\nReply of {len(reply):,} chars / {utf16_len(reply):,} UTF-16 units")
+        print(f"  legacy split   {format_rate(legacy['median'], len(reply))}  "
+              f"{legacy_over} chunk(s) over the limit")
+        print(f"  chunker        {format_rate(whole['median'], len(reply))}  "
+              f"{len(chunks)} chunks, largest {max(map(utf16_len, chunks))} units")
+        print(f"  chunker stream {format_rate(streamed['median'], len(reply))}  "
+              f"({len(stream)} pieces)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# benchmarks/bench_grammar.py
+# Developer: Ahmad Raza
+# Grammar check on a long essay: old sequential double-correct() versus the pooled, cached service
+#
+# Usage: python -m benchmarks.bench_grammar [--sentences 24] [--workers 2] [--skip-legacy]
+
+import argparse
+import asyncio
+import time
+
+from grammar_service import GrammarService, correct_sentence, split_sentences
+
+_SENTENCES = [
+    "The goverment anounced a new educaton policy for all studnts.",
+    "Many teachers beleive that the changes will improve lerning outcomes.",
+    "Students shuld recieve thier asignments befor the deadline.",
+    "Online classes have become very populer after the pandemic.",
+    "It is importent to practise writing every day.",
+    "Libraries provide acess to books that many familys cannot afford.",
+    "Exams test memory more than understanding acording to some experts.",
+    "Good nutrition helps children concentrate in the classroom.",
+]
+
+
+def _essay(sentences: int) -> str:
+    # Sentences repeat past the table, as they do in pasted assignments; repeats are corrected once
+    return " ".join(_SENTENCES[i % len(_SENTENCES)] for i in range(sentences))
+
+
+def _legacy_check(text: str) -> int:
+    """check_grammar as it was: correct() twice per sentence, one after another"""
+    from textblob import TextBlob
+    corrections = 0
+    for sentence in split_sentences(text):
+        blob = TextBlob(sentence)
+        if blob.correct() != blob:
+            corrections += 1
+            str(blob.correct())
+    return corrections
+
+
+async def _service_checks(service: GrammarService, text: str):
+    start = time.perf_counter()
+    cold = await service.check(text)
+    cold_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await service.check(text)
+    warm_time = time.perf_counter() - start
+    return len(cold), cold_time, warm_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the grammar check service")
+    parser.add_argument("--sentences", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    essay = _essay(args.sentences)
+    print(f"Essay: {len(essay)} chars, {len(split_sentences(essay))} sentences")
+    correct_sentence("warm up")     # Spelling model load is not part of either measurement
+
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        _legacy_check(essay)
+        print(f"  legacy (sequential, 2x correct)  {time.perf_counter() - start:7.2f}s on the event loop")
+
+    service = GrammarService(workers=args.workers, max_chars=len(essay) + 1)
+    try:
+        asyncio.run(service.check("warm up the pool."))
+        fixes, cold, warm = asyncio.run(_service_checks(service, essay))
+    finally:
+        service.shutdown()
+    print(f"  service cold ({args.workers} workers)         {cold:7.2f}s off the loop, {fixes} fixes")
+    print(f"  service repeat (cache)           {warm * 1000:7.2f}ms")
+    print(f"  stats: {service.stats}")
+
+
+if __name__ == "__main__":
+    main()
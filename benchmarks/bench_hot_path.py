@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# benchmarks/bench_hot_path.py
+# Developer: Ahmad Raza
+# Per-message hot-path functions over a multilingual corpus, gated against a stored baseline
+#
+# Usage: python -m benchmarks.bench_hot_path              compare with the baseline, exit 1 on regression
+#        python -m benchmarks.bench_hot_path --save       record a new baseline
+#        [--threshold 0.3] [--repeat 7] [--number 20] [--rounds 3] [--only detect_language]
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.common import format_rate, time_call
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS = os.path.join(HERE, "hot_path_corpus.tsv")
+BASELINE = os.path.join(HERE, "baseline_hot_path.json")
+
+MESSAGE_KINDS = ("short", "long", "devanagari", "arabic", "emoji")
+
+
+def read_corpus(path: str = CORPUS) -> Dict[str, List[str]]:
+    """kind -> texts; replies store line breaks as a literal \\n"""
+    corpus = defaultdict(list)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            kind, text = line.split("\t", 1)
+            corpus[kind].append(text.replace("\\n", "\n"))
+    return corpus
+
+
+def _calibration_work():
+    total = 0
+    for i in range(20000):
+        total += i * i
+    "-".join(str(i) for i in range(2000)).split("-")
+    return total
+
+
+def _calibrate() -> float:
+    """Best time of a fixed pure-Python workload.
+
+    It runs right before every case and each case is stored relative to it, so machine speed and
+    CPU-frequency drift during the run cancel out and baselines travel between machines.
+    """
+    return time_call(_calibration_work, repeat=5, number=3)["best"]
+
+
+def build_cases(corpus: Dict[str, List[str]]) -> List[Tuple[str, Callable, List]]:
+    """(name, function, inputs) for every hot-path function and input kind"""
+    from enhanced_handlers import EnhancedOstaadHandlers
+    from knowledge_domains import KnowledgeDomainClassifier
+    from utils import Utils
+
+    handlers = EnhancedOstaadHandlers()
+    ai_service = handlers.ai_service
+    detector = handlers.language_detector
+    domains = KnowledgeDomainClassifier()
+
+    message_functions = [
+        ("detect_language", detector.detect_language),
+        ("classify_query_category", handlers._classify_query_category),
+        ("classify_query", domains.classify_query),
+        ("detect_user_mood", ai_service._detect_user_mood),
+    ]
+    cases = [(f"{name}[{kind}]", func, corpus[kind])
+             for name, func in message_functions for kind in MESSAGE_KINDS]
+
+    replies = corpus["reply"]
+    long_reply = "\n\n".join(replies * 8)       # Past the 4096-char message limit, so it really splits
+    cases += [
+        ("enhance_desi_response[reply]", lambda reply: ai_service._enhance_desi_response(reply, "confused", "hi"),
+         replies),
+        ("format_desi_response[reply]", lambda reply: handlers._format_desi_response(reply, "padhai_education", "hi"),
+         replies),
+        ("split_long_message[reply]", Utils.split_long_message, replies),
+        ("split_long_message[long_reply]", Utils.split_long_message, [long_reply]),
+    ]
+    return cases
+
+
+def run_cases(cases, repeat: int, number: int, rounds: int) -> Dict[str, Dict[str, float]]:
+    """Best per-item seconds of each case, and that time in calibration-loop units.
+
+    All cases run `rounds` times and each keeps its cheapest round, so a burst of load on the
+    machine during one round does not decide the result.
+    """
+    results = {}
+    for _ in range(rounds):
+        for name, result in _run_round(cases, repeat, number).items():
+            if name not in results or result["units"] < results[name]["units"]:
+                results[name] = result
+    for name, result in results.items():
+        print(f"  {name:<36} {format_rate(result['seconds'])}")
+    return results
+
+
+def _run_round(cases, repeat: int, number: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, func, inputs in cases:
+        def one_pass():
+            for text in inputs:
+                func(text)
+        # Tiny cases loop until one measurement takes ~20ms, otherwise timer noise dominates
+        single = time_call(one_pass, repeat=1)["best"]
+        calls = max(number, math.ceil(0.02 / max(single, 1e-9)))
+        calibration = _calibrate()
+        seconds = time_call(one_pass, repeat=repeat, number=calls)["best"] / len(inputs)
+        results[name] = {"seconds": seconds, "units": seconds / calibration}
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: dict, threshold: float) -> List[str]:
+    """Names of the cases whose calibrated cost exceeds baseline * (1 + threshold)"""
+    regressions = []
+    print(f"\nAgainst baseline (Python {baseline.get('python', '?')}):")
+    for name, result in results.items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            print(f"  {name:<36} new case, no baseline")
+            continue
+        ratio = result["units"] / base["units"]
+        flag = "REGRESSED" if ratio > 1 + threshold else ""
+        print(f"  {name:<36} {ratio:6.2f}x  {flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-message hot-path functions")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.3, help="Allowed slowdown before failing (0.3 = 30%%)")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="Full passes over all cases; the best one counts")
+    parser.add_argument("--only", help="Run only cases whose name contains this")
+    args = parser.parse_args()
+
+    cases = build_cases(read_corpus())
+    if args.only:
+        cases = [case for case in cases if args.only in case[0]]
+
+    results = run_cases(cases, args.repeat, args.number, args.rounds)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "cases": results},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; record one with --save")
+        sys.exit(2)
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# benchmarks/bench_language_id.py
+# Developer: Ahmad Raza
+# Accuracy and throughput of the n-gram identifier versus langdetect
+#
+# Usage: python -m benchmarks.bench_language_id [--holdout 5]
+
+import argparse
+import time
+
+from benchmarks.common import format_rate, time_call
+from language_identifier import (
+    DEFAULT_CORPUS, LABEL_TO_LANGUAGE, NgramLanguageIdentifier, read_corpus, split_corpus
+)
+
+
+def _langdetect_predict(texts):
+    """Map langdetect output onto the bot's codes the way LanguageDetector used to"""
+    from langdetect import DetectorFactory, detect
+
+    DetectorFactory.seed = 0
+    predictions = []
+    for text in texts:
+        try:
+            detected = detect(text)
+        except Exception:
+            detected = "hi"
+        predictions.append("en" if detected == "en" else "hi")
+    return predictions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark language identification")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--holdout", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    _, held_out = split_corpus(read_corpus(args.corpus), args.holdout)
+    texts = [text for _, text in held_out]
+    expected = [LABEL_TO_LANGUAGE[label] for label, _ in held_out]
+
+    start = time.perf_counter()
+    identifier = NgramLanguageIdentifier.load()
+    print(f"n-gram tables loaded in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    ngram = [LABEL_TO_LANGUAGE[label] for label, _ in identifier.predict_batch(texts)]
+    ngram_accuracy = sum(p == e for p, e in zip(ngram, expected)) / len(expected)
+
+    single = time_call(lambda: [identifier.predict(t) for t in texts], repeat=args.repeat)
+    batch = time_call(lambda: identifier.predict_batch(texts), repeat=args.repeat)
+
+    print(f"\nHeld-out samples: {len(texts)}")
+    print(f"n-gram   accuracy {ngram_accuracy:6.1%}")
+    print(f"  single  {format_rate(single['median'], len(texts))}")
+    print(f"  batch   {format_rate(batch['median'], len(texts))}")
+
+    try:
+        start = time.perf_counter()
+        _langdetect_predict(texts[:1])
+        print(f"\nlangdetect first call (profile load) {(time.perf_counter() - start) * 1e3:.1f} ms")
+    except ImportError:
+        print("\nlangdetect not installed - skipping comparison")
+        return
+
+    reference = _langdetect_predict(texts)
+    reference_accuracy = sum(p == e for p, e in zip(reference, expected)) / len(expected)
+    timed = time_call(lambda: _langdetect_predict(texts), repeat=args.repeat)
+
+    print(f"langdetect accuracy {reference_accuracy:6.1%}")
+    print(f"  single  {format_rate(timed['median'], len(texts))}")
+
+
+if __name__ == "__main__":
+    main()
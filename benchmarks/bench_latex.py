@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# benchmarks/bench_latex.py
+# Developer: Ahmad Raza
+# LaTeX notes throughput: cold renders through the worker pool, then content-hash cache hits
+#
+# Usage: python -m benchmarks.bench_latex [--docs 8] [--workers 2]
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import format_rate, time_call
+from latex_renderer import LatexRenderer
+
+
+def _sample_notes(index: int) -> str:
+    return (f"**Lesson {index}: Integration**\n\n"
+            "Integration differentiation ka ulta hai. Agar f'(x) = 2x hai to f(x) = x^2 + C.\n"
+            "Yahan C constant of integration hai & 100% zaroori hai.\n\n"
+            "समाकलन का मतलब है क्षेत्रफल निकालना। "
+            "Practice: x^3, sin(x), e^x ka integral nikalo.\n\n") * 4
+
+
+async def _render_all(renderer: LatexRenderer, docs: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(renderer.render(_sample_notes(i), f"Notes {i}") for i in range(docs)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LaTeX render service")
+    parser.add_argument("--docs", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    renderer = LatexRenderer(workers=args.workers)
+    source = time_call(lambda: renderer.build_source(_sample_notes(0), "Notes"), repeat=5, number=200)
+    print(f"Template fill + escaping   {format_rate(source['median'])}")
+
+    if not renderer.available():
+        print("latexmk/xelatex not installed - skipping render throughput")
+        return
+
+    cold = asyncio.run(_render_all(renderer, args.docs))
+    warm = asyncio.run(_render_all(renderer, args.docs))
+    print(f"Cold renders ({args.workers} workers) {format_rate(cold, args.docs)}")
+    print(f"Cache hits                 {format_rate(warm, args.docs)}")
+    print(f"Stats: {renderer.stats}")
+
+
+if __name__ == "__main__":
+    main()
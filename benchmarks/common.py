@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# benchmarks/common.py
+# Developer: Ahmad Raza
+# Shared timing helpers for the Ostaad AI benchmark scripts
+
+import time
+from typing import Callable, Dict
+
+
+def time_call(func: Callable, repeat: int = 5, number: int = 1) -> Dict[str, float]:
+    """Time `number` calls of func, `repeat` times, and report per-call seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+
+    timings.sort()
+    return {
+        "best": timings[0],
+        "median": timings[len(timings) // 2],
+        "worst": timings[-1],
+    }
+
+
+def format_rate(seconds: float, items: int = 1) -> str:
+    """Format a per-call timing as microseconds and items per second"""
+    per_item = seconds / items if items else 0.0
+    rate = (1.0 / per_item) if per_item else float("inf")
+    return f"{per_item * 1e6:9.1f} us/item  {rate:12,.0f} items/s"
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# circuit_breaker.py
+# Developer: Ahmad Raza
+# Circuit breaker for upstream calls: fail fast while an upstream keeps failing, probe it again later
+
+import logging
+import time
+from typing import Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures; after `reset_timeout` seconds one probe
+    call is let through (half-open) and its result closes or re-opens the circuit."""
+
+    def __init__(self, name: str, failure_threshold: int = Config.GROQ_BREAKER_FAILURES,
+                 reset_timeout: float = Config.GROQ_BREAKER_RESET):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = CLOSED
+        self._probing = False
+        self._probe_started = 0.0
+        self.stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now"""
+        state = self.state
+        if state == CLOSED:
+            self.stats["calls"] += 1
+            return True
+        # A probe that never reported back (cancelled, failed before the call) stops blocking after reset_timeout
+        if state == HALF_OPEN and (not self._probing or time.monotonic() - self._probe_started >= self.reset_timeout):
+            self._probing = True
+            self._probe_started = time.monotonic()
+            self.stats["calls"] += 1
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def record_success(self):
+        if self._state != CLOSED:
+            logger.info(f"Circuit '{self.name}' closed again")
+        self.failures = 0
+        self._state = CLOSED
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.stats["failures"] += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self._state != OPEN or self._probing:
+                self.stats["opened"] += 1
+                logger.warning(f"Circuit '{self.name}' opened after {self.failures} failure(s)")
+            self._state = OPEN
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+    def retry_after(self) -> Optional[float]:
+        """Seconds until the next probe is allowed, None when closed"""
+        if self._state == CLOSED:
+            return None
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
@@ -16,6 +16,10 @@ class Config:
     BOT_USERNAME = os.getenv('BOT_USERNAME', 'OstaadAIBot')
     ADMIN_USER_ID = int(os.getenv('ADMIN_USER_ID', '0'))
     
+    # Upstream endpoints - point these at the loadtest/ fakes for offline load tests
+    TELEGRAM_API_BASE_URL = os.getenv('TELEGRAM_API_BASE_URL', 'https://api.telegram.org/bot')
+    GROQ_BASE_URL = os.getenv('GROQ_BASE_URL')  # None = the Groq SDK default
+    
     # ==============================================
     # 🤖 Enhanced AI Model Configuration
     # ==============================================
@@ -27,6 +31,69 @@ class Config:
     FREQUENCY_PENALTY = 0.1               # Reduce repetition
     PRESENCE_PENALTY = 0.1                # Encourage topic diversity
     
+    # Generation budgets per query type (see generation_profiles.py). Without "model" a profile uses
+    # DEFAULT_MODEL (FALLBACK_MODEL if "light"), without "temperature" TEMPERATURE - read at call time
+    GENERATION_PROFILES = {
+        "quick": {"max_tokens": 350, "temperature": 0.9, "light": True},   # Jokes, small talk
+        "chat": {"max_tokens": 700},                                        # Advice, conversation
+        "explain": {"max_tokens": 1100, "temperature": 0.6},                # Step-by-step answers
+        "strategy": {"max_tokens": 1100, "temperature": 0.5},               # Exam/career plans
+    }
+    DEFAULT_GENERATION_PROFILE = "chat"
+    CATEGORY_PROFILES = {
+        "jokes_fun": "quick", "entertainment": "quick",
+        "love_relationships": "chat", "motivation": "chat", "religion_culture": "chat",
+        "general_knowledge": "chat",
+        "padhai_education": "explain", "programming_tech": "explain", "language_learning": "explain",
+        "health_fitness": "explain", "online_earning": "explain", "career_job": "strategy",
+    }
+    DOMAIN_PROFILES = {
+        "competitive_exams": "strategy", "academic_stem": "explain", "technology": "explain",
+    }
+    LENGTH_PREFERENCE_SCALE = {"short": 0.5, "normal": 1.0, "detailed": 1.5}   # User /length setting
+    WORDS_PER_TOKEN = 0.6                  # Rough words per output token for the length hint
+    FAST_PATH_INTENTS = ["greeting", "thanks", "ok", "emoji", "identity"]   # Answered without the LLM
+    
+    # Writing tools (/humanize, /seo, /improve) - any OpenAI-style chat-completions endpoint
+    AI_TOOLS_API_URL = os.getenv('AI_TOOLS_API_URL', 'https://api.groq.com/openai/v1/chat/completions')
+    AI_TOOLS_API_KEY = os.getenv('AI_TOOLS_API_KEY') or GROQ_API_KEY
+    AI_TOOLS_MODEL = os.getenv('AI_TOOLS_MODEL', FALLBACK_MODEL)
+    AI_TOOLS_TIMEOUT = 30                  # Seconds per request
+    AI_TOOLS_MAX_CONCURRENT = 8            # Tool requests in flight at once (also the pool size)
+    
+    # Grammar check (/grammar) - TextBlob correction in a process pool
+    GRAMMAR_WORKERS = 2                    # Correction processes
+    GRAMMAR_CACHE_SIZE = 5000              # Corrected sentences remembered
+    GRAMMAR_MAX_CHARS = 6000               # Longer texts are refused
+    GRAMMAR_TIMEOUT = 60                   # Seconds for one whole check
+    GRAMMAR_MAX_CONCURRENT = 4             # Checks running at once (one per user); more get "busy"
+    
+    # Token accounting (usage_tracker.py) - daily per-user quota, 0 = unlimited; admins are exempt.
+    # Off by default: prompt tokens include the system prompt and history, so size it from /cost data
+    DAILY_TOKEN_QUOTA = int(os.getenv('DAILY_TOKEN_QUOTA', '0'))
+    USAGE_RETENTION_DAYS = 30              # Days of totals kept for /cost
+    USAGE_SAVE_INTERVAL = 60               # Seconds between writes of temp/usage.json
+    TOKEN_PRICES = {                       # USD per million (input, output) tokens, for /cost estimates
+        "llama3-70b-8192": (0.59, 0.79),
+        "llama3-8b-8192": (0.05, 0.08),
+    }
+    
+    # Groq circuit breaker - fail fast while the API keeps erroring
+    GROQ_BREAKER_FAILURES = 5              # Consecutive failures that open the circuit
+    GROQ_BREAKER_RESET = 30                # Seconds before one probe call is let through
+    
+    # Long-form jobs (full notes, /longform, /seo) - written section by section in the background
+    LONGFORM_WORKERS = 3                   # Threads for long-form model calls (separate from chat replies)
+    LONGFORM_MAX_JOBS = 4                  # Jobs running at once across all users (one per user)
+    LONGFORM_SECTION_CONCURRENCY = 2       # Sections of one job written in parallel
+    LONGFORM_MAX_SECTIONS = 6
+    LONGFORM_SECTION_TOKENS = 900          # Budget per section
+    LONGFORM_PROFILE = "explain"           # Generation profile for outlines and sections (model, sampling)
+    LONGFORM_TRIGGERS = [                  # Asked for in a chat message, these start a notes job
+        "full notes", "complete notes", "detailed notes", "poore notes", "pure notes", "pura notes",
+        "complete guide", "full guide", "long article", "full article", "essay likho", "article likho",
+    ]
+    
     # ==============================================
     # ⚙️ Enhanced Bot Technical Settings
     # ==============================================
@@ -82,6 +149,26 @@ class Config:
     LOGS_DIR = "logs"
     TEMP_DIR = "temp"
     USER_DATA_DIR = "user_data"
+    DATA_DIR = "data"                      # Shipped model tables and corpora
+
+    # PDF export (/export) - rendered off the event loop in a process pool
+    EXPORT_WORKERS = 2                     # Render processes
+    EXPORT_MAX_CONCURRENT = 4              # Exports rendering or queued at once; more get "busy"
+    EXPORT_MAX_MESSAGES = 200              # Newest conversation messages included
+    # First existing TTF wins (needs Devanagari glyphs). ReportLab does no Indic shaping, so
+    # conjuncts and matras in Devanagari and other Indic scripts come out unjoined or misplaced.
+    EXPORT_FONT_PATHS = [
+        "/usr/share/fonts/truetype/freefont/FreeSerif.ttf",
+        "/usr/share/fonts/truetype/noto/NotoSansDevanagari-Regular.ttf",
+        "/usr/share/fonts/truetype/lohit-devanagari/Lohit-Devanagari.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ]
+
+    # Typeset notes (padhai_education "PDF Notes" button) - sandboxed latexmk jobs
+    LATEX_ENGINE = "xelatex"               # latexmk -xelatex; needed for Devanagari fonts
+    LATEX_WORKERS = 2                      # LaTeX jobs running at once
+    LATEX_TIMEOUT = 30                     # Seconds before a job's process group is killed
+    LATEX_CACHE_SIZE = 64                  # Rendered PDFs kept by content hash
     
     # ==============================================
     # 🎨 Enhanced Branding & UI Configuration
@@ -135,6 +222,12 @@ class Config:
     # 🌐 Enhanced Language & Localization
     # ==============================================
     DEFAULT_LANGUAGE = "hi"
+    LANGUAGE_SWITCH_THRESHOLD = 0.5        # Script histogram distance that triggers re-detection
+    LANGUAGE_CONFIDENCE_FLOOR = 0.75       # Detections below this never switch a user's language
+    LANGUAGE_RECONFIRM_SECONDS = 900       # Re-confirm a detected language at most this often
+    CLASSIFIER_FALLBACK = False            # Ask the trained classifier when keywords miss; off until it beats them on real data
+    CLASSIFIER_MIN_SUPPORT = 30            # Calibration fallback samples needed before a confidence threshold is trusted
+    CLASSIFIER_MIN_CONFIDENCE = 0.5        # Floor under any calibrated threshold
     SUPPORTED_LANGUAGES = [
         "en", "hi", "ur", "ar", "bn", "mr", 
         "te", "ta", "gu", "kn", "or", "pa",
@@ -144,11 +237,15 @@ class Config:
     # ==============================================
     # 🔒 Enhanced Security & Rate Limiting
     # ==============================================
-    RATE_LIMIT = 60                        # Messages per minute
+    RATE_LIMIT = 60                        # Messages, buttons and tool commands per minute
     BAN_DURATION = 3600                    # 1 hour in seconds
+    RATE_BURST = 10                        # Messages allowed back to back before the per-minute pace applies
+    RATE_STRIKES_BEFORE_BAN = 20           # Rejected messages within RATE_STRIKE_WINDOW that earn a ban
+    RATE_STRIKE_WINDOW = 120               # Seconds
+    RATE_MAX_BAN = 86400                   # Repeat bans double up to this many seconds
     ADMIN_COMMANDS = [
         "broadcast", "stats", "maintenance", 
-        "banuser", "analytics", "user_management"
+        "banuser", "unbanuser", "bans", "config", "analytics", "user_management"
     ]
     
     # ==============================================
@@ -156,6 +253,21 @@ class Config:
     # ==============================================
     ENABLE_ANALYTICS = True
     PERFORMANCE_MONITORING = True
+    STARTUP_BUDGET_MS = 1500               # Launch-to-ready budget for startup_profiler
+    UPSTREAM_KEEPALIVE_SECONDS = 240       # Ping Groq / Bot API so pooled connections stay warm
+    MEMORY_TOP_SITES = 15                  # Allocation sites listed by /memory diff and /memory top
+    MEMORY_TRACE_FRAMES = 1                # Stack frames tracemalloc keeps per allocation
+    LOOP_WATCHDOG_INTERVAL = 0.05          # Seconds between event-loop heartbeats
+    LOOP_LAG_THRESHOLD_MS = 100            # Heartbeat this late = stall; the blocking stack is sampled
+    LOOP_WATCHDOG_TOP = 10                 # Call sites listed by /lag
+    HEALTH_HOST = os.getenv('HEALTH_HOST', '0.0.0.0')
+    HEALTH_PORT = int(os.getenv('HEALTH_PORT', '8080'))  # /healthz and /readyz; 0 disables
+    HEALTH_MAX_HEARTBEAT_AGE = 5           # Seconds without a loop-watchdog heartbeat before /healthz fails
+    HEALTH_STALE_UPDATE_SECONDS = 120      # /readyz fails if updates are queued and none finished for this long
+    PERF_SLOW_UPDATE_MS = 8000             # Updates slower than this are logged with their stage breakdown
+    RUNTIME_CONFIG_FILE = os.getenv('RUNTIME_CONFIG_FILE', 'runtime_config.json')  # Overrides for runtime_config.TUNABLES
+    RUNTIME_CONFIG_POLL = 5                # Seconds between checks of the runtime config file
+    RUNTIME_CONFIG_HISTORY = 50            # Changes kept for /config history
     USER_MOOD_TRACKING = True              # Track user emotional states
     CONVERSATION_ANALYTICS = True          # Analyze conversation patterns
     
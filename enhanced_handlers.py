@@ -5,11 +5,24 @@
 
 import logging
 import os
-import random
+from typing import Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
+import ai_integration
 from ai_service import OstaadAIService
+from generation_profiles import LENGTH_PREFERENCES
+from grammar_service import GrammarBusyError, GrammarInputTooLong, get_grammar_service
+from intent_fast_path import IntentFastPath
 from language_detector import LanguageDetector
+from language_tracker import UserLanguageTracker
+from longform_jobs import LongformBusyError, LongformJobs, is_longform_request
+from latex_renderer import get_renderer
+from message_analyzer import get_analyzer
+from message_catalog import get_catalog
+from pdf_export import ExportBusyError, get_exporter
+from perf_tracing import span
+from rate_limiter import ALLOWED, DROPPED, THROTTLED, get_rate_limiter
 from user_preferences import UserPreferences
 from utils import Utils
 from config import Config
@@ -21,7 +34,14 @@ class EnhancedOstaadHandlers:
         self.ai_service = OstaadAIService()
         self.language_detector = LanguageDetector()
         self.user_preferences = UserPreferences()
+        self.language_tracker = UserLanguageTracker(self.language_detector, self.user_preferences)
         self.utils = Utils()
+        self.catalog = get_catalog()
+        self.analyzer = get_analyzer()
+        self.fast_path = IntentFastPath()
+        self.latex_renderer = get_renderer()
+        self.longform = LongformJobs(self.ai_service)
+        self.rate_limiter = get_rate_limiter()
         self.broadcast_messages = {}
         self.user_sessions = {}
         
@@ -40,12 +60,10 @@ class EnhancedOstaadHandlers:
                 'mood_history': []
             }
             
-            # Get user's preferred language
-            preferred_lang = self.user_preferences.get_user_language(user_info['id'])
-            if not preferred_lang:
-                preferred_lang = self.language_detector.detect_language(
-                    update.message.text or user_info.get('language_code', 'hi')
-                )
+            # Get user's preferred language (the "/start" text itself says nothing about it)
+            preferred_lang = self.language_tracker.current_language(
+                user_info['id'], user_info.get('language_code')
+            )
             
             # Simulate typing
             await self.utils.simulate_typing(update.effective_chat.id, context, duration=2)
@@ -104,29 +122,52 @@ class EnhancedOstaadHandlers:
             
         except Exception as e:
             logger.error(f"Error in enhanced start_command: {e}")
-            await update.message.reply_text("Arre yaar, kuch gadbad ho gayi! Phir se try karo")
+            await update.message.reply_text(self.catalog.render('start_error'))
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Enhanced message handler with desi expertise"""
+        preferred_lang = Config.DEFAULT_LANGUAGE
         try:
             user_info = self.utils.get_user_info(update)
             user_message = update.message.text
             
+            # Spam is turned away before any detection, analysis or model call
+            if await self._rate_limited(update, user_info):
+                return
+            
             logger.info(f"Processing desi query from user {user_info['id']}: '{user_message[:100]}...'")
             
             # Update user session
             if user_info['id'] in self.user_sessions:
                 self.user_sessions[user_info['id']]['query_count'] += 1
             
-            # Get user's preferred language
-            preferred_lang = self.user_preferences.get_user_language(user_info['id'])
-            if not preferred_lang:
-                detected_lang = self.language_detector.detect_language(user_message)
-                self.user_preferences.set_user_language(user_info['id'], detected_lang)
-                preferred_lang = detected_lang
+            # Get user's language - sticky, re-detected only when their script changes
+            with span("language"):
+                preferred_lang = self.language_tracker.resolve(user_info['id'], user_message)
+            
+            # Classify query category (mood, identity and domain come from the same pass)
+            with span("analysis"):
+                analysis = self.analyzer.analyze(user_message, preferred_lang)
+            
+            # Greetings, thanks, "ok", emoji and identity questions skip typing and the LLM
+            with span("fast_path"):
+                fast_reply = self.fast_path.answer(user_message, preferred_lang, user_info['first_name'], analysis,
+                                                   awaiting_answer=self.ai_service.asked_question(user_info['id']))
+            if fast_reply:
+                intent, reply = fast_reply
+                with span("send"):
+                    await update.message.reply_text(reply, parse_mode='Markdown' if intent == "identity" else None)
+                self.utils.log_user_interaction(
+                    user_info['id'], user_info['username'], f"[intent:{intent}] {user_message}", len(reply)
+                )
+                return
+            
+            # "Full notes on ..." runs as a background job instead of one truncated reply
+            if is_longform_request(user_message):
+                await self._start_longform(update, user_message, user_info, preferred_lang, "notes")
+                return
             
-            # Classify query category
-            category = self._classify_query_category(user_message)
+            category = analysis['category']
             
             # Update user's explored categories
             if user_info['id'] in self.user_sessions:
@@ -136,7 +177,7 @@ class EnhancedOstaadHandlers:
             
             # Process enhanced AI response
             await self.handle_enhanced_ai_response(
-                update, context, user_message, user_info, preferred_lang, category
+                update, context, user_message, user_info, preferred_lang, category, analysis
             )
             
         except Exception as e:
@@ -145,25 +186,32 @@ class EnhancedOstaadHandlers:
 
     async def handle_enhanced_ai_response(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                                         user_message: str, user_info: dict, preferred_lang: str,
-                                        category: str):
+                                        category: str, analysis: Optional[dict] = None):
         """Enhanced AI response with desi expertise"""
         try:
+            # Over-quota users get their reply straight away, without the typing show
+            if self.ai_service.usage.over_quota(user_info['id']):
+                await update.message.reply_text(self.ai_service._get_quota_message(preferred_lang),
+                                                parse_mode='Markdown')
+                return
+            
             # Show category-specific typing indicator
             typing_duration = 4 if len(user_message) > 100 else 3
-            await self.utils.simulate_typing(update.effective_chat.id, context, duration=typing_duration)
+            with span("typing"):
+                await self.utils.simulate_typing(update.effective_chat.id, context, duration=typing_duration)
             
             # Get enhanced AI response from Ostaad AI
             ai_response = await self.ai_service.get_ai_response(
                 user_info['id'], 
                 user_message, 
-                preferred_lang
+                preferred_lang,
+                analysis=analysis,
+                length_preference=self.user_preferences.get_user_preferences(user_info['id']).get('response_length')
             )
             
-            # Format response with enhanced desi style
-            formatted_response = self._format_desi_response(ai_response, category, preferred_lang)
-            
-            # Split long messages intelligently
-            message_chunks = self.utils.split_long_message(formatted_response)
+            # Split long messages intelligently (the reply comes back already formatted)
+            with span("chunking"):
+                message_chunks = self.utils.split_long_message(ai_response)
             
             # Create enhanced keyboard with category-specific options
             keyboard = self._create_clean_keyboard(category, user_info['id'], preferred_lang)
@@ -172,16 +220,18 @@ class EnhancedOstaadHandlers:
             # Send response(s) with enhanced formatting
             for i, chunk in enumerate(message_chunks):
                 if i > 0:
-                    await self.utils.simulate_typing(update.effective_chat.id, context, duration=1)
+                    with span("typing"):
+                        await self.utils.simulate_typing(update.effective_chat.id, context, duration=1)
                 
                 # Add enhanced menu buttons only to the last chunk
                 current_markup = reply_markup if i == len(message_chunks) - 1 else None
                 
-                await update.message.reply_text(
-                    chunk,
-                    reply_markup=current_markup,
-                    parse_mode='Markdown'
-                )
+                with span("send"):
+                    await update.message.reply_text(
+                        chunk,
+                        reply_markup=current_markup,
+                        parse_mode='Markdown'
+                    )
             
             # Log enhanced interaction
             self.utils.log_user_interaction(
@@ -195,129 +245,37 @@ class EnhancedOstaadHandlers:
             logger.error(f"Enhanced AI response error: {e}")
             await self._send_desi_error_response(update, user_info, preferred_lang)
 
+    async def _rate_limited(self, update: Update, user_info: dict) -> bool:
+        """Charge one request to the user's rate limit; True (after any notice) when it is refused"""
+        decision = self.rate_limiter.check(user_info['id'])
+        if decision == ALLOWED:
+            return False
+        notice = self._rate_limit_notice(decision, user_info)
+        if notice:
+            await update.message.reply_text(notice)
+        return True
+
+    def _rate_limit_notice(self, decision: str, user_info: dict) -> Optional[str]:
+        """Message for the first throttled request or a new ban; None when it should be dropped silently"""
+        if decision == DROPPED:
+            return None
+        language = self.language_tracker.current_language(user_info['id'], user_info.get('language_code'))
+        wait = self.rate_limiter.retry_after(user_info['id'])
+        if decision == THROTTLED:
+            return self.catalog.render('rate_limited', language, seconds=max(1, round(wait)))
+        return self.catalog.render('rate_banned', language, minutes=max(1, round(wait / 60)))
+
     def _get_desi_welcome_message(self, language: str, first_name: str) -> str:
         """Get enhanced welcome message with pure desi style"""
-        name = first_name or "bhai"
-        
-        messages = {
-            'hi': f"""**Namaste {name}! Ustad AI {Config.VERSION} mein aapka swagat hai!**
-
-**Main tumhara Digital Ustad hoon!**
-
-Are bhai Main har sawal ka jawab de sakta hoon!
-
-**Meri expertise:**
-**Padhai Master**: School se PhD tak - sab subjects covered!
-**Career Guru**: Job, interview, resume - sab guidance ready!
-**Tech Expert**: Programming, AI, bots - technical sab kuch!
-**Earning Guide**: Online paise kamane ke sab tareeke!
-**Love Advisor**: Relationships, dosti - dil ki baat samjhta hoon!
-**Language Teacher**: English, Hindi - fluency improve karo!
-**Entertainment**: Movies, memes, jokes - timepass bhi hai!
-**Motivator**: Life coach, success mindset - confidence boost!
-
-**Bilkul human jaisa conversation - emotions, jokes, sab samjhta hoon!**
-
-**Kuch bhi poocho - main tumhara digital dost hoon!**
-Padhai se lekar life advice tak, har field mein expert!
-
-{Config.POWERED_BY} | Developer: {Config.DEVELOPER}""",
-            
-            'default': f"""**Hello {name}! Welcome to Ostaad AI {Config.VERSION}!**
-
-**I'm your Digital Ustad!**
-
-Hey bhai I can answer any question!
-
-**My expertise:**
-**Study Master**: From school to PhD - all subjects covered!
-**Career Guru**: Jobs, interviews, resume - complete guidance!
-**Tech Expert**: Programming, AI, bots - all technical stuff!
-**Earning Guide**: All ways to earn money online!
-**Love Advisor**: Relationships, friendship - understand emotions!
-**Language Teacher**: English, Hindi - improve fluency!
-**Entertainment**: Movies, memes, jokes - fun time too!
-**Motivator**: Life coach, success mindset - confidence boost!
-
-**Completely human-like conversation - emotions, jokes, everything!**
-
-**Ask anything - I'm your digital friend!**
-From studies to life advice, expert in every field!
-
-{Config.POWERED_BY} | Developer: {Config.DEVELOPER}"""
-        }
-        return messages.get(language, messages['default'])
+        return self.catalog.render('main_menu', language, name=first_name or "bhai")
 
     def _classify_query_category(self, message: str) -> str:
         """Classify user query into categories"""
-        message_lower = message.lower()
-        
-        category_keywords = {
-            "padhai_education": ["study", "exam", "school", "college", "padhai", "homework", "assignment", 
-                               "upsc", "jee", "neet", "mathematics", "physics", "chemistry"],
-            "career_job": ["job", "career", "interview", "resume", "cv", "naukri", "salary", "promotion"],
-            "programming_tech": ["code", "programming", "python", "javascript", "website", "app", "bot", 
-                               "algorithm", "software", "tech", "computer"],
-            "online_earning": ["earn", "money", "income", "freelance", "business", "startup", "investment", 
-                             "crypto", "trading", "paise"],
-            "love_relationships": ["love", "girlfriend", "boyfriend", "relationship", "breakup", "marriage", 
-                                 "dating", "crush", "propose"],
-            "language_learning": ["english", "hindi", "grammar", "speaking", "writing", "translation", 
-                                "language", "vocabulary"],
-            "entertainment": ["movie", "song", "meme", "joke", "funny", "entertainment", "timepass", 
-                            "bollywood", "music"],
-            "motivation": ["motivation", "confidence", "success", "goal", "depression", "stress", 
-                         "inspiration", "life"],
-            "health_fitness": ["health", "fitness", "exercise", "diet", "weight", "gym", "yoga", "medicine"],
-            "general_knowledge": ["news", "current", "gk", "general", "world", "india", "politics", "history"],
-            "religion_culture": ["religion", "god", "festival", "culture", "tradition", "spiritual", 
-                               "hindu", "muslim", "christian"],
-            "jokes_fun": ["joke", "funny", "meme", "roast", "comedy", "laugh", "fun", "riddle", "puzzle"]
-        }
-        
-        # Count matches for each category
-        category_scores = {}
-        for category, keywords in category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in message_lower)
-            if score > 0:
-                category_scores[category] = score
-        
-        # Return category with highest score, or general if no matches
-        if category_scores:
-            return max(category_scores, key=category_scores.get)
-        else:
-            return "general_knowledge"
+        return self.analyzer.analyze(message)['category']
 
     def _format_desi_response(self, response: str, category: str, language: str) -> str:
         """Format response with enhanced desi style and emojis"""
-        
-        # Add category-specific emoji if not already present
-        category_emojis = Config.CATEGORY_EMOJIS.get(category, ["💬"])
-        if not any(emoji in response[:10] for emoji in category_emojis):
-            response = f"{category_emojis[0]} {response}"
-        
-        # Add category-specific tips and context
-        category_tips = {
-            "padhai_education": "\n\n**Padhai Tip**: Regular practice aur revision karte raho bhai!",
-            "career_job": "\n\n**Career Advice**: Confidence rakho aur preparation solid karo!",
-            "programming_tech": "\n\n**Tech Tip**: Daily coding practice karo - consistency is key!",
-            "online_earning": "\n\n**Earning Tip**: Patience rakho aur skills develop karte raho!",
-            "love_relationships": "\n\n**Love Advice**: Dil ki suno lekin dimag bhi use karo!",
-            "language_learning": "\n\n**Language Tip**: Daily practice aur confidence building important hai!",
-            "entertainment": "\n\n**Fun Fact**: Entertainment bhi learning ka part hai!",
-            "motivation": "\n\n**Motivation**: Har din ek step aage badhte raho!",
-            "health_fitness": "\n\n**Health Tip**: Consistency aur balance maintain karo!",
-            "religion_culture": "\n\n**Cultural Wisdom**: Traditions mein bahut gyaan chupa hai!"
-        }
-        
-        if category in category_tips:
-            response += category_tips[category]
-        
-        # Add signature for longer responses
-        if len(response) > 300:
-            response += f"\n\n**Ostaad AI** | Hamesha tumhare saath!"
-        
-        return response
+        return self.ai_service.postprocessor.process(response, category=category)
 
     def _create_clean_keyboard(self, category: str, user_id: int, language: str) -> list:
         """Create clean keyboard without emojis - glass-type buttons"""
@@ -365,19 +323,30 @@ From studies to life advice, expert in every field!
         if category in category_actions:
             keyboard.insert(0, category_actions[category])
         
+        # Typeset notes of the answer for study questions (only where LaTeX is installed)
+        if category == "padhai_education" and self.latex_renderer.available():
+            keyboard.insert(1, [InlineKeyboardButton("PDF Notes", callback_data="latex_notes")])
+        
         return keyboard
 
     async def button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Enhanced button callback handler with desi actions"""
         try:
             query = update.callback_query
+            user_info = self.utils.get_user_info(update)
+            
+            decision = self.rate_limiter.check(user_info['id'])
+            if decision != ALLOWED:
+                await query.answer(self._rate_limit_notice(decision, user_info))
+                return
             await query.answer()
             
-            user_info = self.utils.get_user_info(update)
             callback_data = query.data
             
             # Get user's preferred language
-            preferred_lang = self.user_preferences.get_user_language(user_info['id']) or 'hi'
+            preferred_lang = self.language_tracker.current_language(
+                user_info['id'], user_info.get('language_code')
+            )
             
             # Handle category-specific callbacks
             if callback_data.startswith("category_"):
@@ -395,6 +364,15 @@ From studies to life advice, expert in every field!
             elif callback_data == "broadcast":
                 await self._handle_broadcast_menu(query, user_info, preferred_lang)
             
+            elif callback_data.startswith("set_lang_"):
+                await self._handle_language_choice(query, callback_data, user_info)
+            
+            elif callback_data == "latex_notes":
+                await self._send_latex_notes(query, user_info)
+            
+            elif callback_data == "longform_cancel":
+                self.longform.cancel(user_info['id'])
+            
             elif callback_data in ["more_examples", "practice_questions", "interview_tips", "resume_help",
                                  "code_examples", "tech_resources", "earning_ideas", "business_tips",
                                  "love_tips", "relationship_advice", "more_fun", "jokes",
@@ -407,68 +385,16 @@ From studies to life advice, expert in every field!
                 
         except Exception as e:
             logger.error(f"Error in enhanced button_callback: {e}")
-            await query.edit_message_text("Arre yaar, kuch gadbad ho gayi!")
+            await query.edit_message_text(self.catalog.render('callback_error'))
 
     async def _handle_category_selection(self, query, callback_data: str, user_info: dict, language: str):
         """Handle category selection callbacks with desi style"""
         category = callback_data.replace("category_", "")
+        key = f"category_{category}"
+        if not self.catalog.has(key, 'hi'):
+            key = "category_education"
         
-        category_info = {
-            "education": {
-                "title": "Padhai & Education Zone",
-                "description": "School, college, competitive exams, homework - sab help milegi!",
-                "examples": ["Math problems solve karo", "UPSC strategy batao", "Physics concepts explain karo"]
-            },
-            "career": {
-                "title": "Career & Job Guidance",
-                "description": "Job search, interview prep, resume writing, career planning",
-                "examples": ["Interview tips do", "Resume improve karo", "Career change advice do"]
-            },
-            "tech": {
-                "title": "Technology & Programming Hub",
-                "description": "Coding, web development, AI/ML, tech troubleshooting",
-                "examples": ["Python code sikhao", "Website banane ka tareeka", "Bot development guide"]
-            },
-            "earning": {
-                "title": "Online Earning & Business",
-                "description": "Freelancing, business ideas, investment, money making tips",
-                "examples": ["Online paise kaise kamaye", "Business plan banao", "Investment advice do"]
-            },
-            "love": {
-                "title": "Love & Relationships",
-                "description": "Dating advice, relationship problems, love guidance",
-                "examples": ["Propose kaise kare", "Breakup se kaise deal kare", "Relationship tips do"]
-            },
-            "language": {
-                "title": "Language Learning Center",
-                "description": "English speaking, Hindi grammar, translation help",
-                "examples": ["English fluency improve karo", "Grammar mistakes correct karo", "Translation help karo"]
-            },
-            "fun": {
-                "title": "Entertainment & Fun Zone",
-                "description": "Movies, music, memes, jokes, timepass content",
-                "examples": ["Funny jokes sunao", "Movie recommend karo", "Memes banao"]
-            },
-            "motivation": {
-                "title": "Motivation & Life Coaching",
-                "description": "Success mindset, goal setting, confidence building",
-                "examples": ["Motivation boost karo", "Goals set karne help karo", "Confidence badhao"]
-            }
-        }
-        
-        info = category_info.get(category, category_info["education"])
-        
-        message = f"""**{info['title']}**
-
-**Main kya help kar sakta hoon:**
-{info['description']}
-
-**Example questions:**
-* {info['examples'][0]}
-* {info['examples'][1]}
-* {info['examples'][2]}
-
-**Bas apna sawal type karo aur main expert guidance dunga!**"""
+        message = self.catalog.render(key, language)
         
         keyboard = [
             [InlineKeyboardButton("Ask Question", callback_data="new_question")],
@@ -484,16 +410,10 @@ From studies to life advice, expert in every field!
     async def _handle_admin_panel(self, query, user_info: dict, language: str):
         """Handle admin panel - only for admin users"""
         if not self.utils.is_admin(user_info['id']):
-            await query.edit_message_text("Admin access required bhai!")
+            await query.edit_message_text(self.catalog.render('admin_required', language))
             return
         
-        admin_message = f"""**Admin Panel - Ostaad AI**
-
-**System Status**: Online & Active
-**Bot Version**: {Config.VERSION}
-**AI Model**: {Config.DEFAULT_MODEL}
-
-**Available Admin Functions:**"""
+        admin_message = self.catalog.render('admin_panel', language)
         
         keyboard = [
             [
@@ -516,20 +436,10 @@ From studies to life advice, expert in every field!
     async def _handle_broadcast_menu(self, query, user_info: dict, language: str):
         """Handle broadcast menu - only for admin"""
         if not self.utils.is_admin(user_info['id']):
-            await query.edit_message_text("Admin access required!")
+            await query.edit_message_text(self.catalog.render('admin_required', language))
             return
         
-        broadcast_message = """**Broadcast Message System**
-
-**Instructions:**
-1. Use `/broadcast <your_message>` command to send message to all users
-2. Message will be sent to all active users
-3. Use responsibly - avoid spam
-
-**Example:**
-`/broadcast Ostaad AI has new features! Check them out!`
-
-**Note**: This feature is under development"""
+        broadcast_message = self.catalog.render('broadcast_menu', language)
         
         keyboard = [
             [InlineKeyboardButton("Back to Admin Panel", callback_data="admin_panel")],
@@ -548,25 +458,16 @@ From studies to life advice, expert in every field!
         session = self.user_sessions.get(user_id, {})
         ai_stats = self.ai_service.get_user_stats(user_id)
         
-        stats_message = f"""**Tumhara Ostaad AI Journey**
-
-**User**: {user_info['first_name']} (@{user_info['username']})
-
-**Session Stats:**
-* Sawal Pooche: {session.get('query_count', 0)}
-* Categories Explore Kiye: {len(session.get('categories_explored', set()))}
-* Current Mood: {ai_stats.get('current_mood', 'Neutral').title()}
-
-**Explore Kiye Categories:**
-{', '.join(session.get('categories_explored', {'General'})) or 'Abhi koi nahi'}
-
-**Total Conversations**: {ai_stats.get('conversation_count', 0)}
-
-**Tumhara Learning Journey**: Different categories explore karte raho aur expert bano!
-
-**Ostaad AI Tip**: Curiosity rakho aur har din kuch naya seekho!
-
-{Config.POWERED_BY}"""
+        stats_message = self.catalog.render(
+            'user_journey', language,
+            first_name=user_info['first_name'],
+            username=user_info['username'],
+            query_count=session.get('query_count', 0),
+            categories_count=len(session.get('categories_explored', set())),
+            mood=ai_stats.get('current_mood', 'Neutral').title(),
+            categories=', '.join(session.get('categories_explored', {'General'})) or 'Abhi koi nahi',
+            conversation_count=ai_stats.get('conversation_count', 0)
+        )
         
         keyboard = [
             [InlineKeyboardButton("Reset Stats", callback_data="reset_stats")],
@@ -581,21 +482,7 @@ From studies to life advice, expert in every field!
 
     async def _handle_new_question(self, query, user_info: dict, language: str):
         """Handle new question selection with desi style"""
-        message = f"""**Naya Sawal Poochne Ke Liye Ready!**
-
-**Main har category mein expert hoon:**
-* Padhai & Competitive Exams
-* Career & Job Guidance  
-* Technology & Programming
-* Online Earning & Business
-* Love & Relationships
-* Language Learning
-* Entertainment & Fun
-* Motivation & Life Coaching
-
-**Bas apna sawal type karo aur main expert guidance dunga!**
-
-Tension mat lo - Main tumhara digital ustad hoon!"""
+        message = self.catalog.render('new_question', language)
         
         keyboard = [
             [InlineKeyboardButton("Back to Main Menu", callback_data="main_menu")]
@@ -607,27 +494,35 @@ Tension mat lo - Main tumhara digital ustad hoon!"""
             parse_mode='Markdown'
         )
 
+    async def _send_latex_notes(self, query, user_info: dict):
+        """Typeset the last answer as PDF notes and send it under the answer"""
+        history = self.ai_service.conversation_history.get(user_info['id'], [])
+        answers = [i for i, message in enumerate(history) if message['role'] == 'assistant']
+        if not answers:
+            await query.message.reply_text(self.catalog.render('notes_empty'))
+            return
+        
+        answer = history[answers[-1]]['content']
+        question = history[answers[-1] - 1]['content'] if answers[-1] > 0 else "Ostaad AI Notes"
+        try:
+            await query.message.chat.send_action('upload_document')
+            pdf = await self.latex_renderer.render(answer, title=question[:120])
+            await query.message.reply_document(
+                document=pdf,
+                filename="ostaad_notes.pdf",
+                caption=self.catalog.render('notes_caption')
+            )
+        except Exception as e:
+            logger.error(f"LaTeX notes failed for user {user_info['id']}: {e}")
+            await query.message.reply_text(self.catalog.render('notes_failed'))
+
     async def _handle_quick_actions(self, query, action: str, user_info: dict, language: str):
         """Handle quick action buttons with desi responses"""
         
-        action_responses = {
-            "more_examples": "Bilkul bhai! More detailed examples chahiye? Bas specific topic batao!",
-            "practice_questions": "Practice time! Koi bhi subject ka practice questions chahiye? Batao!",
-            "interview_tips": "Interview tips ready hain! Kaunsa type ka interview hai? Technical ya HR?",
-            "resume_help": "Resume improve karna hai? Current resume share karo ya format chahiye?",
-            "code_examples": "Code examples ready! Kaunsi language aur kya problem solve karni hai?",
-            "tech_resources": "Best tech resources batata hoon! Kaunsa technology seekhna hai?",
-            "earning_ideas": "Paisa kamane ke ideas! Skills kya hain aur kitna time de sakte ho?",
-            "business_tips": "Business tips ready! Startup idea hai ya existing business improve karna hai?",
-            "love_tips": "Love advice ready! Kya situation hai? Propose karna hai ya relationship improve?",
-            "relationship_advice": "Relationship guidance! Problem kya hai? Communication ya trust issues?",
-            "more_fun": "More entertainment! Movies, music, ya jokes chahiye? Mood kya hai?",
-            "jokes": "Jokes ready hain! Kaunse type ke - funny, witty, ya roast style?",
-            "motivation_boost": "Motivation boost time! Kya problem hai? Confidence low hai ya goals unclear?",
-            "goal_setting": "Goal setting expert! Short-term ya long-term goals set karne hain?"
-        }
-        
-        response = action_responses.get(action, "Bas poocho bhai, main help karunga!")
+        key = f"quick_{action}"
+        if not self.catalog.has(key, 'hi'):
+            key = "quick_default"
+        response = self.catalog.render(key, language)
         
         keyboard = [
             [InlineKeyboardButton("Ask Now", callback_data="new_question")],
@@ -695,32 +590,7 @@ Tension mat lo - Main tumhara digital ustad hoon!"""
 
     async def _show_help_message(self, query, language: str):
         """Show help message with desi style"""
-        help_message = f"""**Ostaad AI Help Guide**
-
-**Kaise use kare:**
-* Koi bhi sawal type karo - main samjhaunga!
-* Categories select kar sakte ho quick help ke liye
-* Main Hinglish mein baat karta hoon - natural feel!
-
-**Available Commands:**
-/start - Welcome message aur main menu
-/help - Ye help guide
-/info - Ostaad AI ke baare mein details
-/reset - Conversation history clear karo
-
-**Best Tips:**
-1. Clear aur specific questions poocho
-2. Context do agar complex topic hai
-3. Feedback do - main improve karta rehta hoon!
-
-**Technical Details:**
-* AI Model: {Config.DEFAULT_MODEL}
-* Developer: {Config.DEVELOPER}
-* Version: {Config.VERSION}
-
-**Status**: Fully Active aur Ready!
-
-{Config.POWERED_BY}"""
+        help_message = self.catalog.render('help', language)
         
         keyboard = [
             [InlineKeyboardButton("Back to Main Menu", callback_data="main_menu")]
@@ -734,35 +604,7 @@ Tension mat lo - Main tumhara digital ustad hoon!"""
 
     async def _show_info_message(self, query, language: str):
         """Show info message with desi style"""
-        info_message = f"""**Ostaad AI System Information**
-
-**Core Architecture:**
-AI Model: {Config.DEFAULT_MODEL}
-Framework: Ostaad AI Engine
-Language: Python 3.11
-Security: Enterprise-Grade
-
-**Key Capabilities:**
-12+ Categories mein expertise
-Human-like conversation style
-Emotional intelligence
-Desi context understanding
-
-**System Details:**
-Developer: {Config.DEVELOPER}
-Specialization: Pure Desi AI Assistant
-Platform: Telegram Messenger
-Version: {Config.VERSION}
-Last Updated: December 2024
-
-**Getting Started:**
-1. /start se shuru karo
-2. Category select karo ya direct question poocho
-3. Enjoy human-like conversation!
-
-**System Status**: Fully Operational!
-
-{Config.POWERED_BY}"""
+        info_message = self.catalog.render('info', language)
         
         keyboard = [
             [InlineKeyboardButton("Back to Main Menu", callback_data="main_menu")]
@@ -774,25 +616,21 @@ Last Updated: December 2024
             parse_mode='Markdown'
         )
 
+    async def _handle_language_choice(self, query, callback_data: str, user_info: dict):
+        """Handle set_lang_* buttons - an explicit choice overrides detection"""
+        choice = callback_data.replace("set_lang_", "")
+        
+        if choice == "auto":
+            self.language_tracker.clear_explicit(user_info['id'])
+        elif choice in Config.SUPPORTED_LANGUAGES:
+            self.language_tracker.set_explicit(user_info['id'], choice)
+        
+        language = self.language_tracker.current_language(user_info['id'])
+        await self._show_language_settings(query, language)
+
     async def _show_language_settings(self, query, language: str):
         """Show language settings with desi style"""
-        lang_message = f"""**Language Settings**
-
-**Current Language**: {language.upper()}
-
-Choose your preferred language:
-
-**Indian Languages:**
-* Hindi (हिंदी) - Default
-* English - International
-* Urdu (اردو) - Supported
-* Bengali (বাংলা) - Supported
-
-**Note**: Main mainly Hinglish mein baat karta hoon - best of both worlds!
-
-Aur languages bhi support karta hoon basic level pe.
-
-{Config.POWERED_BY}"""
+        lang_message = self.catalog.render('language_settings', language, current_language=language.upper())
         
         keyboard = [
             [
@@ -803,6 +641,7 @@ Aur languages bhi support karta hoon basic level pe.
                 InlineKeyboardButton("Urdu", callback_data="set_lang_ur"),
                 InlineKeyboardButton("Bengali", callback_data="set_lang_bn")
             ],
+            [InlineKeyboardButton("Auto Detect", callback_data="set_lang_auto")],
             [InlineKeyboardButton("Back to Main Menu", callback_data="main_menu")]
         ]
         
@@ -814,22 +653,9 @@ Aur languages bhi support karta hoon basic level pe.
 
     async def _send_desi_error_response(self, update: Update, user_info: dict, language: str):
         """Send enhanced error response with desi style"""
-        error_messages = [
-            "Arre yaar, mujhe thoda technical problem ho raha hai!",
-            "Oops! Kuch gadbad ho gayi, phir se try karo bhai!",
-            "Technical issue aa gaya, 2 minute wait karo!",
-            "Server mein thoda issue hai, jaldi theek kar deta hoon!"
-        ]
-        
-        error_msg = f"""{random.choice(error_messages)}
-
-**Kya karna hai:**
-* Thoda wait karo aur phir try karo 
-* Agar problem continue kare to developer ko batao
-
-**Meanwhile**: Main jaldi wapas aa jaunga tumhari help ke liye!
-
-{Config.POWERED_BY} | Hamesha seekhta rehta hoon!"""
+        error_msg = self.catalog.render(
+            'error', language, opener=self.catalog.render('error_openers', language)
+        )
         
         keyboard = [
             [InlineKeyboardButton("Try Again", callback_data="new_question")],
@@ -842,23 +668,194 @@ Aur languages bhi support karta hoon basic level pe.
     # Additional command handlers
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Help command handler"""
-        await self._show_help_message(update, 'hi')
+        keyboard = [[InlineKeyboardButton("Back to Main Menu", callback_data="main_menu")]]
+        await update.message.reply_text(
+            self.catalog.render('help'),
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode='Markdown'
+        )
 
     async def info_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Info command handler"""
-        await self._show_info_message(update, 'hi')
+        keyboard = [[InlineKeyboardButton("Back to Main Menu", callback_data="main_menu")]]
+        await update.message.reply_text(
+            self.catalog.render('info'),
+            reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode='Markdown'
+        )
+
+    async def length_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Let the user choose short, normal or detailed answers"""
+        user_info = self.utils.get_user_info(update)
+        current = self.user_preferences.get_user_preferences(user_info['id']).get('response_length', 'normal')
+        
+        if not context.args or context.args[0].lower() not in LENGTH_PREFERENCES:
+            await update.message.reply_text(self.catalog.render('length_usage', current=current))
+            return
+        
+        choice = context.args[0].lower()
+        self.user_preferences.set_user_preference(user_info['id'], 'response_length', choice)
+        await update.message.reply_text(self.catalog.render('length_set', value=choice))
+
+    async def export_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Send the user's conversation as a PDF document"""
+        user_info = self.utils.get_user_info(update)
+        if await self._rate_limited(update, user_info):
+            return
+        history = self.ai_service.conversation_history.get(user_info['id'])
+        
+        if not history:
+            await update.message.reply_text(self.catalog.render('export_empty'))
+            return
+        
+        try:
+            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action='upload_document')
+            title = f"{Config.BOT_NAME} - {user_info['first_name'] or user_info['username']}"
+            pdf = await get_exporter().export(title, history)
+            await update.message.reply_document(
+                document=pdf,
+                filename=f"ostaad_chat_{user_info['id']}.pdf",
+                caption=self.catalog.render('export_caption', count=len(history))
+            )
+        except ExportBusyError:
+            await update.message.reply_text(self.catalog.render('export_busy'))
+        except Exception as e:
+            logger.error(f"Export failed for user {user_info['id']}: {e}")
+            await update.message.reply_text(self.catalog.render('export_failed'))
+
+    async def humanize_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Rewrite text so it sounds natural"""
+        await self._run_writing_tool(update, context, ai_integration.humanize_text, 'humanize_usage')
+
+    async def seo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Write an SEO article on a topic as a background long-form job"""
+        await self._longform_command(update, context, "article", 'seo_usage')
+
+    async def longform_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Write full notes on a topic as a background long-form job"""
+        await self._longform_command(update, context, "notes", 'longform_usage')
+
+    async def _longform_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE, kind: str, usage_key: str):
+        user_info = self.utils.get_user_info(update)
+        if await self._rate_limited(update, user_info):
+            return
+        topic = ' '.join(context.args)
+        if not topic.strip():
+            await update.message.reply_text(self.catalog.render(usage_key))
+            return
+        
+        preferred_lang = self.language_tracker.current_language(user_info['id'], user_info.get('language_code'))
+        await self._start_longform(update, topic, user_info, preferred_lang, kind)
+
+    async def _start_longform(self, update: Update, topic: str, user_info: dict, language: str, kind: str):
+        """Start a long-form job that posts each section as it is ready under a progress message"""
+        if self.ai_service.usage.over_quota(user_info['id']):
+            await update.message.reply_text(self.ai_service._get_quota_message(language), parse_mode='Markdown')
+            return
+        
+        cancel_markup = InlineKeyboardMarkup([[InlineKeyboardButton("Cancel", callback_data="longform_cancel")]])
+        status_message = await update.message.reply_text(
+            self.catalog.render('longform_started', language), reply_markup=cancel_markup
+        )
+        
+        async def deliver(section: str):
+            for chunk in self.utils.split_long_message(section):
+                try:
+                    await update.message.reply_text(chunk, parse_mode='Markdown')
+                except BadRequest:
+                    # Model Markdown that Telegram can't parse goes out as plain text
+                    await update.message.reply_text(chunk)
+        
+        async def progress(done: int, total: int):
+            try:
+                await status_message.edit_text(
+                    self.catalog.render('longform_progress', language, done=done, total=total),
+                    reply_markup=cancel_markup
+                )
+            except BadRequest:
+                pass
+        
+        async def finished(status: str):
+            await status_message.edit_text(self.catalog.render(f'longform_{status}', language))
+            self.utils.log_user_interaction(
+                user_info['id'], user_info['username'], f"[longform:{kind}:{status}] {topic}", 0
+            )
+        
+        try:
+            self.longform.start(user_info['id'], topic, language, kind, deliver, progress, finished)
+        except LongformBusyError:
+            await status_message.edit_text(self.catalog.render('longform_busy', language))
+
+    async def improve_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Suggest a clearer, better-styled version of a text"""
+        await self._run_writing_tool(update, context, ai_integration.assist_writing, 'improve_usage')
+
+    async def grammar_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Spelling/grammar check of an English text"""
+        user_info = self.utils.get_user_info(update)
+        if await self._rate_limited(update, user_info):
+            return
+        replied = update.message.reply_to_message
+        text = ' '.join(context.args) if context.args else (replied.text if replied and replied.text else '')
+        
+        if not text.strip():
+            await update.message.reply_text(self.catalog.render('grammar_usage'))
+            return
+        
+        service = get_grammar_service()
+        try:
+            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action='typing')
+            report = await service.check_report(text, user_info['id'])
+            for chunk in self.utils.split_long_message(report):
+                await update.message.reply_text(chunk)
+        except GrammarInputTooLong:
+            await update.message.reply_text(self.catalog.render('grammar_too_long', limit=service.max_chars))
+        except GrammarBusyError:
+            await update.message.reply_text(self.catalog.render('grammar_busy'))
+        except Exception as e:
+            logger.error(f"Grammar check failed for user {user_info['id']}: {e}")
+            await update.message.reply_text(self.catalog.render('writing_tool_failed'))
+
+    async def _run_writing_tool(self, update: Update, context: ContextTypes.DEFAULT_TYPE, tool, usage_key: str):
+        """Take the text from the command or the replied-to message and send the tool's answer"""
+        user_info = self.utils.get_user_info(update)
+        if await self._rate_limited(update, user_info):
+            return
+        replied = update.message.reply_to_message
+        text = ' '.join(context.args) if context.args else (replied.text if replied and replied.text else '')
+        
+        if not text.strip():
+            await update.message.reply_text(self.catalog.render(usage_key))
+            return
+        
+        preferred_lang = self.language_tracker.current_language(user_info['id'], user_info.get('language_code'))
+        if self.ai_service.usage.over_quota(user_info['id']):
+            await update.message.reply_text(self.ai_service._get_quota_message(preferred_lang), parse_mode='Markdown')
+            return
+        
+        language = self.language_detector.popular_languages.get(preferred_lang, 'English')
+        try:
+            await context.bot.send_chat_action(chat_id=update.effective_chat.id, action='typing')
+            result, usage = await tool(text, language)
+            self.ai_service.usage.record(user_info['id'], f"tool_{tool.__name__}", preferred_lang,
+                                         Config.AI_TOOLS_MODEL, usage)
+            for chunk in self.utils.split_long_message(result):
+                await update.message.reply_text(chunk)
+        except Exception as e:
+            logger.error(f"Writing tool {tool.__name__} failed for user {user_info['id']}: {e}")
+            await update.message.reply_text(self.catalog.render('writing_tool_failed'))
 
     async def broadcast_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Broadcast command for admin"""
         user_info = self.utils.get_user_info(update)
         
         if not self.utils.is_admin(user_info['id']):
-            await update.message.reply_text("Admin access required bhai!")
+            await update.message.reply_text(self.catalog.render('admin_required'))
             return
         
         if not context.args:
-            await update.message.reply_text("Broadcast message provide karo!\nExample: /broadcast Hello everyone!")
+            await update.message.reply_text(self.catalog.render('broadcast_usage'))
             return
         
         message = ' '.join(context.args)
-        await update.message.reply_text(f"Broadcast ready: {message}\n\n(Feature coming soon!)")
\ No newline at end of file
+        await update.message.reply_text(self.catalog.render('broadcast_ready', message=message))
\ No newline at end of file
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# generation_profiles.py
+# Developer: Ahmad Raza
+# Generation budgets (max_tokens, temperature, model) per query type and user preference
+
+import re
+from collections import deque
+from typing import Dict, Optional
+
+from config import Config
+from response_postprocessor import DECORATION_RESERVE
+
+LENGTH_PREFERENCES = ("short", "normal", "detailed")
+LENGTH_SAMPLE_SIZE = 500                # Recent replies kept per profile for percentiles
+
+_SENTENCE_END = re.compile(r"[.!?।](?=\s)|\n")
+
+
+def enforce_length(text: str, limit: int = Config.MAX_RESPONSE_LENGTH) -> str:
+    """Cut a reply to `limit` chars at the last paragraph/sentence break that fits"""
+    if len(text) <= limit:
+        return text
+
+    head = text[:limit]
+    paragraph = head.rfind("\n\n")
+    if paragraph >= limit // 2:
+        return head[:paragraph].rstrip()
+
+    sentence_ends = [match.end() for match in _SENTENCE_END.finditer(head)]
+    if sentence_ends and sentence_ends[-1] >= limit // 2:
+        return head[:sentence_ends[-1]].rstrip()
+
+    space = head.rfind(" ")
+    return (head[:space] if space >= limit // 2 else head).rstrip() + "..."
+
+
+def profile_model(profile: Dict) -> str:
+    """Model of a profile: its own, else the current FALLBACK_MODEL (light) or DEFAULT_MODEL"""
+    return profile.get("model") or (Config.FALLBACK_MODEL if profile.get("light") else Config.DEFAULT_MODEL)
+
+
+def _percentile(ordered: list, fraction: float) -> int:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class GenerationProfiles:
+    """Picks the generation budget for a query and records how long replies really are"""
+
+    def __init__(self):
+        self.lengths: Dict[str, deque] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def select(self, category: Optional[str] = None, domain: Optional[str] = None,
+               length_preference: Optional[str] = None, profile_name: Optional[str] = None) -> Dict:
+        """Generation parameters for a query; the domain profile wins over the category one,
+        and an explicit `profile_name` over both"""
+        name = (profile_name
+                or Config.DOMAIN_PROFILES.get(domain)
+                or Config.CATEGORY_PROFILES.get(category)
+                or Config.DEFAULT_GENERATION_PROFILE)
+        profile = Config.GENERATION_PROFILES[name]
+
+        params = Config.get_performance_config()
+        params.update(profile)
+        params.pop("light", None)
+        params["model"] = profile_model(profile)
+        params["profile"] = name
+
+        # Detailed answers may use the big model and run past one Telegram message
+        scale = Config.LENGTH_PREFERENCE_SCALE.get(length_preference or "normal", 1.0)
+        params["max_tokens"] = max(64, min(Config.MAX_TOKENS, int(profile["max_tokens"] * scale)))
+        # Room is left for the opening, emoji, tips and signature added after the cap
+        params["max_chars"] = int(Config.MAX_RESPONSE_LENGTH * max(scale, 1.0)) - DECORATION_RESERVE
+        if length_preference == "detailed":
+            params["model"] = Config.DEFAULT_MODEL
+        return params
+
+    def length_instruction(self, params: Dict) -> str:
+        """System hint that keeps the model inside its budget instead of being cut off"""
+        words = int(params["max_tokens"] * Config.WORDS_PER_TOKEN)
+        return (f"Keep this reply under about {words} words and "
+                f"{params['max_chars']} characters; finish your last sentence.")
+
+    def record(self, profile: str, response: str, completion_tokens: Optional[int] = None,
+               finish_reason: Optional[str] = None, truncated: bool = False):
+        """Record one reply for the per-profile length distribution"""
+        lengths = self.lengths.setdefault(profile, deque(maxlen=LENGTH_SAMPLE_SIZE))
+        lengths.append(len(response))
+
+        counters = self.counters.setdefault(
+            profile, {"replies": 0, "completion_tokens": 0, "hit_max_tokens": 0, "truncated": 0}
+        )
+        counters["replies"] += 1
+        counters["completion_tokens"] += completion_tokens or 0
+        counters["hit_max_tokens"] += finish_reason == "length"
+        counters["truncated"] += truncated
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Reply length percentiles (chars) and budget counters per profile"""
+        stats = {}
+        for profile, lengths in self.lengths.items():
+            ordered = sorted(lengths)
+            counters = self.counters[profile]
+            stats[profile] = {
+                **counters,
+                "avg_completion_tokens": counters["completion_tokens"] / counters["replies"],
+                "p50_chars": _percentile(ordered, 0.5),
+                "p90_chars": _percentile(ordered, 0.9),
+                "p99_chars": _percentile(ordered, 0.99),
+                "max_chars": ordered[-1],
+            }
+        return stats
+
+    def format_stats(self) -> str:
+        """Plain-text report for the admin /budgets command"""
+        stats = self.get_stats()
+        if not stats:
+            return "No replies recorded yet."
+
+        lines = ["Reply length by generation profile (chars):"]
+        for profile, entry in sorted(stats.items()):
+            budget = Config.GENERATION_PROFILES.get(profile, {})
+            lines.append(
+                f"\n{profile} (max_tokens {budget.get('max_tokens', '?')}, {profile_model(budget)})\n"
+                f"  replies {entry['replies']}, avg tokens {entry['avg_completion_tokens']:.0f}\n"
+                f"  p50 {entry['p50_chars']}  p90 {entry['p90_chars']}  "
+                f"p99 {entry['p99_chars']}  max {entry['max_chars']}\n"
+                f"  hit max_tokens {entry['hit_max_tokens']}, cut to MAX_RESPONSE_LENGTH {entry['truncated']}"
+            )
+        return "\n".join(lines)
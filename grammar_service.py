@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# grammar_service.py
+# Developer: Ahmad Raza
+# Async grammar/spelling check: sentences fanned out over a process pool with an LRU result cache
+
+import asyncio
+import logging
+import multiprocessing
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Sentence ends followed by whitespace, or line breaks; no NLTK punkt data needed
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+class GrammarInputTooLong(ValueError):
+    """Text is longer than GRAMMAR_MAX_CHARS"""
+
+
+class GrammarBusyError(Exception):
+    """Raised when GRAMMAR_MAX_CONCURRENT checks are already running, or the user already has one"""
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences of a text, stripped, empty ones dropped"""
+    return [sentence.strip() for sentence in _SENTENCE_SPLIT.split(text) if sentence.strip()]
+
+
+def correct_sentence(sentence: str) -> str:
+    """TextBlob spelling correction of one sentence (runs inside a pool worker)"""
+    from textblob import TextBlob
+    return str(TextBlob(sentence).correct())
+
+
+def _init_worker():
+    """Pool initializer: load TextBlob's spelling model before the first job"""
+    correct_sentence("warm up")
+
+
+def format_report(corrections: List[Tuple[str, str]]) -> str:
+    """Plain-text report in the format check_grammar always returned"""
+    if not corrections:
+        return "No grammar issues found."
+    return "\n".join(f"Original: {original}\nCorrected: {corrected}" for original, corrected in corrections)
+
+
+class GrammarService:
+    """Corrects each distinct sentence once, in parallel, and remembers the results"""
+
+    def __init__(self, workers: int = Config.GRAMMAR_WORKERS, cache_size: int = Config.GRAMMAR_CACHE_SIZE,
+                 max_chars: int = Config.GRAMMAR_MAX_CHARS, max_concurrent: int = Config.GRAMMAR_MAX_CONCURRENT):
+        self.workers = workers
+        self.cache_size = cache_size
+        self.max_chars = max_chars
+        self.max_concurrent = max_concurrent
+        self.active_users = set()
+        self.active = 0
+        self.cache: "OrderedDict[str, str]" = OrderedDict()
+        self.stats = {"checks": 0, "sentences": 0, "cache_hits": 0}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first check"""
+        if self._executor is None:
+            # Not fork: a child forked from the threaded bot process can deadlock on an inherited lock
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 mp_context=multiprocessing.get_context("forkserver"))
+        return self._executor
+
+    async def check(self, text: str, user_id: Optional[int] = None) -> List[Tuple[str, str]]:
+        """(original, corrected) for every sentence that needed a fix, in text order.
+
+        Raises GrammarBusyError instead of queueing without bound: at most max_concurrent checks
+        at once, and one per user.
+        """
+        if len(text) > self.max_chars:
+            raise GrammarInputTooLong(f"{len(text)} chars, limit {self.max_chars}")
+        if user_id in self.active_users:
+            raise GrammarBusyError(f"User {user_id} already has a check running")
+        if self.active >= self.max_concurrent:
+            raise GrammarBusyError(f"{self.active} checks already in progress")
+
+        self.active += 1
+        if user_id is not None:
+            self.active_users.add(user_id)
+        try:
+            return await self._check(text)
+        finally:
+            self.active -= 1
+            self.active_users.discard(user_id)
+
+    async def _check(self, text: str) -> List[Tuple[str, str]]:
+        sentences = split_sentences(text)
+        self.stats["checks"] += 1
+        self.stats["sentences"] += len(sentences)
+
+        corrected = {}
+        pending = []
+        for sentence in dict.fromkeys(sentences):
+            hit = self.cache.get(sentence)
+            if hit is not None:
+                self.cache.move_to_end(sentence)
+                corrected[sentence] = hit
+                self.stats["cache_hits"] += 1
+            else:
+                pending.append(sentence)
+
+        if pending:
+            loop = asyncio.get_running_loop()
+            results = await asyncio.wait_for(
+                asyncio.gather(*(loop.run_in_executor(self.executor, correct_sentence, sentence)
+                                 for sentence in pending)),
+                timeout=Config.GRAMMAR_TIMEOUT
+            )
+            for sentence, result in zip(pending, results):
+                corrected[sentence] = result
+                self.cache[sentence] = result
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+
+        return [(sentence, corrected[sentence]) for sentence in sentences if corrected[sentence] != sentence]
+
+    def set_cache_size(self, size: int):
+        """Change the cache limit, dropping the oldest sentences if it shrank"""
+        self.cache_size = size
+        while len(self.cache) > size:
+            self.cache.popitem(last=False)
+
+    async def check_report(self, text: str, user_id: Optional[int] = None) -> str:
+        """check() formatted as the plain-text report"""
+        return format_report(await self.check(text, user_id))
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_service: Optional[GrammarService] = None
+
+
+def get_grammar_service() -> GrammarService:
+    """Get the shared grammar service"""
+    global _service
+    if _service is None:
+        _service = GrammarService()
+    return _service
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# health_server.py
+# Developer: Ahmad Raza
+# In-process /healthz and /readyz endpoints on the bot's own event loop, for container probes
+
+import asyncio
+import json
+import logging
+import time
+from typing import Optional, Tuple
+
+from circuit_breaker import OPEN
+from config import Config
+from loop_watchdog import get_loop_watchdog
+from perf_tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}
+
+
+class HealthServer:
+    """Minimal HTTP server (asyncio streams, no extra dependency).
+
+    It is served by the same event loop as the bot, so a blocked loop shows up as a probe timeout.
+    /healthz - liveness: the loop answers and its watchdog heartbeat is fresh
+    /readyz  - readiness: warmed up, polling, Groq circuit not open, queued updates being processed
+    """
+
+    def __init__(self, application, warmup, ai_service, host: str = Config.HEALTH_HOST,
+                 port: int = Config.HEALTH_PORT):
+        self.application = application
+        self.warmup = warmup
+        self.ai_service = ai_service
+        self.host = host
+        self.port = port
+        self.started = time.monotonic()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        if not self.port:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Health endpoints on http://{self.host}:{self.port}/healthz and /readyz")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def health(self) -> Tuple[int, dict]:
+        watchdog = get_loop_watchdog()
+        heartbeat_age = watchdog.heartbeat_age()
+        alive = heartbeat_age < Config.HEALTH_MAX_HEARTBEAT_AGE
+        return (200 if alive else 503), {
+            "status": "ok" if alive else "loop_stalled",
+            "uptime_seconds": round(time.monotonic() - self.started),
+            "heartbeat_age_ms": round(heartbeat_age * 1e3, 1),
+            "loop_lag_p99_ms": round(watchdog.lag.percentile(0.99), 1),
+            "loop_stalls": watchdog.stalls,
+        }
+
+    def readiness(self) -> Tuple[int, dict]:
+        breaker = self.ai_service.groq_breaker
+        queue_depth = self.application.update_queue.qsize()
+        last_finished = get_tracer().last_finished
+        since_update = None if last_finished is None else time.monotonic() - last_finished
+        # Idle is fine; queued updates with nothing finishing for a long time is not
+        stuck = queue_depth > 0 and (since_update is None or since_update > Config.HEALTH_STALE_UPDATE_SECONDS)
+
+        checks = {
+            "warmed_up": self.warmup.is_ready,
+            "polling": bool(self.application.updater and self.application.updater.running),
+            "groq_circuit_closed": breaker.state != OPEN,
+            "updates_flowing": not stuck,
+        }
+        ready = all(checks.values())
+        return (200 if ready else 503), {
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "seconds_since_last_update": None if since_update is None else round(since_update, 1),
+            "update_queue_depth": queue_depth,
+            "groq_circuit": breaker.state,
+            "groq_in_flight": self.ai_service.in_flight,
+        }
+
+    def _route(self, path: str) -> Tuple[int, dict]:
+        path = path.split("?", 1)[0]
+        if path == "/healthz":
+            return self.health()
+        if path == "/readyz":
+            return self.readiness()
+        return 404, {"error": "not found"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Headers are not needed; read up to the blank line so the client sees a clean close
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            status, payload = self._route(parts[1] if len(parts) > 1 else "/")
+            body = json.dumps(payload).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.error(f"Health probe failed: {e}")
+        finally:
+            writer.close()
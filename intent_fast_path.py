@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# intent_fast_path.py
+# Developer: Ahmad Raza
+# Canned replies for trivial messages (greetings, thanks, ok, emoji, identity) without an LLM call
+
+import json
+import logging
+import os
+import re
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+from config import Config
+from message_catalog import LOCALES_DIR, get_catalog
+
+logger = logging.getLogger(__name__)
+
+INTENTS_FILE = os.path.join(LOCALES_DIR, "intents.json")
+FAST_PATH_MAX_CHARS = 60                # Longer messages are never trivial
+ANSWER_INTENTS = ("ok", "emoji")        # Can be a reply to the bot's own question ("Want more examples?")
+
+_REPEATS = re.compile(r"(\w)\1+")       # "hiiii" / "okkk" / "thankss" -> one letter
+
+
+def normalize(text: str) -> str:
+    """Lowercase, drop punctuation/symbols and squeeze repeated letters"""
+    text = text.lower().replace("'", "").replace("\u2019", "")
+    cleaned = "".join(" " if unicodedata.category(char)[0] in "PSZC" else char for char in text)
+    return _REPEATS.sub(r"\1", " ".join(cleaned.split()))
+
+
+def is_emoji_only(text: str) -> bool:
+    """Message made of emoji/symbols only (no letters or digits)"""
+    stripped = "".join(text.split())
+    return bool(stripped) and not any(char.isalnum() for char in stripped) and any(
+        unicodedata.category(char) in ("So", "Sk") for char in stripped
+    )
+
+
+class IntentFastPath:
+    """Matches whole trivial messages against per-language phrase tables"""
+
+    def __init__(self, intents_path: str = INTENTS_FILE):
+        self.catalog = get_catalog()
+        self.enabled = set(Config.FAST_PATH_INTENTS)
+        self.phrases: Dict[str, str] = {}
+        self.fillers = set()
+        self.hits: Dict[str, int] = {intent: 0 for intent in Config.FAST_PATH_INTENTS}
+        self.checked = 0
+
+        try:
+            with open(intents_path, "r", encoding="utf-8") as f:
+                table = json.load(f)
+            self.fillers = {normalize(word) for word in table.get("fillers", [])}
+            for intent, languages in table.get("intents", {}).items():
+                if intent not in self.enabled:
+                    continue
+                for phrases in languages.values():
+                    for phrase in phrases:
+                        self.phrases[self._strip_fillers(normalize(phrase)) or normalize(phrase)] = intent
+        except Exception as e:
+            logger.error(f"Failed to load fast-path intents: {e}")
+
+    def _strip_fillers(self, normalized: str) -> str:
+        return " ".join(word for word in normalized.split() if word not in self.fillers)
+
+    def match(self, text: str, analysis: Optional[dict] = None) -> Optional[str]:
+        """Intent name if the whole message is a trivial intent, else None"""
+        if analysis is not None and analysis.get('identity') and "identity" in self.enabled:
+            return "identity"
+        if len(text) > FAST_PATH_MAX_CHARS:
+            return None
+        if is_emoji_only(text):
+            return "emoji" if "emoji" in self.enabled else None
+
+        normalized = normalize(text)
+        return self.phrases.get(self._strip_fillers(normalized)) or self.phrases.get(normalized)
+
+    def reply(self, intent: str, language: str, name: str = "") -> str:
+        """Random localized reply for an intent"""
+        if intent == "identity":
+            return self.catalog.render('developer_info', language)
+        return self.catalog.render(f"intent_{intent}", language, name=name or "bhai")
+
+    def answer(self, text: str, language: str, name: str = "",
+               analysis: Optional[dict] = None, awaiting_answer: bool = False) -> Optional[Tuple[str, str]]:
+        """(intent, reply) when the message can be answered without the LLM
+
+        After the bot asked a question, "ok" or a thumbs-up answers it, so it goes to the LLM.
+        """
+        self.checked += 1
+        intent = self.match(text, analysis)
+        if intent is None or (awaiting_answer and intent in ANSWER_INTENTS):
+            return None
+
+        self.hits[intent] = self.hits.get(intent, 0) + 1
+        return intent, self.reply(intent, language, name)
+
+    def get_stats(self) -> dict:
+        """Hit counters per intent and overall fast-path share"""
+        answered = sum(self.hits.values())
+        return {
+            'checked': self.checked,
+            'answered': answered,
+            'hit_rate': answered / self.checked if self.checked else 0.0,
+            'hits': dict(self.hits)
+        }
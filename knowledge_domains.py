@@ -118,6 +118,8 @@ class KnowledgeDomainClassifier:
             }
         }
         
+        self._analyzer = None  # Keyword automaton, compiled on first classify_query
+        
         self.response_templates = {
             "academic_detailed": {
                 "prefix": "🎓 **Academic Analysis**\n\n",
@@ -177,40 +179,12 @@ class KnowledgeDomainClassifier:
     
     def classify_query(self, query: str, language: str = "en") -> Tuple[str, float]:
         """Classify user query into knowledge domain"""
-        query_lower = query.lower()
-        domain_scores = {}
-        
-        for domain, config in self.domain_keywords.items():
-            score = 0
-            
-            # Check English keywords
-            for keyword in config["keywords"]:
-                if keyword in query_lower:
-                    score += 1
-            
-            # Check Hindi keywords if applicable
-            if language in ["hi", "ur", "bn"] and "hindi_keywords" in config:
-                for keyword in config["hindi_keywords"]:
-                    if keyword in query:
-                        score += 1.5  # Higher weight for native language
-            
-            # Normalize score
-            total_keywords = len(config["keywords"]) + len(config.get("hindi_keywords", []))
-            if total_keywords > 0:
-                domain_scores[domain] = score / total_keywords
-        
-        # Find best matching domain
-        if domain_scores:
-            best_domain = max(domain_scores, key=domain_scores.get)
-            confidence = domain_scores[best_domain]
-            
-            # If confidence is too low, classify as general
-            if confidence < 0.1:
-                return "general", 0.5
-            
-            return best_domain, confidence
+        if self._analyzer is None:
+            from message_analyzer import MessageAnalyzer
+            self._analyzer = MessageAnalyzer(self.domain_keywords)
         
-        return "general", 0.5
+        analysis = self._analyzer.analyze(query, language)
+        return analysis['domain'], analysis['domain_confidence']
     
     def get_response_template(self, domain: str) -> Dict:
         """Get response template for domain"""
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# language_identifier.py
+# Developer: Ahmad Raza
+# Character n-gram language identifier for Latin-script (English / Hinglish) text
+
+import argparse
+import logging
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Labels the shipped tables are trained on. 'hi_latn' is romanized Hindi / Hinglish.
+LABELS = ("en", "hi_latn")
+
+# Map identifier labels to the language codes used everywhere else in the bot
+LABEL_TO_LANGUAGE = {
+    "en": "en",
+    "hi_latn": "hi",
+}
+
+NGRAM_ORDERS = (1, 2, 3, 4)
+HASH_BITS = 15                      # 32768 buckets per class
+SMOOTHING = 0.5                     # Additive smoothing for the n-gram counts
+CONFIDENCE_SCALE = 4.0              # Squashes the per-n-gram log-likelihood margin
+
+DEFAULT_CORPUS = os.path.join(Config.DATA_DIR, "langid_corpus.tsv")
+DEFAULT_WEIGHTS = os.path.join(Config.DATA_DIR, "langid_weights.npz")
+
+_NON_LETTERS = re.compile(r"[^a-z']+")
+_LATIN_LETTER = re.compile(r"[A-Za-z]")
+_ANY_LETTER = re.compile(r"[^\W\d_]")
+
+# Large odd multipliers for the rolling byte hash (uint32 wrap-around is intended)
+_ROLL = np.uint32(16777619)
+_MIX = np.uint32(2654435761)
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse everything except ASCII letters to single spaces"""
+    return " " + _NON_LETTERS.sub(" ", text.lower()).strip() + " "
+
+
+def is_latin_script(text: str) -> bool:
+    """Check whether most letters of the text are ASCII Latin letters"""
+    letters = len(_ANY_LETTER.findall(text))
+    if not letters:
+        return False
+    return len(_LATIN_LETTER.findall(text)) * 2 >= letters
+
+
+def hash_ngrams(text: str) -> np.ndarray:
+    """Hash all byte n-grams of the normalized text into bucket indices"""
+    data = np.frombuffer(normalize(text).encode("ascii", "ignore"), dtype=np.uint8).astype(np.uint32)
+    size = data.shape[0]
+    shift = np.uint32(32 - HASH_BITS)
+    parts = []
+
+    with np.errstate(over="ignore"):
+        for order in NGRAM_ORDERS:
+            count = size - order + 1
+            if count <= 0:
+                break
+            rolling = data[:count] + np.uint32(order)
+            for offset in range(1, order):
+                rolling = rolling * _ROLL + data[offset:offset + count]
+            parts.append((rolling * _MIX) >> shift)
+
+    if not parts:
+        return np.zeros(1, dtype=np.uint32)
+    return np.concatenate(parts)
+
+
+class NgramLanguageIdentifier:
+    """Naive Bayes scorer over hashed character n-grams with a Hinglish class"""
+
+    def __init__(self, weights: np.ndarray, priors: np.ndarray, labels: Tuple[str, ...] = LABELS):
+        self.weights = weights.astype(np.float32)       # (classes, buckets) log-probabilities
+        self.priors = priors.astype(np.float32)         # (classes,) log-priors
+        self.labels = tuple(labels)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_WEIGHTS) -> "NgramLanguageIdentifier":
+        """Load weight tables from a NumPy archive"""
+        with np.load(path) as tables:
+            labels = tuple(str(label) for label in tables["labels"])
+            return cls(tables["weights"], tables["priors"], labels)
+
+    def save(self, path: str = DEFAULT_WEIGHTS):
+        """Save weight tables as a compact NumPy archive"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights.astype(np.float16),
+            priors=self.priors,
+            labels=np.array(self.labels)
+        )
+
+    @classmethod
+    def train(cls, samples: Iterable[Tuple[str, str]], labels: Tuple[str, ...] = LABELS) -> "NgramLanguageIdentifier":
+        """Train the tables from (label, text) samples"""
+        index = {label: i for i, label in enumerate(labels)}
+        counts = np.zeros((len(labels), 1 << HASH_BITS), dtype=np.float64)
+        docs = np.zeros(len(labels), dtype=np.float64)
+
+        for label, text in samples:
+            row = index[label]
+            np.add.at(counts[row], hash_ngrams(text), 1.0)
+            docs[row] += 1
+
+        counts += SMOOTHING
+        weights = np.log(counts / counts.sum(axis=1, keepdims=True))
+        priors = np.log((docs + 1) / (docs.sum() + len(labels)))
+        return cls(weights, priors, labels)
+
+    def _scores(self, texts: List[str]) -> np.ndarray:
+        """Score a batch of texts, returning (texts, classes) average log-likelihoods"""
+        indices = [hash_ngrams(text) for text in texts]
+        lengths = np.fromiter((len(idx) for idx in indices), dtype=np.int64, count=len(indices))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        per_ngram = self.weights[:, np.concatenate(indices)]
+        totals = np.add.reduceat(per_ngram, offsets, axis=1)
+        return (totals / lengths).T + self.priors / lengths[:, None]
+
+    def predict_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Predict (label, confidence) for every text in one vectorized pass"""
+        if not texts:
+            return []
+
+        scores = self._scores(texts)
+        best = scores.argmax(axis=1)
+        ordered = np.sort(scores, axis=1)
+        margin = ordered[:, -1] - ordered[:, -2] if scores.shape[1] > 1 else ordered[:, -1]
+        confidence = 1.0 / (1.0 + np.exp(-CONFIDENCE_SCALE * margin))
+        return [(self.labels[b], float(c)) for b, c in zip(best, confidence)]
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """Predict (label, confidence) for a single text"""
+        return self.predict_batch([text])[0]
+
+    def detect(self, text: str) -> Tuple[str, float]:
+        """Predict and map the label to the bot's language code ('en' / 'hi')"""
+        label, confidence = self.predict(text)
+        return LABEL_TO_LANGUAGE.get(label, Config.DEFAULT_LANGUAGE), confidence
+
+
+_identifier: Optional[NgramLanguageIdentifier] = None
+_load_failed = False
+
+
+def get_identifier() -> Optional[NgramLanguageIdentifier]:
+    """Get the shared identifier, loading the tables on first use"""
+    global _identifier, _load_failed
+    if _identifier is None and not _load_failed:
+        try:
+            _identifier = NgramLanguageIdentifier.load()
+        except Exception as e:
+            _load_failed = True
+            logger.error(f"Failed to load language identifier tables: {e}")
+    return _identifier
+
+
+def read_corpus(path: str = DEFAULT_CORPUS) -> List[Tuple[str, str]]:
+    """Read a 'label<TAB>text' corpus, skipping comments and blank lines"""
+    samples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            label, text = line.split("\t", 1)
+            samples.append((label, text))
+    return samples
+
+
+def split_corpus(samples: List[Tuple[str, str]], holdout: int) -> Tuple[List, List]:
+    """Deterministic train/eval split: every `holdout`-th sample is held out"""
+    if holdout <= 1:
+        return samples, []
+    train = [s for i, s in enumerate(samples) if i % holdout]
+    evaluation = [s for i, s in enumerate(samples) if not i % holdout]
+    return train, evaluation
+
+
+def evaluate(identifier: NgramLanguageIdentifier, samples: List[Tuple[str, str]]) -> Dict[str, float]:
+    """Accuracy of the identifier over labelled samples"""
+    if not samples:
+        return {"samples": 0, "accuracy": 0.0}
+    predictions = identifier.predict_batch([text for _, text in samples])
+    correct = sum(1 for (label, _), (predicted, _) in zip(samples, predictions) if label == predicted)
+    return {"samples": len(samples), "accuracy": correct / len(samples)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point to retrain and evaluate the tables"""
+    parser = argparse.ArgumentParser(description="Train or evaluate the n-gram language identifier")
+    parser.add_argument("command", choices=["train", "evaluate"])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--weights", default=DEFAULT_WEIGHTS)
+    parser.add_argument("--holdout", type=int, default=5, help="Hold out every Nth sample for evaluation")
+    args = parser.parse_args(argv)
+
+    train, held_out = split_corpus(read_corpus(args.corpus), args.holdout)
+
+    if args.command == "train":
+        identifier = NgramLanguageIdentifier.train(train)
+        identifier.save(args.weights)
+        print(f"Trained on {len(train)} samples -> {args.weights}")
+    else:
+        identifier = NgramLanguageIdentifier.load(args.weights)
+
+    result = evaluate(identifier, held_out)
+    print(f"Held-out accuracy: {result['accuracy']:.3f} over {result['samples']} samples")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
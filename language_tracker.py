@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# language_tracker.py
+# Developer: Ahmad Raza
+# Sticky per-user language state with cheap script-change detection
+
+import logging
+import time
+from typing import Dict, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Scripts are bucketed by 128-codepoint Unicode block (ord(c) >> 7)
+SCRIPT_BLOCKS = {
+    0x00: "latin", 0x01: "latin", 0x02: "latin",
+    0x0C: "arabic", 0x0D: "arabic",
+    0x12: "devanagari", 0x13: "bengali", 0x14: "gurmukhi", 0x15: "gujarati",
+    0x16: "odia", 0x17: "tamil", 0x18: "telugu", 0x19: "kannada", 0x1A: "malayalam",
+}
+
+HISTOGRAM_SAMPLE = 200                  # Letters sampled per message
+
+
+def script_histogram(text: str) -> Dict[str, float]:
+    """Fraction of sampled letters per script"""
+    counts: Dict[str, int] = {}
+    total = 0
+    for char in text:
+        if not char.isalpha():
+            continue
+        script = SCRIPT_BLOCKS.get(ord(char) >> 7, "other")
+        counts[script] = counts.get(script, 0) + 1
+        total += 1
+        if total >= HISTOGRAM_SAMPLE:
+            break
+
+    if not total:
+        return {}
+    return {script: count / total for script, count in counts.items()}
+
+
+def histogram_distance(first: Dict[str, float], second: Dict[str, float]) -> float:
+    """Total variation distance between two script histograms (0 = same, 1 = disjoint)"""
+    keys = first.keys() | second.keys()
+    return sum(abs(first.get(key, 0.0) - second.get(key, 0.0)) for key in keys) / 2
+
+
+class UserLanguageTracker:
+    """Remembers each user's language and only re-detects when their writing changes"""
+
+    def __init__(self, language_detector, user_preferences):
+        self.language_detector = language_detector
+        self.user_preferences = user_preferences
+        self.states = {}
+        self.detections = 0
+        self.switches = 0
+
+    def _new_state(self, language: str, confidence: float, explicit: bool = False,
+                   histogram: Optional[Dict[str, float]] = None) -> dict:
+        return {
+            'language': language,
+            'confidence': confidence,
+            'confirmed_at': time.monotonic(),
+            'histogram': histogram,
+            'explicit': explicit
+        }
+
+    def _get_state(self, user_id: int) -> Optional[dict]:
+        """Get in-memory state, seeding it from saved preferences on first sight"""
+        state = self.states.get(user_id)
+        if state is None:
+            saved = self.user_preferences.get_user_language(user_id)
+            if saved:
+                explicit = self.user_preferences.is_language_explicit(user_id)
+                # Saved detections get re-checked against the next message's script
+                state = self._new_state(saved, 1.0 if explicit else 0.5, explicit)
+                self.states[user_id] = state
+        return state
+
+    def _detect(self, user_id: int, text: str, histogram: Dict[str, float]) -> dict:
+        """Run full detection and update (and persist, if changed) the user's state"""
+        self.detections += 1
+        language, confidence = self.language_detector.detect_language_with_confidence(text)
+        state = self.states.get(user_id)
+
+        if confidence < Config.LANGUAGE_CONFIDENCE_FLOOR:
+            if state is None:
+                # A new user's "ok"/"hi" (score 0.0) is only a guess: answer in it, but don't
+                # save it, and re-detect on every message until a confident detection
+                state = self._new_state(language, confidence)
+                self.states[user_id] = state
+                return state
+            # Too unsure to switch on: keep the language, and remember this message's script so
+            # the next ones only re-detect on a script change or reconfirm
+            state['confirmed_at'] = time.monotonic()
+            state['histogram'] = histogram
+            return state
+
+        if state is None or state['language'] != language:
+            if state is not None:
+                self.switches += 1
+                logger.info(f"User {user_id} switched language {state['language']} -> {language}")
+            self.user_preferences.set_user_language(user_id, language)
+
+        state = self._new_state(language, confidence, histogram=histogram)
+        self.states[user_id] = state
+        return state
+
+    def resolve(self, user_id: int, text: str) -> str:
+        """Get the language to answer a message in, re-detecting only when needed"""
+        state = self._get_state(user_id)
+        if state is not None and state['explicit']:
+            return state['language']
+
+        histogram = script_histogram(text)
+        if state is None:
+            return self._detect(user_id, text, histogram)['language']
+
+        if not histogram:
+            return state['language']                # Emoji/number-only: nothing to learn
+
+        if state['confidence'] < Config.LANGUAGE_CONFIDENCE_FLOOR:
+            needs_detection = True                  # Guessed or saved, not yet confirmed
+        elif state['histogram'] is None:
+            needs_detection = False
+        else:
+            needs_detection = (
+                histogram_distance(histogram, state['histogram']) > Config.LANGUAGE_SWITCH_THRESHOLD
+                or time.monotonic() - state['confirmed_at'] > Config.LANGUAGE_RECONFIRM_SECONDS
+            )
+
+        if needs_detection:
+            return self._detect(user_id, text, histogram)['language']
+
+        if state['histogram'] is None:
+            state['histogram'] = histogram
+        return state['language']
+
+    def current_language(self, user_id: int, hint: Optional[str] = None) -> str:
+        """Get the user's language without detecting (e.g. for commands and buttons)"""
+        state = self._get_state(user_id)
+        if state is not None:
+            return state['language']
+        if hint and hint.split('-')[0] in Config.SUPPORTED_LANGUAGES:
+            return hint.split('-')[0]
+        return Config.DEFAULT_LANGUAGE
+
+    def set_explicit(self, user_id: int, language: str):
+        """Pin the user's language to an explicit choice from settings"""
+        self.states[user_id] = self._new_state(language, 1.0, explicit=True)
+        self.user_preferences.set_user_language(user_id, language, explicit=True)
+
+    def clear_explicit(self, user_id: int):
+        """Return the user to automatic detection"""
+        state = self._get_state(user_id)
+        if state is not None and state['explicit']:
+            state['explicit'] = False
+            state['confidence'] = 0.0
+            self.user_preferences.set_user_language(user_id, state['language'])
+
+    def get_stats(self) -> dict:
+        """Detection counters for monitoring"""
+        return {
+            'tracked_users': len(self.states),
+            'detections': self.detections,
+            'switches': self.switches
+        }
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# latex_renderer.py
+# Developer: Ahmad Raza
+# Typeset PDF notes: sandboxed async LaTeX jobs with a bounded pool and a content-hash cache
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import signal
+import tempfile
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_FILE = "latex_template.tex"
+JOB_NAME = "notes"
+
+_SPECIALS = {
+    "\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#", "_": r"\_",
+    "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}",
+    "<": r"\textless{}", ">": r"\textgreater{}",
+}
+_SPECIAL_CHARS = re.compile("[" + re.escape("".join(_SPECIALS)) + "]")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_DEVANAGARI = re.compile(r"[\u0900-\u097F](?:[\u0900-\u097F\s,.?!]*[\u0900-\u097F।])?")
+_PLACEHOLDER = re.compile(r"<<(\w+)>>")
+_BLOCK_MARKUP = re.compile(r"^\s*(?:#+|>+|[-*•+]|\d+[.)])\s+", re.MULTILINE)
+_INLINE_MARKUP = re.compile(r"\*\*|__|`")
+
+
+class LatexRenderError(Exception):
+    """A LaTeX job failed, timed out or produced no PDF"""
+
+
+def escape_latex(text: str) -> str:
+    """Escape LaTeX special characters in one pass"""
+    return _SPECIAL_CHARS.sub(lambda match: _SPECIALS[match.group()], text)
+
+
+def markdown_to_latex(content: str) -> str:
+    """Paragraphs, line breaks, **bold** and Devanagari runs of a reply as a LaTeX body"""
+    paragraphs = []
+    for paragraph in content.split("\n\n"):
+        lines = [escape_latex(line.strip()) for line in paragraph.split("\n") if line.strip()]
+        if lines:
+            paragraphs.append(" \\\\\n".join(lines))
+
+    body = "\n\n".join(paragraphs)
+    body = _BOLD.sub(r"\\textbf{\1}", body)
+    return _DEVANAGARI.sub(lambda match: rf"\devanagari{{{match.group()}}}", body)
+
+
+def title_to_latex(title: str) -> str:
+    """One-line title: headings, quotes, list markers and emphasis dropped, whitespace collapsed.
+    A blank line would otherwise put \\par inside \\title{} and fail the render."""
+    text = " ".join(_INLINE_MARKUP.sub("", _BLOCK_MARKUP.sub("", title)).split())
+    return _DEVANAGARI.sub(lambda match: rf"\devanagari{{{match.group()}}}", escape_latex(text))
+
+
+class LatexRenderer:
+    """Runs latexmk jobs in isolated temp dirs, at most LATEX_WORKERS at a time"""
+
+    def __init__(self, workers: int = Config.LATEX_WORKERS, timeout: float = Config.LATEX_TIMEOUT,
+                 cache_size: int = Config.LATEX_CACHE_SIZE, template_path: str = TEMPLATE_FILE):
+        with open(template_path, "r", encoding="utf-8") as f:
+            self.template = f.read()
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.slots = asyncio.Semaphore(workers)
+        self.stats = {"renders": 0, "cache_hits": 0, "failures": 0, "timeouts": 0}
+
+    def resize(self, workers: int):
+        """New job limit; jobs already holding a slot finish under the old one"""
+        self.slots = asyncio.Semaphore(workers)
+
+    def set_cache_size(self, size: int):
+        """Change the cache limit, dropping the oldest PDFs if it shrank"""
+        self.cache_size = size
+        while len(self.cache) > size:
+            self.cache.popitem(last=False)
+
+    @staticmethod
+    def available() -> bool:
+        """latexmk and the engine are installed"""
+        return bool(shutil.which("latexmk") and shutil.which(Config.LATEX_ENGINE))
+
+    def build_source(self, content: str, title: str) -> str:
+        """Fill the template; every value is escaped, the body is converted from Markdown"""
+        values = {
+            "title": title_to_latex(title),
+            "developer": escape_latex(Config.DEVELOPER),
+            "content": markdown_to_latex(content),
+        }
+        return _PLACEHOLDER.sub(lambda match: values.get(match.group(1), ""), self.template)
+
+    async def render(self, content: str, title: str = "Ostaad AI Notes") -> bytes:
+        """PDF bytes for a reply; identical sources share one cache entry and one job"""
+        source = self.build_source(content, title)
+        # The template prints \today, so yesterday's PDF of the same source is not a hit
+        key = f"{Config.LATEX_ENGINE}\0{date.today().isoformat()}\0{source}"
+        key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return cached
+
+        pending = self.in_flight.get(key)
+        if pending is not None:
+            self.stats["cache_hits"] += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            async with self.slots:
+                pdf = await self._compile(source)
+            self.cache[key] = pdf
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            future.set_result(pdf)
+            return pdf
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()          # Mark retrieved for when nobody else was waiting
+            raise
+        finally:
+            del self.in_flight[key]
+
+    async def _compile(self, source: str) -> bytes:
+        """One latexmk run in a private temp dir; the dir is always removed"""
+        workdir = tempfile.mkdtemp(prefix="ostaad_latex_")
+        try:
+            with open(os.path.join(workdir, f"{JOB_NAME}.tex"), "w", encoding="utf-8") as f:
+                f.write(source)
+
+            env = dict(os.environ, openin_any="p", openout_any="p", shell_escape="f")
+            process = await asyncio.create_subprocess_exec(
+                "latexmk", f"-{Config.LATEX_ENGINE}", "-interaction=nonstopmode", "-halt-on-error",
+                "-no-shell-escape", f"{JOB_NAME}.tex",
+                cwd=workdir, env=env, start_new_session=True,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+            )
+            try:
+                output, _ = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                raise LatexRenderError(f"LaTeX job timed out after {self.timeout}s")
+            finally:
+                if process.returncode is None:
+                    # Timed out or cancelled: latexmk runs the engine as a child, kill the whole group
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    await process.wait()
+
+            pdf_path = os.path.join(workdir, f"{JOB_NAME}.pdf")
+            if process.returncode != 0 or not os.path.exists(pdf_path):
+                self.stats["failures"] += 1
+                tail = output.decode("utf-8", "replace")[-500:]
+                raise LatexRenderError(f"latexmk exited with {process.returncode}: {tail}")
+
+            with open(pdf_path, "rb") as f:
+                pdf = f.read()
+            self.stats["renders"] += 1
+            return pdf
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+_renderer: Optional[LatexRenderer] = None
+
+
+def get_renderer() -> LatexRenderer:
+    """Get the shared LaTeX renderer"""
+    global _renderer
+    if _renderer is None:
+        _renderer = LatexRenderer()
+    return _renderer
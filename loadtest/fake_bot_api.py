@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# loadtest/fake_bot_api.py
+# Developer: Ahmad Raza
+# Local Telegram Bot API stand-in: serves synthetic getUpdates (long polling) and records every send
+
+import email
+import email.policy
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+from urllib.parse import parse_qsl
+
+# python-telegram-bot sends form fields; these carry JSON (numbers, lists, keyboards)
+_JSON_FIELDS = {"chat_id", "message_id", "reply_markup", "allowed_updates", "offset", "limit", "timeout"}
+
+# Methods whose result is a Message; the rest answer True
+_MESSAGE_METHODS = {"sendMessage", "editMessageText", "sendDocument", "sendPhoto"}
+
+BOT_USER = {"id": 100000001, "is_bot": True, "first_name": "Ostaad AI", "username": "OstaadAIBot",
+            "can_join_groups": False, "can_read_all_group_messages": False, "supports_inline_queries": False}
+
+
+def _user(user_id: int, first_name: str, language_code: str) -> dict:
+    return {"id": user_id, "is_bot": False, "first_name": first_name,
+            "username": f"{first_name.lower()}{user_id}", "language_code": language_code}
+
+
+def _parse_body(content_type: str, body: bytes) -> dict:
+    """Request parameters from a JSON, form or multipart body"""
+    if not body:
+        return {}
+    if content_type.startswith("application/json"):
+        return json.loads(body)
+
+    if content_type.startswith("multipart/form-data"):
+        message = email.message_from_bytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body,
+                                           policy=email.policy.HTTP)
+        fields = [(part.get_param("name", header="content-disposition"), part.get_content())
+                  for part in message.iter_parts() if not part.get_filename()]
+    else:
+        fields = parse_qsl(body.decode("utf-8"), keep_blank_values=True)
+
+    params = {}
+    for name, value in fields:
+        if name in _JSON_FIELDS and isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        params[name] = value
+    return params
+
+
+class FakeBotAPI:
+    """Threaded HTTP server answering /bot<token>/<method> like api.telegram.org.
+
+    Updates are queued with push_message()/push_callback() and handed out by getUpdates.
+    Every call is passed to on_call(method, params, result, at) - called from a server thread.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 on_call: Optional[Callable[[str, dict, object, float], None]] = None):
+        self.on_call = on_call
+        self.calls = Counter()
+        self._pending: List[dict] = []
+        self._next_update_id = 1
+        self._next_message_id = 1
+        self._cond = threading.Condition()
+        self._closed = False
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Value for TELEGRAM_API_BASE_URL"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/bot"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="fake-bot-api", daemon=True).start()
+
+    def stop(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+    # Synthetic updates
+
+    def _message_id(self) -> int:
+        with self._cond:
+            message_id = self._next_message_id
+            self._next_message_id += 1
+            return message_id
+
+    def _push(self, update: dict) -> int:
+        with self._cond:
+            update_id = self._next_update_id
+            self._next_update_id += 1
+            update["update_id"] = update_id
+            self._pending.append(update)
+            self._cond.notify_all()
+            return update_id
+
+    def push_message(self, user_id: int, first_name: str, language_code: str, text: str) -> int:
+        """Queue a private text message (commands get their bot_command entity)"""
+        message = {
+            "message_id": self._message_id(),
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private", "first_name": first_name},
+            "from": _user(user_id, first_name, language_code),
+            "text": text,
+        }
+        if text.startswith("/"):
+            message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]
+        return self._push({"message": message})
+
+    def push_callback(self, user_id: int, first_name: str, language_code: str, data: str,
+                      message_id: int, message_text: str = "") -> int:
+        """Queue an inline-button tap on one of the bot's own messages"""
+        return self._push({"callback_query": {
+            "id": str(self._message_id()),
+            "from": _user(user_id, first_name, language_code),
+            "chat_instance": str(user_id),
+            "data": data,
+            "message": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private", "first_name": first_name},
+                "from": BOT_USER,
+                "text": message_text or "menu",
+            },
+        }})
+
+    # Bot API methods
+
+    def _get_updates(self, params: dict) -> List[dict]:
+        offset = int(params.get("offset") or 0)
+        deadline = time.monotonic() + float(params.get("timeout") or 0)
+        with self._cond:
+            # Confirming an offset drops everything before it, as on the real server
+            self._pending = [update for update in self._pending if update["update_id"] >= offset]
+            while not self._pending and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._pending[:int(params.get("limit") or 100)]
+
+    def _call(self, method: str, params: dict):
+        if method == "getUpdates":
+            return self._get_updates(params)
+        if method == "getMe":
+            return BOT_USER
+        if method in _MESSAGE_METHODS:
+            chat_id = params.get("chat_id")
+            message = {
+                "message_id": params.get("message_id") or self._message_id(),
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "from": BOT_USER,
+            }
+            if "text" in params:
+                message["text"] = params["text"]
+            return message
+        return True
+
+    def _handler_class(self):
+        api = self
+
+        class BotAPIHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                method = self.path.rstrip("/").rsplit("/", 1)[-1].split("?")[0]
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                params = _parse_body(self.headers.get("Content-Type", ""), body)
+
+                result = api._call(method, params)
+                api.calls[method] += 1
+                if api.on_call is not None:
+                    api.on_call(method, params, result, time.perf_counter())
+
+                data = json.dumps({"ok": True, "result": result}).encode("utf-8")
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass    # The bot stopped while a getUpdates long poll was open
+
+            do_GET = do_POST = _serve
+
+            def log_message(self, *args):
+                pass
+
+        return BotAPIHandler
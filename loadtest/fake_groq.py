@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# loadtest/fake_groq.py
+# Developer: Ahmad Raza
+# Local OpenAI-compatible LLM stand-in with configurable latency, token rate and error injection
+
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_WORDS = ("bhai dekho yeh concept simple hai pehle basics samjho phir practice karo exam mein "
+          "important points yaad rakho example ke saath the answer depends on context step by step "
+          "approach follow karo regular revision se confidence aata hai").split()
+
+
+def filler_text(rng: random.Random, tokens: int) -> str:
+    """Roughly `tokens` tokens of Hinglish prose in short paragraphs"""
+    words = [rng.choice(_WORDS) for _ in range(max(1, int(tokens * 0.75)))]
+    sentences = [" ".join(words[i:i + 12]).capitalize() + "." for i in range(0, len(words), 12)]
+    return "\n\n".join(" ".join(sentences[i:i + 4]) for i in range(0, len(sentences), 4))
+
+
+class FakeGroq:
+    """Threaded HTTP server answering /openai/v1/chat/completions and /openai/v1/models.
+
+    Each completion waits a time-to-first-token drawn from a lognormal (median ttft, spread sigma),
+    then completion_tokens / tokens_per_second. Completion length is lognormal around
+    median_tokens and capped by max_tokens. error_rate answers 500/503 and rate_limit_rate 429.
+    All randomness comes from one seeded generator, so a run is reproducible.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, ttft: float = 0.4, sigma: float = 0.5,
+                 tokens_per_second: float = 250.0, median_tokens: int = 350, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, seed: int = 7):
+        self.ttft = ttft
+        self.sigma = sigma
+        self.tokens_per_second = tokens_per_second
+        self.median_tokens = median_tokens
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.stats = Counter()
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Value for GROQ_BASE_URL"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="fake-groq", daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _plan(self, max_tokens: int):
+        """(status, delay seconds, completion tokens, reply seed) for one request"""
+        with self._lock:
+            roll = self._rng.random()
+            if roll < self.rate_limit_rate:
+                return 429, 0.0, 0, 0
+            if roll < self.rate_limit_rate + self.error_rate:
+                return self._rng.choice((500, 503)), self.ttft, 0, 0
+            ttft = self.ttft * math.exp(self._rng.gauss(0.0, self.sigma))
+            tokens = int(self.median_tokens * math.exp(self._rng.gauss(0.0, self.sigma)))
+            tokens = max(1, min(tokens, max_tokens))
+            return 200, ttft + tokens / self.tokens_per_second, tokens, self._rng.getrandbits(32)
+
+    def _completion(self, request: dict):
+        max_tokens = int(request.get("max_tokens") or 1024)
+        status, delay, tokens, seed = self._plan(max_tokens)
+
+        with self._lock:
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            time.sleep(delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self.stats["requests"] += 1
+                self.stats[f"http_{status}"] += 1
+                self.stats["completion_tokens"] += tokens
+
+        if status != 200:
+            return status, {"error": {"message": f"injected {status}", "type": "loadtest"}}
+
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in request.get("messages", [])) // 4
+        return 200, {
+            "id": f"chatcmpl-loadtest-{seed:08x}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "loadtest"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": filler_text(random.Random(seed), tokens)},
+                "finish_reason": "length" if tokens >= max_tokens else "stop",
+            }],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": tokens,
+                      "total_tokens": prompt_tokens + tokens},
+        }
+
+    def _handler_class(self):
+        fake = self
+
+        class GroqHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status: int, payload: dict):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.end_headers()
+                try:
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass    # Client gave up (timeout) or the bot stopped
+
+            def do_GET(self):
+                if self.path.endswith("/models"):
+                    self._reply(200, {"object": "list", "data": [
+                        {"id": "llama3-70b-8192", "object": "model", "created": 0, "owned_by": "loadtest"},
+                        {"id": "llama3-8b-8192", "object": "model", "created": 0, "owned_by": "loadtest"},
+                    ]})
+                else:
+                    self._reply(404, {"error": {"message": "not found"}})
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if not self.path.endswith("/chat/completions"):
+                    self._reply(404, {"error": {"message": "not found"}})
+                    return
+                self._reply(*fake._completion(json.loads(body or b"{}")))
+
+            def log_message(self, *args):
+                pass
+
+        return GroqHandler
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+# loadtest/run.py
+# Developer: Ahmad Raza
+# Offline load test: the real bot (main.py) against the fake Bot API and fake Groq, driven by N users
+#
+# Usage: python -m loadtest.run [--users 20] [--duration 60] [--think 2.0] [--tap-rate 0.3]
+#                               [--llm-ttft 0.4] [--llm-sigma 0.5] [--llm-tps 250] [--llm-tokens 350]
+#                               [--llm-errors 0.0] [--llm-429 0.0] [--seed 7] [--json results.json]
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from loadtest.fake_bot_api import FakeBotAPI
+from loadtest.fake_groq import FakeGroq
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files the bot opens relative to its working directory
+_SHARED_PATHS = ("locales", "data", "latex_template.tex")
+
+# (weight, language_code, text): what real users send, across scripts, lengths and intents
+MESSAGES = [
+    (6, "hi", "hello"),
+    (3, "en", "thanks bhai"),
+    (2, "en", "ok"),
+    (6, "hi", "Photosynthesis kya hota hai? Simple mein samjhao"),
+    (5, "hi", "प्रकाश संश्लेषण की प्रक्रिया को विस्तार से समझाइए"),
+    (5, "en", "How do I prepare for a software engineering interview in 3 months?"),
+    (4, "hi", "Python mein list aur tuple mein kya difference hai, example ke saath batao"),
+    (4, "ur", "مجھے انگریزی بولنے کی مشق کیسے کرنی چاہیے؟"),
+    (3, "bn", "পরীক্ষার জন্য কীভাবে পড়াশোনা করব?"),
+    (3, "ta", "வேலை நேர்காணலுக்கு எப்படி தயாராவது?"),
+    (3, "hi", "Ghar baithe online paise kaise kamaye? Students ke liye best options"),
+    (3, "en", "Write a short motivational message for someone who failed an exam"),
+    (2, "hi", "Mera breakup ho gaya hai, bahut bura lag raha hai. Kya karun?"),
+    (2, "hi", "Ek funny joke sunao"),
+    (1, "hi", "Full notes on Newton's laws of motion"),
+    (1, "en", "/help"),
+]
+
+_NAMES = ["Aarav", "Priya", "Rahul", "Ananya", "Imran", "Sneha", "Arjun", "Fatima", "Karthik", "Meera"]
+
+# Sends that count as the bot answering; sendChatAction and answerCallbackQuery do not
+_REPLY_METHODS = {"sendMessage", "editMessageText", "sendDocument", "sendPhoto"}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))]
+
+
+class ChatInbox:
+    """Replies the fake Bot API recorded for one chat, handed to the user coroutine"""
+
+    def __init__(self):
+        self.replies: asyncio.Queue = asyncio.Queue()
+        self.keyboard: Optional[dict] = None      # Last inline keyboard the bot showed: {message_id, text, buttons}
+
+
+class LoadDriver:
+    """Simulated users: each sends a message or taps a button, waits for the full reply, thinks, repeats"""
+
+    def __init__(self, api: FakeBotAPI, users: int, think: float, tap_rate: float, settle: float,
+                 timeout: float, seed: int):
+        self.api = api
+        self.users = users
+        self.think = think
+        self.tap_rate = tap_rate
+        self.settle = settle
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.inboxes: Dict[int, ChatInbox] = defaultdict(ChatInbox)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.timeouts = 0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.polling = asyncio.Event()
+
+    def on_call(self, method: str, params: dict, result, at: float):
+        """Fake Bot API hook (server thread): route replies to their chat's inbox"""
+        if method == "getUpdates":
+            self.loop.call_soon_threadsafe(self.polling.set)
+        elif method in _REPLY_METHODS and isinstance(result, dict):
+            self.loop.call_soon_threadsafe(self._deliver, result["chat"]["id"], params, result, at)
+
+    def _deliver(self, chat_id, params: dict, result: dict, at: float):
+        inbox = self.inboxes[int(chat_id)]
+        markup = params.get("reply_markup")
+        if isinstance(markup, dict) and markup.get("inline_keyboard"):
+            buttons = [button["callback_data"] for row in markup["inline_keyboard"] for button in row
+                       if button.get("callback_data")]
+            inbox.keyboard = {"message_id": result["message_id"], "text": params.get("text", ""), "buttons": buttons}
+        inbox.replies.put_nowait((at, bool(markup)))
+
+    async def _await_reply(self, inbox: ChatInbox) -> Optional[float]:
+        """Time of the last reply to one action, or None on timeout.
+
+        A reply carrying a keyboard ends the answer (it goes on the last chunk); otherwise the answer
+        is over once nothing more arrives for `settle` seconds.
+        """
+        try:
+            at, final = await asyncio.wait_for(inbox.replies.get(), self.timeout)
+        except asyncio.TimeoutError:
+            return None
+        while not final:
+            try:
+                at, final = await asyncio.wait_for(inbox.replies.get(), self.settle)
+            except asyncio.TimeoutError:
+                break
+        return at
+
+    async def _user(self, index: int, deadline: float):
+        rng = random.Random(self.rng.getrandbits(32))
+        user_id = 500000 + index
+        name = _NAMES[index % len(_NAMES)]
+        inbox = self.inboxes[user_id]
+        weights = [weight for weight, _, _ in MESSAGES]
+
+        # Stagger arrivals, then open with /start like real users
+        await asyncio.sleep(rng.uniform(0, self.think))
+        action = ("start", "hi", "/start")
+        while time.perf_counter() < deadline:
+            kind, language, payload = action
+            while not inbox.replies.empty():
+                inbox.replies.get_nowait()
+
+            sent = time.perf_counter()
+            if kind == "tap":
+                keyboard = inbox.keyboard
+                self.api.push_callback(user_id, name, language, payload, keyboard["message_id"], keyboard["text"])
+            else:
+                self.api.push_message(user_id, name, language, payload)
+
+            answered = await self._await_reply(inbox)
+            if answered is None:
+                self.timeouts += 1
+            else:
+                self.latencies[kind].append(answered - sent)
+
+            await asyncio.sleep(rng.expovariate(1.0 / self.think) if self.think else 0)
+            if inbox.keyboard and inbox.keyboard["buttons"] and rng.random() < self.tap_rate:
+                action = ("tap", "hi", rng.choice(inbox.keyboard["buttons"]))
+            else:
+                _, language, text = rng.choices(MESSAGES, weights)[0]
+                action = ("message", language, text)
+
+    async def run(self, duration: float) -> float:
+        """Drive all users for `duration` seconds; returns the measured wall time"""
+        started = time.perf_counter()
+        await asyncio.gather(*(self._user(index, started + duration) for index in range(self.users)))
+        return time.perf_counter() - started
+
+
+def _workdir() -> str:
+    """Scratch working directory so logs/, temp/ and user_data/ stay out of the checkout"""
+    path = tempfile.mkdtemp(prefix="ostaad-loadtest-")
+    for name in _SHARED_PATHS:
+        os.symlink(os.path.join(ROOT, name), os.path.join(path, name))
+    return path
+
+
+def _start_bot(api: FakeBotAPI, llm: FakeGroq, workdir: str) -> subprocess.Popen:
+    env = dict(os.environ,
+               TELEGRAM_BOT_TOKEN="123456:loadtest",
+               GROQ_API_KEY="loadtest",
+               ADMIN_USER_ID="1",
+               TELEGRAM_API_BASE_URL=api.base_url,
+               GROQ_BASE_URL=llm.base_url,
+               AI_TOOLS_API_URL=f"{llm.base_url}/openai/v1/chat/completions",
+               AI_TOOLS_API_KEY="loadtest",
+               HEALTH_PORT="0",             # Don't collide with a bot already serving probes on 8080
+               PYTHONUNBUFFERED="1")
+    log = open(os.path.join(workdir, "bot.log"), "wb")
+    return subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py")], cwd=workdir, env=env,
+                            stdout=log, stderr=subprocess.STDOUT)
+
+
+def _summary(driver: LoadDriver, wall: float, api: FakeBotAPI, llm: FakeGroq) -> dict:
+    latencies = [value for values in driver.latencies.values() for value in values]
+    result = {
+        "users": driver.users,
+        "wall_seconds": round(wall, 2),
+        "completed": len(latencies),
+        "timeouts": driver.timeouts,
+        "throughput_per_second": round(len(latencies) / wall, 3) if wall else 0.0,
+        "latency": {},
+        "bot_api_calls": dict(api.calls),
+        "llm": dict(llm.stats, peak_in_flight=llm.peak_in_flight),
+    }
+    for kind, values in [("all", latencies)] + sorted(driver.latencies.items()):
+        result["latency"][kind] = {
+            "count": len(values),
+            "p50": round(percentile(values, 0.50), 3),
+            "p95": round(percentile(values, 0.95), 3),
+            "p99": round(percentile(values, 0.99), 3),
+            "max": round(max(values), 3) if values else 0.0,
+        }
+    return result
+
+
+def _print_summary(result: dict):
+    print(f"Users: {result['users']}  wall: {result['wall_seconds']}s  completed: {result['completed']}  "
+          f"timeouts: {result['timeouts']}")
+    print(f"Throughput: {result['throughput_per_second']:.2f} interactions/s")
+    print("End-to-end latency (s)      n      p50      p95      p99      max")
+    for kind, entry in result["latency"].items():
+        print(f"  {kind:<20} {entry['count']:>6} {entry['p50']:8.2f} {entry['p95']:8.2f} "
+              f"{entry['p99']:8.2f} {entry['max']:8.2f}")
+    print(f"LLM: {result['llm']}")
+    print(f"Bot API calls: {result['bot_api_calls']}")
+
+
+async def _main(args) -> dict:
+    driver = None
+    api = FakeBotAPI(on_call=lambda *call: driver.on_call(*call))
+    llm = FakeGroq(ttft=args.llm_ttft, sigma=args.llm_sigma, tokens_per_second=args.llm_tps,
+                   median_tokens=args.llm_tokens, error_rate=args.llm_errors,
+                   rate_limit_rate=args.llm_429, seed=args.seed)
+    driver = LoadDriver(api, args.users, args.think, args.tap_rate, args.settle, args.timeout, args.seed)
+    driver.loop = asyncio.get_running_loop()
+
+    workdir = _workdir()
+    api.start()
+    llm.start()
+    bot = _start_bot(api, llm, workdir)
+    try:
+        try:
+            await asyncio.wait_for(driver.polling.wait(), args.startup_timeout)
+        except asyncio.TimeoutError:
+            raise SystemExit(f"Bot did not start polling within {args.startup_timeout}s, "
+                             f"see {os.path.join(workdir, 'bot.log')}")
+        wall = await driver.run(args.duration)
+        return _summary(driver, wall, api, llm)
+    finally:
+        bot.terminate()
+        try:
+            bot.wait(10)
+        except subprocess.TimeoutExpired:
+            bot.kill()
+        api.stop()
+        llm.stop()
+        if args.keep_workdir:
+            print(f"Bot working directory kept at {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test against fake Telegram and Groq servers")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to drive load")
+    parser.add_argument("--think", type=float, default=2.0, help="Mean think time between actions (s)")
+    parser.add_argument("--tap-rate", type=float, default=0.3, help="Chance the next action is a button tap")
+    parser.add_argument("--settle", type=float, default=1.5, help="Quiet time that ends a reply without keyboard")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Give up on a reply after this long")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--llm-ttft", type=float, default=0.4, help="Median time to first token (s)")
+    parser.add_argument("--llm-sigma", type=float, default=0.5, help="Lognormal spread of latency and length")
+    parser.add_argument("--llm-tps", type=float, default=250.0, help="Generated tokens per second")
+    parser.add_argument("--llm-tokens", type=int, default=350, help="Median completion tokens")
+    parser.add_argument("--llm-errors", type=float, default=0.0, help="Fraction answered with 500/503")
+    parser.add_argument("--llm-429", type=float, default=0.0, help="Fraction answered with 429")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--keep-workdir", action="store_true", help="Keep the bot's logs and data")
+    args = parser.parse_args()
+
+    result = asyncio.run(_main(args))
+    _print_summary(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
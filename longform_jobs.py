@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# longform_jobs.py
+# Developer: Ahmad Raza
+# Background long-form generation (full notes, articles) written section by section
+
+import asyncio
+import functools
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from config import Config
+from generation_profiles import enforce_length
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_OUTLINE = ["Introduction", "Key Concepts", "Examples", "Common Mistakes", "Summary"]
+_OUTLINE_PREFIX = re.compile(r"^\s*(?:[-*•#]+|\d+[.)]|section\s+\d+[:.)-]?)\s*", re.IGNORECASE)
+
+# Prompts per job kind: how to outline and how long each section should be
+JOB_KINDS = {
+    "notes": {
+        "outline": "Plan complete study notes on: {topic}. Reply with {count} short section titles, "
+                   "one per line, no numbering and nothing else.",
+        "section": "You are writing complete study notes on \"{topic}\" with these sections: {titles}. "
+                   "Write only section {number}, \"{title}\", in about {words} words, with examples. "
+                   "Do not repeat other sections and do not add an introduction or sign-off.",
+    },
+    "article": {
+        "outline": "Plan an SEO-optimized article on: {topic}. Reply with {count} H2 headings "
+                   "(including keyword-rich ones), one per line, no numbering and nothing else.",
+        "section": "You are writing an SEO-optimized article on \"{topic}\" with these headings: {titles}. "
+                   "Write only the part under \"{title}\" in about {words} words, using the topic's keywords "
+                   "naturally. Do not repeat other parts.",
+    },
+}
+
+
+class LongformBusyError(Exception):
+    """The user already has a job, or LONGFORM_MAX_JOBS are running"""
+
+
+# A trigger only counts in a request: at the start ("full notes on ..."), after a request verb
+# ("can you write me a full article"), before a topic or verb ("full notes on/do/chahiye"), as the
+# Hinglish object at the end ("photosynthesis ke poore notes"), or anywhere if it is a request itself
+# ("essay likho"). "I lost my full notes" is not a request.
+_ASK_VERBS = r"(?:give|send|write|make|prepare|share|provide|create|need|want)"
+_ASK_AFTER = r"(?:on|of|about|for|regarding|chahiye|chaiye|do|dedo|bhejo|likho|banao|likh\s+do|bana\s+do)"
+
+
+@functools.lru_cache(maxsize=4)
+def _request_pattern(triggers: Tuple[str, ...]) -> re.Pattern:
+    alternatives = "|".join(re.escape(trigger) for trigger in sorted(triggers, key=len, reverse=True))
+    trigger = rf"(?:{alternatives})"
+    asking = [re.escape(t) for t in triggers if re.fullmatch(_ASK_AFTER, t.split()[-1])] or ["(?!)"]
+    return re.compile(
+        rf"\b(?:{'|'.join(asking)})\b"
+        rf"|^\W*(?:(?:please|pls|plz|bhai|sir)\W+)?{trigger}\b"
+        rf"|\b{_ASK_VERBS}\s+(?:me\s+)?(?:(?:the|a|an|some)\s+)?{trigger}\b"
+        rf"|\b{trigger}\s+{_ASK_AFTER}\b"
+        rf"|\b(?:ke|ka|ki|pe|par|per)\s+{trigger}\W*$"
+    )
+
+
+def is_longform_request(message: str) -> bool:
+    """Message asks for full notes / a long article rather than a chat answer"""
+    lowered = message.lower()
+    # Cheap substring test first; most messages mention no trigger at all
+    if not any(trigger in lowered for trigger in Config.LONGFORM_TRIGGERS):
+        return False
+    return _request_pattern(tuple(Config.LONGFORM_TRIGGERS)).search(lowered) is not None
+
+
+def parse_outline(text: str, limit: int = Config.LONGFORM_MAX_SECTIONS) -> List[str]:
+    """Section titles from an outline reply; falls back to a generic outline"""
+    titles = []
+    for line in text.splitlines():
+        title = _OUTLINE_PREFIX.sub("", line).strip().strip("*").strip()
+        if title and title not in titles:
+            titles.append(title)
+    return titles[:limit] if len(titles) >= 2 else FALLBACK_OUTLINE[:limit]
+
+
+class LongformJobs:
+    """Runs long outputs as per-user background tasks on their own thread pool.
+
+    Model calls go through a dedicated executor (LONGFORM_WORKERS threads), so long jobs never
+    occupy the default executor that interactive replies use.
+    """
+
+    def __init__(self, ai_service):
+        self.ai_service = ai_service
+        self.executor = ThreadPoolExecutor(max_workers=Config.LONGFORM_WORKERS, thread_name_prefix="longform")
+        self.jobs: Dict[int, asyncio.Task] = {}
+        self.stats = {"started": 0, "completed": 0, "cancelled": 0, "failed": 0}
+
+    def is_running(self, user_id: int) -> bool:
+        return user_id in self.jobs
+
+    def start(self, user_id: int, topic: str, language: str, kind: str,
+              deliver: Callable[[str], Awaitable], progress: Callable[[int, int], Awaitable],
+              finished: Callable[[str], Awaitable]) -> asyncio.Task:
+        """Start a job; deliver(section text), progress(done, total) and finished(status) are awaited"""
+        if user_id in self.jobs:
+            raise LongformBusyError("User already has a long-form job")
+        if len(self.jobs) >= Config.LONGFORM_MAX_JOBS:
+            raise LongformBusyError(f"{len(self.jobs)} long-form jobs running")
+
+        task = asyncio.create_task(self._run(user_id, topic, language, kind, deliver, progress, finished))
+        self.jobs[user_id] = task
+        task.add_done_callback(lambda _: self.jobs.pop(user_id, None))
+        self.stats["started"] += 1
+        return task
+
+    def cancel(self, user_id: int) -> bool:
+        """Cancel a user's job; sections already being written finish in their thread and are dropped"""
+        task = self.jobs.get(user_id)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    async def _complete(self, user_id: int, kind: str, language: str, prompt: str, max_tokens: int) -> str:
+        # LONGFORM_PROFILE's model and sampling, read per call so /config changes apply to running jobs;
+        # the breaker and in_flight accounting are the same as for chat replies
+        params = self.ai_service.generation_profiles.select(profile_name=Config.LONGFORM_PROFILE)
+        params["max_tokens"] = max_tokens
+        messages = [
+            {"role": "system", "content": self.ai_service._get_ostaad_ai_system_prompt(language, "neutral")},
+            {"role": "user", "content": prompt},
+        ]
+        response = await self.ai_service.complete(params, messages, self.executor)
+        self.ai_service.usage.record(user_id, f"longform_{kind}", language, params["model"], response.usage)
+        choice = response.choices[0]
+        text = choice.message.content or ""
+        # A section that ran out of tokens is cut back to its last full sentence instead of mid-word
+        return enforce_length(text, len(text) - 1) if choice.finish_reason == "length" else text
+
+    async def _run(self, user_id: int, topic: str, language: str, kind: str, deliver, progress, finished):
+        prompts = JOB_KINDS[kind]
+        status = "failed"
+        sections: List[asyncio.Task] = []
+        try:
+            outline = await self._complete(
+                user_id, kind, language, prompts["outline"].format(topic=topic, count=Config.LONGFORM_MAX_SECTIONS), 200
+            )
+            titles = parse_outline(outline)
+            await progress(0, len(titles))
+
+            slots = asyncio.Semaphore(Config.LONGFORM_SECTION_CONCURRENCY)
+            words = int(Config.LONGFORM_SECTION_TOKENS * Config.WORDS_PER_TOKEN)
+
+            async def write(number: int, title: str) -> str:
+                async with slots:
+                    prompt = prompts["section"].format(topic=topic, titles="; ".join(titles),
+                                                       number=number, title=title, words=words)
+                    return await self._complete(user_id, kind, language, prompt, Config.LONGFORM_SECTION_TOKENS)
+
+            sections = [asyncio.create_task(write(number, title)) for number, title in enumerate(titles, 1)]
+
+            # Sections are written in parallel but delivered in order, each as soon as it and
+            # everything before it is done
+            for number, (title, section) in enumerate(zip(titles, sections), 1):
+                await deliver(f"**{number}. {title}**\n\n{await section}")
+                await progress(number, len(titles))
+
+            status = "completed"
+        except asyncio.CancelledError:
+            status = "cancelled"
+        except Exception as e:
+            logger.error(f"Long-form job on '{topic[:50]}' failed: {e}")
+        finally:
+            for section in sections:
+                section.cancel()
+            self.stats[status] += 1
+
+        try:
+            await finished(status)
+        except Exception as e:
+            logger.error(f"Failed to report long-form job status: {e}")
+
+    def shutdown(self):
+        """Cancel running jobs and stop the worker threads"""
+        for task in list(self.jobs.values()):
+            task.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
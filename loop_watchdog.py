@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# loop_watchdog.py
+# Developer: Ahmad Raza
+# Event-loop lag watchdog: measures scheduling lag and samples the loop thread's stack when it stalls
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from config import Config
+from perf_tracing import Histogram
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _describe(frame: traceback.FrameSummary) -> str:
+    path = frame.filename
+    if path.startswith(PROJECT_ROOT):
+        path = os.path.relpath(path, PROJECT_ROOT)
+    else:
+        path = os.path.basename(path)
+    return f"{path}:{frame.lineno} {frame.name}"
+
+
+def blocking_site(stack: traceback.StackSummary) -> str:
+    """Deepest frame of our own code, plus the library call it was stuck in"""
+    own = [frame for frame in stack
+           if frame.filename.startswith(PROJECT_ROOT) and frame.filename != __file__]
+    leaf = stack[-1]
+    if not own:
+        return _describe(leaf)
+    site = _describe(own[-1])
+    return site if own[-1] is leaf else f"{site} -> {_describe(leaf)}"
+
+
+class LoopWatchdog:
+    """A heartbeat coroutine plus a helper thread that watches it.
+
+    The coroutine wakes every `interval` seconds; how late it wakes is the loop lag. While the
+    heartbeat is more than `threshold_ms` overdue, the helper thread samples the loop thread's stack
+    (sys._current_frames) every threshold/2. Once the loop runs again, the stall's length is
+    split across the sampled call sites in proportion to their samples.
+    """
+
+    def __init__(self, interval: float = Config.LOOP_WATCHDOG_INTERVAL,
+                 threshold_ms: float = Config.LOOP_LAG_THRESHOLD_MS):
+        self.interval = interval
+        self.threshold = threshold_ms / 1e3
+        self.lag = Histogram()
+        self.sites: Dict[str, Dict[str, float]] = {}
+        self.stalls = 0
+        self._beat = time.monotonic()
+        self._loop_thread: Optional[int] = None
+        self._pending: List[str] = []
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start watching the running loop"""
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._beat = now
+            lag = max(0.0, now - expected)
+            self.lag.add(lag * 1e3)
+
+            # Samples from a shorter hiccup are dropped; a stall too short to sample still counts
+            samples, self._pending = self._pending, []
+            if lag >= self.threshold:
+                self.stalls += 1
+                if samples:
+                    self._charge(samples, lag)
+
+    def _charge(self, samples: List[str], lag: float):
+        shares = {site: samples.count(site) / len(samples) * lag * 1e3 for site in samples}
+        for site, ms in shares.items():
+            entry = self.sites.setdefault(site, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+        ranked = sorted(shares.items(), key=lambda item: -item[1])
+        breakdown = ", ".join(f"{site} ~{ms:.0f}ms" for site, ms in ranked)
+        logger.warning(f"Event loop blocked for {lag * 1e3:.0f}ms: {breakdown}")
+
+    def _watch(self):
+        """Helper thread: sample the loop thread's stack while the heartbeat is overdue"""
+        while not self._stop.wait(self.threshold / 2):
+            # The heartbeat is due every `interval`; only lateness beyond that counts as lag
+            if time.monotonic() - self._beat < self.interval + self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            del frame
+            if stack:
+                self._pending.append(blocking_site(stack))
+
+    def heartbeat_age(self) -> float:
+        """Seconds since the heartbeat coroutine last ran"""
+        return time.monotonic() - self._beat
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "samples": self.lag.count,
+            "p50_ms": self.lag.percentile(0.50),
+            "p99_ms": self.lag.percentile(0.99),
+            "max_ms": self.lag.max_ms,
+            "stalls": self.stalls,
+        }
+
+    def format_report(self, top: int = Config.LOOP_WATCHDOG_TOP) -> str:
+        """Plain-text lag summary and worst call sites for the admin /lag command"""
+        stats = self.get_stats()
+        lines = [f"Loop lag: p50 {stats['p50_ms']:.1f}ms, p99 {stats['p99_ms']:.1f}ms, "
+                 f"max {stats['max_ms']:.0f}ms over {stats['samples']:,} beats",
+                 f"Stalls over {self.threshold * 1e3:.0f}ms: {self.stalls}"]
+        ranked = sorted(self.sites.items(), key=lambda item: -item[1]["total_ms"])
+        lines.extend(f"  {site}: {entry['count']}x, {entry['total_ms']:.0f}ms total, {entry['max_ms']:.0f}ms max"
+                     for site, entry in ranked[:top])
+        return "\n".join(lines)
+
+
+_watchdog: Optional[LoopWatchdog] = None
+
+
+def get_loop_watchdog() -> LoopWatchdog:
+    """Get the shared loop watchdog"""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = LoopWatchdog()
+    return _watchdog
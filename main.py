@@ -8,32 +8,49 @@ import asyncio
 import sys
 import os
 import locale
-
-# Set UTF-8 encoding
-try:
-    locale.setlocale(locale.LC_ALL, 'C.UTF-8')
-except:
-    try:
-        locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-    except:
-        pass
+from io import BytesIO
 
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, CallbackQueryHandler
 from config import Config
 from enhanced_handlers import EnhancedOstaadHandlers
 from utils import Utils
+from message_catalog import get_catalog
+from warmup import StartupWarmup
+from pdf_export import get_exporter
+from ai_integration import get_tools_client
+from grammar_service import get_grammar_service
+from perf_tracing import get_tracer, traced
+from usage_tracker import get_usage_tracker
+from rate_limiter import get_rate_limiter
+from memory_inspector import get_memory_inspector
+from loop_watchdog import get_loop_watchdog
+from health_server import HealthServer
+from runtime_config import ConfigError, get_runtime_config, parse_value, pinned_by
 
-# Configure enhanced logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO,
-    handlers=[
-        logging.FileHandler('logs/ostaad_ai.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+def configure_locale():
+    """Set UTF-8 encoding"""
+    try:
+        locale.setlocale(locale.LC_ALL, 'C.UTF-8')
+    except:
+        try:
+            locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+        except:
+            pass
+
+def configure_logging():
+    """Configure enhanced logging (after the logs directory exists)"""
+    os.makedirs(Config.LOGS_DIR, exist_ok=True)
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=logging.INFO,
+        handlers=[
+            logging.FileHandler(os.path.join(Config.LOGS_DIR, 'ostaad_ai.log'), encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
 class EnhancedOstaadAIBot:
     def __init__(self):
         # Validate configuration
@@ -46,10 +63,21 @@ class EnhancedOstaadAIBot:
         self.handlers = EnhancedOstaadHandlers()
         
         # Create application with enhanced settings
-        self.application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+        self.application = (
+            Application.builder()
+            .token(Config.TELEGRAM_BOT_TOKEN)
+            .base_url(Config.TELEGRAM_API_BASE_URL)
+            .build()
+        )
         
         # Setup handlers
         self._setup_handlers()
+        self._register_memory_stores()
+        self._register_runtime_config()
+        
+        # Warm-up runs alongside polling startup (see start_bot)
+        self.warmup = StartupWarmup(self.handlers, self.application)
+        self.health = HealthServer(self.application, self.warmup, self.handlers.ai_service)
         
         logger.info(f"🎯 {Config.BOT_NAME} {Config.VERSION} initialized successfully")
         logger.info(f"🧠 {Config.TAGLINE}")
@@ -67,91 +95,290 @@ class EnhancedOstaadAIBot:
         self.application.add_handler(CommandHandler("stats", self._stats_command))
         self.application.add_handler(CommandHandler("categories", self._categories_command))
         self.application.add_handler(CommandHandler("reset", self._reset_command))
+        self.application.add_handler(CommandHandler("length", self.handlers.length_command))
+        self.application.add_handler(CommandHandler("export", self.handlers.export_command))
+        self.application.add_handler(CommandHandler("humanize", self.handlers.humanize_command))
+        self.application.add_handler(CommandHandler("seo", self.handlers.seo_command))
+        self.application.add_handler(CommandHandler("improve", self.handlers.improve_command))
+        self.application.add_handler(CommandHandler("grammar", self.handlers.grammar_command))
+        self.application.add_handler(CommandHandler("longform", self.handlers.longform_command))
+        self.application.add_handler(CommandHandler("budgets", self._budgets_command))
+        self.application.add_handler(CommandHandler("intents", self._intents_command))
+        self.application.add_handler(CommandHandler("perf", self._perf_command))
+        self.application.add_handler(CommandHandler("cost", self._cost_command))
+        self.application.add_handler(CommandHandler("banuser", self._banuser_command))
+        self.application.add_handler(CommandHandler("unbanuser", self._unbanuser_command))
+        self.application.add_handler(CommandHandler("bans", self._bans_command))
+        self.application.add_handler(CommandHandler("memory", self._memory_command))
+        self.application.add_handler(CommandHandler("lag", self._lag_command))
+        self.application.add_handler(CommandHandler("config", self._config_command))
         
         # Callback query handler for enhanced inline buttons
-        self.application.add_handler(CallbackQueryHandler(self.handlers.button_callback))
+        self.application.add_handler(CallbackQueryHandler(traced(self.handlers.button_callback)))
         
         # Enhanced message handler for all text messages (NO AHMAD INTRO FILTER)
         self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, self.handlers.handle_message)
+            MessageHandler(filters.TEXT & ~filters.COMMAND, traced(self.handlers.handle_message))
         )
         
         logger.info("✅ All enhanced Ostaad AI handlers have been set up successfully")
     
+    def _register_memory_stores(self):
+        """In-process stores reported by /memory"""
+        inspector = get_memory_inspector()
+        ai_service = self.handlers.ai_service
+        stores = {
+            "conversation_history": lambda: ai_service.conversation_history,
+            "user_knowledge_levels": lambda: ai_service.user_knowledge_levels,
+            "user_moods": lambda: ai_service.user_moods,
+            "prompt_cache": lambda: ai_service._prompt_cache,
+            "generation_profile_lengths": lambda: ai_service.generation_profiles.lengths,
+            "user_sessions": lambda: self.handlers.user_sessions,
+            "broadcast_messages": lambda: self.handlers.broadcast_messages,
+            "user_preferences": lambda: self.handlers.user_preferences.user_data,
+            "language_states": lambda: self.handlers.language_tracker.states,
+            "fast_path_phrases": lambda: self.handlers.fast_path.phrases,
+            "latex_cache": lambda: self.handlers.latex_renderer.cache,
+            "longform_jobs": lambda: self.handlers.longform.jobs,
+            "grammar_cache": lambda: get_grammar_service().cache,
+            "usage_totals": lambda: get_usage_tracker().days,
+            "rate_limit_state": lambda: get_rate_limiter().tat,
+            "bans": lambda: get_rate_limiter().bans,
+            "perf_histograms": lambda: get_tracer().histograms,
+            "message_catalog": lambda: get_catalog()._languages,
+        }
+        for name, getter in stores.items():
+            inspector.register(name, getter)
+    
+    def _register_runtime_config(self):
+        """Re-apply /config changes to objects that copied a Config value when they were built"""
+        runtime = get_runtime_config()
+        ai_service = self.handlers.ai_service
+        
+        def apply_breaker():
+            ai_service.groq_breaker.failure_threshold = Config.GROQ_BREAKER_FAILURES
+            ai_service.groq_breaker.reset_timeout = Config.GROQ_BREAKER_RESET
+        
+        def apply_export_limit():
+            get_exporter().max_concurrent = Config.EXPORT_MAX_CONCURRENT
+        
+        def apply_grammar_limit():
+            get_grammar_service().max_concurrent = Config.GRAMMAR_MAX_CONCURRENT
+        
+        def apply_quota():
+            get_usage_tracker().daily_quota = Config.DAILY_TOKEN_QUOTA
+        
+        def apply_slow_threshold():
+            get_tracer().slow_ms = Config.PERF_SLOW_UPDATE_MS
+        
+        runtime.on_change(["RATE_LIMIT", "RATE_BURST", "RATE_STRIKES_BEFORE_BAN"], lambda: get_rate_limiter().configure(
+            Config.RATE_LIMIT, Config.RATE_BURST, Config.RATE_STRIKES_BEFORE_BAN))
+        runtime.on_change(["GROQ_BREAKER_FAILURES", "GROQ_BREAKER_RESET"], apply_breaker)
+        runtime.on_change(["GRAMMAR_CACHE_SIZE"], lambda: get_grammar_service().set_cache_size(Config.GRAMMAR_CACHE_SIZE))
+        runtime.on_change(["LATEX_CACHE_SIZE"], lambda: self.handlers.latex_renderer.set_cache_size(Config.LATEX_CACHE_SIZE))
+        runtime.on_change(["LATEX_WORKERS"], lambda: self.handlers.latex_renderer.resize(Config.LATEX_WORKERS))
+        runtime.on_change(["AI_TOOLS_MAX_CONCURRENT"], lambda: get_tools_client().resize(Config.AI_TOOLS_MAX_CONCURRENT))
+        runtime.on_change(["EXPORT_MAX_CONCURRENT"], apply_export_limit)
+        runtime.on_change(["GRAMMAR_MAX_CONCURRENT"], apply_grammar_limit)
+        runtime.on_change(["DAILY_TOKEN_QUOTA"], apply_quota)
+        runtime.on_change(["PERF_SLOW_UPDATE_MS"], apply_slow_threshold)
+    
     async def _stats_command(self, update, context):
         """Show bot statistics with desi style"""
         user_info = Utils.get_user_info(update)
         
         if not Utils.is_admin(user_info['id']):
-            await update.message.reply_text("Admin access chahiye bhai statistics ke liye!")
+            await update.message.reply_text(get_catalog().render('admin_required_stats'))
             return
         
-        stats_message = f"""**{Config.BOT_NAME} Statistics**
-
-**System Info:**
-• Version: {Config.VERSION}
-• Model: {Config.DEFAULT_MODEL}
-• Categories: {len(Config.KNOWLEDGE_CATEGORIES)}
-• Languages: {len(Config.SUPPORTED_LANGUAGES)}
-
-**Performance:**
-• Max Tokens: {Config.MAX_TOKENS}
-• Temperature: {Config.TEMPERATURE}
-• Response Timeout: {Config.REQUEST_TIMEOUT}s
-• Human-like Score: {Config.HUMAN_LIKE_SCORE}
-
-**Developer**: {Config.DEVELOPER}
-**Engine**: Pure Desi AI Excellence
-
-**Status**: Fully Operational aur Ready!"""
+        stats_message = get_catalog().render(
+            'stats',
+            category_count=len(Config.KNOWLEDGE_CATEGORIES),
+            language_count=len(Config.SUPPORTED_LANGUAGES),
+            max_tokens=Config.MAX_TOKENS,
+            temperature=Config.TEMPERATURE,
+            timeout=Config.REQUEST_TIMEOUT,
+            human_like_score=Config.HUMAN_LIKE_SCORE
+        )
         
         await update.message.reply_text(stats_message, parse_mode='Markdown')
     
+    async def _budgets_command(self, update, context):
+        """Show observed reply lengths per generation profile (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('budgets_admin_only'))
+            return
+        
+        await update.message.reply_text(self.handlers.ai_service.generation_profiles.format_stats())
+    
+    async def _intents_command(self, update, context):
+        """Show how many messages the canned-intent fast path answered (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        stats = self.handlers.fast_path.get_stats()
+        lines = [f"Fast path answered {stats['answered']} of {stats['checked']} messages ({stats['hit_rate']:.1%})"]
+        lines.extend(f"  {intent}: {count}" for intent, count in stats['hits'].items())
+        await update.message.reply_text("\n".join(lines))
+    
+    async def _perf_command(self, update, context):
+        """Show p50/p95/p99 latency per update stage (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        await update.message.reply_text(get_tracer().format_stats())
+    
+    async def _cost_command(self, update, context):
+        """Show token usage and estimated cost per model, user, category and language (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        # /cost 7 = last seven days
+        days = int(context.args[0]) if context.args and context.args[0].isdigit() else 1
+        await update.message.reply_text(get_usage_tracker().format_report(days=max(1, days)))
+    
+    async def _banuser_command(self, update, context):
+        """Ban a user for a number of minutes: /banuser <user_id> [minutes] (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        if not context.args or not context.args[0].isdigit():
+            await update.message.reply_text(get_catalog().render('ban_usage'))
+            return
+        
+        target = int(context.args[0])
+        minutes = Config.BAN_DURATION // 60
+        if len(context.args) > 1 and context.args[1].isdigit():
+            minutes = int(context.args[1])
+        get_rate_limiter().ban(target, minutes * 60)
+        await update.message.reply_text(get_catalog().render('ban_done', user_id=target, minutes=minutes))
+    
+    async def _unbanuser_command(self, update, context):
+        """Lift a ban: /unbanuser <user_id> (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        if not context.args or not context.args[0].isdigit():
+            await update.message.reply_text(get_catalog().render('ban_usage'))
+            return
+        
+        target = int(context.args[0])
+        key = 'unban_done' if get_rate_limiter().unban(target) else 'unban_missing'
+        await update.message.reply_text(get_catalog().render(key, user_id=target))
+    
+    async def _bans_command(self, update, context):
+        """Show rate-limit metrics and active bans (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        await update.message.reply_text(get_rate_limiter().format_stats())
+    
+    async def _memory_command(self, update, context):
+        """Memory per store and tracemalloc diffs: /memory [start|diff|top|stop] [file] (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        args = [arg.lower() for arg in context.args or []]
+        inspector = get_memory_inspector()
+        actions = {
+            "start": inspector.start_tracing,
+            "diff": inspector.diff,
+            "top": inspector.top_sites,
+            "stop": inspector.stop_tracing,
+        }
+        action = next((actions[arg] for arg in args if arg in actions), inspector.store_report)
+        report = action()
+        
+        # Long reports, or "/memory ... file", go out as a text file
+        if "file" in args or len(report) > Config.MAX_MESSAGE_LENGTH:
+            document = BytesIO(report.encode('utf-8'))
+            document.name = "memory_report.txt"
+            await update.message.reply_document(document)
+        else:
+            await update.message.reply_text(report)
+    
+    async def _lag_command(self, update, context):
+        """Show event-loop lag and the call sites that blocked it (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        await update.message.reply_text(get_loop_watchdog().format_report())
+    
+    async def _config_command(self, update, context):
+        """Show or change runtime settings: /config [set KEY=VALUE ...|reset KEY ...|reload|history] (admin only)"""
+        user_info = Utils.get_user_info(update)
+        
+        if not Utils.is_admin(user_info['id']):
+            await update.message.reply_text(get_catalog().render('admin_required'))
+            return
+        
+        runtime = get_runtime_config()
+        args = context.args or []
+        action = args[0].lower() if args else "show"
+        source = f"admin {user_info['id']}"
+        
+        try:
+            if action == "show":
+                await update.message.reply_text(runtime.format_current())
+                return
+            if action == "history":
+                await update.message.reply_text(runtime.format_history())
+                return
+            if action == "reload":
+                changes = runtime.reload(source)
+            elif action == "set" and len(args) > 1 and all("=" in arg for arg in args[1:]):
+                assignments = dict(arg.split("=", 1) for arg in args[1:])
+                changes = runtime.set({key: parse_value(value) for key, value in assignments.items()}, source)
+            elif action == "reset" and len(args) > 1:
+                changes = runtime.reset([arg.upper() for arg in args[1:]], source)
+            else:
+                await update.message.reply_text(get_catalog().render('config_usage'))
+                return
+        except ConfigError as e:
+            await update.message.reply_text(get_catalog().render('config_rejected', error=e))
+            return
+        
+        if not changes:
+            await update.message.reply_text(get_catalog().render('config_unchanged'))
+            return
+        lines = []
+        for name, (old, new) in changes.items():
+            line = f"{name}: {old} -> {new}" if name != "GENERATION_PROFILES" else f"{name} updated"
+            pinned = pinned_by(name)
+            if pinned:
+                line += f" (profiles not affected: {', '.join(pinned)})"
+            lines.append(line)
+        await update.message.reply_text(get_catalog().render('config_applied', changes="\n".join(lines)))
+    
     async def _categories_command(self, update, context):
         """Show available knowledge categories with desi style"""
-        categories_message = f"""**{Config.BOT_NAME} Knowledge Categories**
-
-**Padhai & Education**
-• School/College subjects (All levels)
-• Competitive Exams (UPSC, JEE, NEET, CAT)
-• Homework aur assignment help
-
-**Career & Job Guidance**
-• Job search strategies
-• Interview preparation
-• Resume writing aur improvement
-
-**Technology & Programming**
-• Coding aur development
-• AI/ML concepts
-• Tech troubleshooting
-
-**Online Earning & Business**
-• Freelancing tips
-• Business ideas aur planning
-• Investment guidance
-
-**Love & Relationships**
-• Dating advice
-• Relationship problems
-• Communication tips
-
-**Language Learning**
-• English speaking improvement
-• Grammar aur vocabulary
-• Translation help
-
-**Entertainment & Fun**
-• Movies aur music recommendations
-• Jokes aur memes
-• Timepass content
-
-**Motivation & Life Coaching**
-• Success mindset
-• Goal setting
-• Confidence building
-
-**Kuch bhi poocho - main har category mein expert hoon!**"""
+        categories_message = get_catalog().render('categories')
         
         await update.message.reply_text(categories_message, parse_mode='Markdown')
     
@@ -166,12 +393,7 @@ class EnhancedOstaadAIBot:
         if user_info['id'] in self.handlers.user_sessions:
             del self.handlers.user_sessions[user_info['id']]
         
-        await update.message.reply_text(
-            "**Conversation Reset Ho Gaya!**\n\n"
-            "Tumhara conversation history clear ho gaya hai bhai! "
-            "Ab fresh start kar sakte ho kisi bhi topic ke saath!\n\n"
-            "Aaj kya explore karna chahte ho?"
-        )
+        await update.message.reply_text(get_catalog().render('reset_done'))
     
     async def start_bot(self):
         """Start the enhanced Ostaad AI bot"""
@@ -205,6 +427,18 @@ class EnhancedOstaadAIBot:
             # Initialize application
             await self.application.initialize()
             
+            # Sample whatever blocks the event loop from the start, warm-up included
+            get_loop_watchdog().start()
+            
+            # Apply runtime_config.json and keep watching it
+            get_runtime_config().start()
+            
+            # Liveness/readiness probes answer from this loop, so a blocked loop fails them
+            await self.health.start()
+            
+            # Warm detectors, caches and upstream connections while polling starts
+            warmup_task = asyncio.create_task(self.warmup.run())
+            
             # Start polling with enhanced settings
             await self.application.start()
             await self.application.updater.start_polling(
@@ -216,6 +450,9 @@ class EnhancedOstaadAIBot:
                 connect_timeout=30
             )
             
+            # Only report readiness once the warm-up is done
+            await warmup_task
+            
             # Enhanced startup message
             logger.info("Ostaad AI is now LIVE and ready to serve!")
             logger.info("Pure desi expertise activated")
@@ -235,9 +472,18 @@ class EnhancedOstaadAIBot:
             # Enhanced cleanup
             try:
                 logger.info("Performing cleanup operations...")
+                await self.warmup.stop()
+                await self.health.stop()
+                await get_loop_watchdog().stop()
+                await get_runtime_config().stop()
                 await self.application.updater.stop()
                 await self.application.stop()
                 await self.application.shutdown()
+                get_exporter().shutdown()
+                await get_tools_client().close()
+                get_grammar_service().shutdown()
+                self.handlers.longform.shutdown()
+                get_usage_tracker().save()
                 logger.info("Cleanup completed successfully")
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
@@ -266,6 +512,13 @@ class EnhancedOstaadAIBot:
 
 def main():
     """Enhanced main function"""
+    if '--profile-startup' in sys.argv:
+        from startup_profiler import main as profile_startup
+        sys.exit(profile_startup([arg for arg in sys.argv[1:] if arg != '--profile-startup']))
+    
+    configure_locale()
+    configure_logging()
+    
     try:
         print("Initializing Ostaad AI Enhanced...")
         bot = EnhancedOstaadAIBot()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# memory_inspector.py
+# Developer: Ahmad Raza
+# In-process memory introspection: entries and approximate size per store, tracemalloc snapshot diffs
+
+import asyncio
+import gc
+import logging
+import sys
+import tracemalloc
+import types
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Shared code and runtime objects are not part of any store's footprint
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+           asyncio.Future, asyncio.AbstractEventLoop)
+
+
+def deep_sizeof(obj) -> int:
+    """Approximate bytes reachable from obj (each object counted once, code and loop objects skipped)"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+        if isinstance(current, _OPAQUE) or isinstance(current, (str, bytes, bytearray, int, float)):
+            continue
+
+        if isinstance(current, dict):
+            # Copied first: stores keep changing while the event loop runs other handlers' code
+            for key, value in list(current.items()):
+                stack.append(key)
+                stack.append(value)
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(list(current))
+        else:
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def process_rss() -> Optional[int]:
+    """Resident set size in bytes (Linux), None elsewhere"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class MemoryInspector:
+    """Named in-process stores plus on-demand tracemalloc snapshots for the admin /memory command"""
+
+    def __init__(self, top: int = Config.MEMORY_TOP_SITES):
+        self.top = top
+        self.stores: Dict[str, Callable[[], object]] = {}
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def register(self, name: str, getter: Callable[[], object]):
+        """Report `getter()` under `name`; a getter so replaced objects are always the current ones"""
+        self.stores[name] = getter
+
+    def measure(self) -> List[Tuple[str, int, int]]:
+        """(name, entries, approximate bytes) per store, largest first"""
+        rows = []
+        for name, getter in self.stores.items():
+            try:
+                store = getter()
+                entries = len(store) if hasattr(store, "__len__") else 1
+                rows.append((name, entries, deep_sizeof(store)))
+            except Exception as e:
+                logger.error(f"Failed to measure store '{name}': {e}")
+        return sorted(rows, key=lambda row: -row[2])
+
+    def store_report(self) -> str:
+        rows = self.measure()
+        rss = process_rss()
+        lines = [f"Process RSS: {_format_bytes(rss)}" if rss else "Process RSS: n/a",
+                 f"GC objects: {len(gc.get_objects()):,}",
+                 f"Stores ({_format_bytes(sum(row[2] for row in rows))} total):"]
+        lines.extend(f"  {name}: {entries:,} entries, ~{_format_bytes(size)}" for name, entries, size in rows)
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"tracemalloc: on, {_format_bytes(current)} traced (peak {_format_bytes(peak)})")
+        else:
+            lines.append("tracemalloc: off (/memory start)")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        """Snapshot without tracemalloc's own and the import machinery's allocations"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def start_tracing(self) -> str:
+        """Start tracemalloc and take the baseline snapshot"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(Config.MEMORY_TRACE_FRAMES)
+        self._snapshot = self._take_snapshot()
+        return "tracemalloc started; baseline snapshot taken. /memory diff compares against it."
+
+    def diff(self) -> str:
+        """Top allocation sites grown since the previous snapshot, which this one then replaces"""
+        if not tracemalloc.is_tracing() or self._snapshot is None:
+            return "tracemalloc is off - run /memory start first."
+
+        snapshot = self._take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+
+        growth = sum(stat.size_diff for stat in stats)
+        lines = [f"Since last snapshot: {'+' if growth >= 0 else ''}{_format_bytes(growth)}",
+                 f"Top {self.top} allocation sites by growth:"]
+        for stat in stats[:self.top]:
+            frame = stat.traceback[0]
+            lines.append(f"  {frame.filename}:{frame.lineno}  {'+' if stat.size_diff >= 0 else ''}"
+                         f"{_format_bytes(stat.size_diff)} ({stat.count_diff:+,} blocks), "
+                         f"now {_format_bytes(stat.size)}")
+        return "\n".join(lines)
+
+    def top_sites(self) -> str:
+        """Largest live allocation sites right now"""
+        if not tracemalloc.is_tracing():
+            return "tracemalloc is off - run /memory start first."
+        stats = self._take_snapshot().statistics("lineno")
+        lines = [f"Top {self.top} allocation sites:"]
+        lines.extend(f"  {stat.traceback[0].filename}:{stat.traceback[0].lineno}  "
+                     f"{_format_bytes(stat.size)} in {stat.count:,} blocks" for stat in stats[:self.top])
+        return "\n".join(lines)
+
+    def stop_tracing(self) -> str:
+        tracemalloc.stop()
+        self._snapshot = None
+        return "tracemalloc stopped."
+
+
+_inspector: Optional[MemoryInspector] = None
+
+
+def get_memory_inspector() -> MemoryInspector:
+    """Get the shared memory inspector"""
+    global _inspector
+    if _inspector is None:
+        _inspector = MemoryInspector()
+    return _inspector
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# message_analyzer.py
+# Developer: Ahmad Raza
+# Single-pass message analysis (mood, identity, category, domain) over one keyword automaton
+
+import unicodedata
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import Config
+
+# Checked in this order - the first mood with a match wins
+MOOD_KEYWORDS = {
+    "sad": ['sad', 'depressed', 'upset', 'crying', 'hurt', 'pain', 'breakup',
+            'udaas', 'dukhi', 'pareshan', 'tension', 'problem', 'mushkil'],
+    "happy": ['happy', 'excited', 'great', 'awesome', 'amazing', 'love',
+              'khush', 'maza', 'badhiya', 'accha', 'sahi', 'perfect'],
+    "angry": ['angry', 'frustrated', 'hate', 'stupid', 'worst', 'bad',
+              'gussa', 'pagal', 'bakwas', 'faltu', 'bekar'],
+    "confused": ['confused', 'help', 'samjha', 'kaise', 'how', 'what', 'why',
+                 'samjhao', 'bataao', 'explain', 'doubt', 'question'],
+}
+
+# Very specific developer questions only
+IDENTITY_KEYWORDS = [
+    'who made you', 'who created you', 'who is your developer', 'who built you',
+    'tumhe kisne banaya', 'developer kaun hai', 'creator kaun hai', 'banane wala kaun',
+    'ahmad kaun hai', 'ahmad ke bare me', 'ahmad about'
+]
+
+CATEGORY_KEYWORDS = {
+    "padhai_education": ["study", "exam", "school", "college", "padhai", "homework", "assignment",
+                         "upsc", "jee", "neet", "mathematics", "physics", "chemistry"],
+    "career_job": ["job", "career", "interview", "resume", "cv", "naukri", "salary", "promotion"],
+    "programming_tech": ["code", "programming", "python", "javascript", "website", "app", "bot",
+                         "algorithm", "software", "tech", "computer"],
+    "online_earning": ["earn", "money", "income", "freelance", "business", "startup", "investment",
+                       "crypto", "trading", "paise"],
+    "love_relationships": ["love", "girlfriend", "boyfriend", "relationship", "breakup", "marriage",
+                           "dating", "crush", "propose"],
+    "language_learning": ["english", "hindi", "grammar", "speaking", "writing", "translation",
+                          "language", "vocabulary"],
+    "entertainment": ["movie", "song", "meme", "joke", "funny", "entertainment", "timepass",
+                      "bollywood", "music"],
+    "motivation": ["motivation", "confidence", "success", "goal", "depression", "stress",
+                   "inspiration", "life"],
+    "health_fitness": ["health", "fitness", "exercise", "diet", "weight", "gym", "yoga", "medicine"],
+    "general_knowledge": ["news", "current", "gk", "general", "world", "india", "politics", "history"],
+    "religion_culture": ["religion", "god", "festival", "culture", "tradition", "spiritual",
+                         "hindu", "muslim", "christian"],
+    "jokes_fun": ["joke", "funny", "meme", "roast", "comedy", "laugh", "fun", "riddle", "puzzle"]
+}
+
+DEFAULT_CATEGORY = "general_knowledge"
+DEFAULT_DOMAIN = "general"
+NATIVE_DOMAIN_LANGUAGES = ("hi", "ur", "bn")
+
+# Inflections a Latin keyword may carry and still count as a whole-word match
+# ("exams", "jobs", "coding" is still not "code")
+ALLOWED_SUFFIXES = frozenset(['s', 'es', 'ed', 'ing', 'er', 'ers'])
+
+
+def _is_word_char(char: str) -> bool:
+    """Letters, digits and combining marks (Devanagari matras) continue a word"""
+    return char.isalnum() or char == '_' or unicodedata.category(char)[0] == 'M'
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over many keywords, reporting whole-word matches"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Tuple]]] = [[]]
+        self._delta: List[Dict[str, int]] = [{}]
+        self._payloads: Dict[str, List] = {}
+        self._built = False
+
+    def add(self, keyword: str, payload):
+        """Register a keyword (matched case-insensitively) with a payload"""
+        keyword = keyword.lower()
+        self._payloads.setdefault(keyword, []).append(payload)
+        self._built = False
+
+    def build(self):
+        """Build the trie, failure links and merged outputs"""
+        self._goto, self._fail, self._out = [{}], [0], [[]]
+
+        for keyword, payloads in self._payloads.items():
+            state = 0
+            for char in keyword:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(keyword), tuple(payloads)))
+
+        # Fold the failure links into a full transition table (a DFA), so matching
+        # never walks failure chains: one dict lookup per character
+        queue = deque()
+        for nxt in self._goto[0].values():
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+        self._delta = [dict(transitions) for transitions in self._goto]
+        order = deque(self._goto[0].values())
+        while order:
+            state = order.popleft()
+            inherited = self._delta[self._fail[state]]
+            own = self._goto[state]
+            self._delta[state] = {**inherited, **own} if state else own
+            order.extend(own.values())
+        # Transitions back into the root's children are resolved by the root row at match time
+        root = self._delta[0]
+        self._delta = [
+            {char: nxt for char, nxt in row.items() if root.get(char) != nxt} if state else row
+            for state, row in enumerate(self._delta)
+        ]
+
+        self._built = True
+
+    def _whole_word(self, text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end >= len(text) or not _is_word_char(text[end]):
+            return True
+
+        # Allow a short inflection after ASCII keywords ("exam" -> "exams")
+        stop = end
+        while stop < len(text) and _is_word_char(text[stop]):
+            stop += 1
+            if stop - end > 3:
+                return False
+        return text[end - 1].isascii() and text[end:stop] in ALLOWED_SUFFIXES
+
+    def find(self, text: str) -> Iterator[Tuple[str, Tuple]]:
+        """Yield (keyword, payloads) for every whole-word match in already-lowercased text"""
+        if not self._built:
+            self.build()
+
+        delta, out = self._delta, self._out
+        root = delta[0]
+        state = 0
+        for index, char in enumerate(text):
+            state = delta[state].get(char) or root.get(char, 0)
+            if not out[state]:
+                continue
+            end = index + 1
+            for length, payloads in out[state]:
+                start = end - length
+                if self._whole_word(text, start, end):
+                    yield text[start:end], payloads
+
+
+class MessageAnalyzer:
+    """Compiles every keyword table into one automaton; analyze() is a single pass"""
+
+    def __init__(self, domain_keywords: Optional[Dict] = None, use_model: bool = True):
+        if domain_keywords is None:
+            from knowledge_domains import KnowledgeDomainClassifier
+            domain_keywords = KnowledgeDomainClassifier().domain_keywords
+
+        self.automaton = KeywordAutomaton()
+        self.domain_sizes = {}
+        self.use_model = use_model and Config.CLASSIFIER_FALLBACK     # Ask the trained classifier when no keyword matched
+
+        for mood, keywords in MOOD_KEYWORDS.items():
+            for keyword in keywords:
+                self.automaton.add(keyword, ("mood", mood))
+        for keyword in IDENTITY_KEYWORDS:
+            self.automaton.add(keyword, ("identity", None))
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            for keyword in keywords:
+                self.automaton.add(keyword, ("category", category))
+        for domain, config in domain_keywords.items():
+            for keyword in config["keywords"]:
+                self.automaton.add(keyword, ("domain", domain, False))
+            for keyword in config.get("hindi_keywords", []):
+                self.automaton.add(keyword, ("domain", domain, True))
+            self.domain_sizes[domain] = len(config["keywords"]) + len(config.get("hindi_keywords", []))
+
+        self.automaton.build()
+
+    def analyze(self, message: str, language: str = "en") -> Dict:
+        """Mood, identity intent, category and domain (with confidences) in one pass"""
+        moods = set()
+        identity = False
+        category_hits: Dict[str, set] = {}
+        domain_hits: Dict[str, Dict[str, bool]] = {}
+
+        for keyword, payloads in self.automaton.find(message.lower()):
+            for payload in payloads:
+                kind = payload[0]
+                if kind == "mood":
+                    moods.add(payload[1])
+                elif kind == "category":
+                    category_hits.setdefault(payload[1], set()).add(keyword)
+                elif kind == "domain":
+                    domain_hits.setdefault(payload[1], {})[keyword] = payload[2]
+                else:
+                    identity = True
+
+        mood = next((m for m in MOOD_KEYWORDS if m in moods), "neutral")
+        category, category_confidence = self._pick_category(category_hits)
+        domain, domain_confidence = self._pick_domain(domain_hits, language)
+        category_source = "keywords" if category_hits else "default"
+
+        if self.use_model and (not category_hits or domain == DEFAULT_DOMAIN):
+            prediction = self._predict(message)
+            if prediction is not None:
+                # Only above the per-head threshold calibrated on held-out data (none = never)
+                if not category_hits and prediction['category_trusted']:
+                    category, category_confidence = prediction['category'], prediction['category_confidence']
+                    category_source = "model"
+                if (domain == DEFAULT_DOMAIN and prediction['domain'] != DEFAULT_DOMAIN
+                        and prediction['domain_trusted']):
+                    domain, domain_confidence = prediction['domain'], prediction['domain_confidence']
+
+        return {
+            'mood': mood,
+            'identity': identity,
+            'category': category,
+            'category_confidence': category_confidence,
+            'category_source': category_source,
+            'domain': domain,
+            'domain_confidence': domain_confidence,
+        }
+
+    @staticmethod
+    def _predict(message: str) -> Optional[Dict]:
+        """Classifier prediction, or None if the weights are unavailable or there are no words"""
+        if not any(char.isalnum() for char in message):
+            return None
+
+        from text_classifier import get_classifier
+
+        classifier = get_classifier()
+        return classifier.predict(message) if classifier is not None else None
+
+    def _pick_category(self, hits: Dict[str, set]) -> Tuple[str, float]:
+        if not hits:
+            return DEFAULT_CATEGORY, 0.0
+        scores = {c: len(hits[c]) for c in CATEGORY_KEYWORDS if c in hits}
+        best = max(scores, key=scores.get)
+        return best, scores[best] / sum(scores.values())
+
+    def _pick_domain(self, hits: Dict[str, Dict[str, bool]], language: str) -> Tuple[str, float]:
+        native = language in NATIVE_DOMAIN_LANGUAGES
+        scores = {}
+        for domain, size in self.domain_sizes.items():      # Table order breaks ties
+            if domain in hits:
+                score = sum(1.5 if hindi else 1.0 for hindi in hits[domain].values() if native or not hindi)
+                scores[domain] = score / size
+
+        if not scores:
+            return DEFAULT_DOMAIN, 0.5
+        best = max(scores, key=scores.get)
+        if scores[best] < 0.1:
+            return DEFAULT_DOMAIN, 0.5
+        return best, scores[best]
+
+
+_analyzer: Optional[MessageAnalyzer] = None
+
+
+def get_analyzer() -> MessageAnalyzer:
+    """Get the shared analyzer, compiling the automaton on first use"""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = MessageAnalyzer()
+    return _analyzer
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# message_catalog.py
+# Developer: Ahmad Raza
+# Compiled, lazily loaded catalog of localized UI texts
+
+import json
+import logging
+import os
+import random
+import sys
+from string import Formatter
+from typing import Dict, List, Optional, Tuple, Union
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+LOCALES_DIR = "locales"
+
+
+def _constant_fields() -> Dict[str, str]:
+    """Fields that are the same for every user and get baked in at compile time"""
+    return {
+        'bot_name': Config.BOT_NAME,
+        'version': Config.VERSION,
+        'powered_by': Config.POWERED_BY,
+        'developer': Config.DEVELOPER,
+        'model': Config.DEFAULT_MODEL,
+        'tagline': Config.TAGLINE,
+    }
+
+
+class CompiledTemplate:
+    """Template split into interned literal parts and per-user field names"""
+
+    __slots__ = ('parts', 'fields')
+
+    def __init__(self, parts: Tuple[str, ...], fields: Tuple[Optional[str], ...]):
+        self.parts = parts          # Literal text, one more than there are fields
+        self.fields = fields
+
+    def render(self, values: Dict[str, object]) -> str:
+        pieces = [self.parts[0]]
+        for field, literal in zip(self.fields, self.parts[1:]):
+            pieces.append(str(values.get(field, '')))
+            pieces.append(literal)
+        return ''.join(pieces)
+
+
+Compiled = Union[str, CompiledTemplate]
+
+
+def compile_template(template: str, constants: Dict[str, str]) -> Compiled:
+    """Pre-render constants; return an interned str if no per-user fields remain"""
+    parts: List[str] = []
+    fields: List[str] = []
+    literal = []
+
+    for text, field, _, _ in Formatter().parse(template):
+        literal.append(text)
+        if field is None:
+            continue
+        if field in constants:
+            literal.append(constants[field])
+        else:
+            parts.append(sys.intern(''.join(literal)))
+            fields.append(field)
+            literal = []
+    parts.append(sys.intern(''.join(literal)))
+
+    if not fields:
+        return parts[0]
+    return CompiledTemplate(tuple(parts), tuple(fields))
+
+
+class MessageCatalog:
+    """One lookup API for every screen: catalog.render(key, language, **fields)"""
+
+    def __init__(self, locales_dir: str = LOCALES_DIR):
+        self.locales_dir = locales_dir
+        with open(os.path.join(locales_dir, 'index.json'), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        self.default_language = index.get('default_language', Config.DEFAULT_LANGUAGE)
+        self.fallbacks = index.get('fallbacks', {})
+        self._languages: Dict[str, Dict[str, Union[Compiled, Tuple[Compiled, ...]]]] = {}
+        self._constants = _constant_fields()
+
+    def _load(self, language: str) -> Dict:
+        """Compile a language file on first use ({} if the language has none)"""
+        compiled = self._languages.get(language)
+        if compiled is not None:
+            return compiled
+
+        compiled = {}
+        path = os.path.join(self.locales_dir, f"{language}.json")
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    raw = json.load(f)
+                for key, value in raw.items():
+                    if isinstance(value, list):
+                        compiled[key] = tuple(compile_template(v, self._constants) for v in value)
+                    else:
+                        compiled[key] = compile_template(value, self._constants)
+            except Exception as e:
+                logger.error(f"Failed to load message catalog for '{language}': {e}")
+
+        self._languages[language] = compiled
+        return compiled
+
+    def _lookup(self, key: str, language: str):
+        entry = self._load(language).get(key)
+        if entry is None:
+            fallback = self.fallbacks.get(key, self.default_language)
+            entry = self._load(fallback).get(key)
+        if entry is None and language != self.default_language:
+            entry = self._load(self.default_language).get(key)
+        if entry is None:
+            raise KeyError(f"Message '{key}' is not in the catalog")
+        return entry
+
+    def render(self, key: str, language: str = Config.DEFAULT_LANGUAGE, **fields) -> str:
+        """Render a screen; pools pick a random variant"""
+        entry = self._lookup(key, language)
+        if isinstance(entry, tuple):
+            entry = random.choice(entry)
+        if isinstance(entry, str):
+            return entry
+        return entry.render(fields)
+
+    def has(self, key: str, language: str) -> bool:
+        """Check whether a language defines a key itself (no fallback)"""
+        return key in self._load(language)
+
+    def preload(self, languages: Optional[List[str]] = None):
+        """Compile languages up front (e.g. during warm-up)"""
+        for language in languages or Config.SUPPORTED_LANGUAGES:
+            self._load(language)
+
+    def invalidate(self):
+        """Drop compiled languages so they are rebuilt with current Config values"""
+        self._languages = {}
+        self._constants = _constant_fields()
+
+
+_catalog: Optional[MessageCatalog] = None
+
+
+def get_catalog() -> MessageCatalog:
+    """Get the shared message catalog"""
+    global _catalog
+    if _catalog is None:
+        _catalog = MessageCatalog()
+    return _catalog
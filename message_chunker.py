@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# message_chunker.py
+# Developer: Ahmad Raza
+# Linear-time splitting of replies into Telegram-sized messages, counted in UTF-16 units
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from config import Config
+
+# Break strength after a whitespace token; the chunker cuts at the strongest one it can
+NO_BREAK, WORD, SENTENCE, LINE, PARAGRAPH = -1, 0, 1, 2, 3
+MIN_FILL = 0.5                          # Prefer a weaker break over a chunk shorter than this share
+
+_TOKEN = re.compile(r"""
+    (?P<fence>```.*?```)                            # Code block, kept whole when it fits
+  | (?P<atom>`[^`\n]+`                              # Inline code
+      | \[[^\]\n]*\]\([^)\s]*\)                     # Markdown link
+      | \*\*[^*\n]+?\*\* | \*[^*\n]+?\*             # Bold / italic
+      | __[^_\n]+?__ | (?<!\w)_[^_\n]+?_(?!\w)
+      | <[A-Za-z/][^<>\n]*> | &\#?\w+;)             # HTML tag / entity
+  | (?P<paragraph>\n[ \t]*\n\s*)
+  | (?P<line>\n[ \t]*)
+  | (?P<space>[ \t]+)
+  | (?P<word>[^\s`*_\[<&]+ | .)
+""", re.S | re.X)
+
+_SENTENCE_END = (".", "!", "?", "।", ":", ";")
+_FENCE = "```"
+
+
+def utf16_len(text: str) -> int:
+    """Length as Telegram counts it: UTF-16 code units (astral chars like emoji count twice)"""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _hard_split(text: str, limit: int) -> Iterator[str]:
+    """Cut an unbreakable run into pieces of at most `limit` units, never inside a surrogate pair"""
+    start = units = 0
+    for index, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if units + width > limit:
+            yield text[start:index]
+            start, units = index, 0
+        units += width
+    if start < len(text):
+        yield text[start:]
+
+
+def _split_fence(block: str, limit: int) -> Iterator[str]:
+    """Split an oversized code block on line ends, closing and reopening the fence per piece"""
+    header, _, body = block[len(_FENCE):-len(_FENCE)].partition("\n")
+    opening, closing = f"{_FENCE}{header}\n", f"\n{_FENCE}"
+    budget = limit - utf16_len(opening) - utf16_len(closing)
+
+    lines: List[str] = []
+    units = 0
+    for line in body.rstrip("\n").split("\n"):
+        for part in (_hard_split(line, budget) if utf16_len(line) > budget else (line,)):
+            width = utf16_len(part) + (1 if lines else 0)
+            if lines and units + width > budget:
+                yield opening + "\n".join(lines) + closing
+                lines, units, width = [], 0, width - 1
+            lines.append(part)
+            units += width
+    if lines:
+        yield opening + "\n".join(lines) + closing
+
+
+class _Packer:
+    """Greedy packer over (text, units, break) tokens; each token is carried over at most once per cut"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.tokens: List[Tuple[str, int, int]] = []
+        self.units = 0
+        self.breaks: List[Optional[Tuple[int, int]]] = [None] * (PARAGRAPH + 1)
+
+    def push(self, text: str, units: int, strength: int) -> Iterator[str]:
+        if units > self.limit:
+            yield from self.flush()
+            pieces = _split_fence(text, self.limit) if text.startswith(_FENCE) else _hard_split(text, self.limit)
+            for piece in pieces:
+                yield piece
+            return
+
+        while self.units + units > self.limit:
+            chunk = self._cut()
+            if chunk:
+                yield chunk
+
+        self.tokens.append((text, units, strength))
+        self.units += units
+        if strength > NO_BREAK:
+            self.breaks[strength] = (len(self.tokens), self.units)
+
+    def flush(self) -> Iterator[str]:
+        chunk = "".join(token[0] for token in self.tokens).strip()
+        self.tokens, self.units = [], 0
+        self.breaks = [None] * (PARAGRAPH + 1)
+        if chunk:
+            yield chunk
+
+    def _cut(self) -> str:
+        """Emit the buffer up to its best break and keep the rest"""
+        candidates = [found for found in self.breaks if found is not None]
+        if not candidates:
+            return next(self.flush(), "")
+
+        full_enough = [found for found in reversed(self.breaks)
+                       if found is not None and found[1] >= self.limit * MIN_FILL]
+        cut = full_enough[0][0] if full_enough else max(candidates)[0]
+
+        chunk = "".join(token[0] for token in self.tokens[:cut]).strip()
+        rest = self.tokens[cut:]
+        self.tokens, self.units = [], 0
+        self.breaks = [None] * (PARAGRAPH + 1)
+        for text, units, strength in rest:
+            self.tokens.append((text, units, strength))
+            self.units += units
+            if strength > NO_BREAK:
+                self.breaks[strength] = (len(self.tokens), self.units)
+        return chunk
+
+
+def _tokens(text: str) -> Iterator[Tuple[str, int, int]]:
+    """Yield (text, utf16 units, break strength after it) for complete text"""
+    previous = ""
+    for match in _TOKEN.finditer(text):
+        kind, token = match.lastgroup, match.group()
+        if kind == "paragraph":
+            strength = PARAGRAPH
+        elif kind == "line":
+            strength = LINE
+        elif kind == "space":
+            strength = SENTENCE if previous.endswith(_SENTENCE_END) else WORD
+        else:
+            strength = NO_BREAK
+        previous = token
+        yield token, utf16_len(token), strength
+
+
+def iter_chunks(source: Union[str, Iterable[str]],
+                limit: int = Config.MAX_MESSAGE_LENGTH) -> Iterator[str]:
+    """Yield message-sized chunks from a reply or a stream of reply pieces.
+
+    Breaks at paragraphs, then lines, sentences and words, and never inside code,
+    links, bold/italic spans or HTML tags/entities unless one alone exceeds the limit.
+    Streamed input is consumed up to its last complete paragraph outside a code block.
+    """
+    if isinstance(source, str):
+        if utf16_len(source) <= limit:
+            if source.strip():
+                yield source.strip()
+            return
+        source = (source,)
+
+    packer = _Packer(limit)
+
+    pending = ""
+    scanned = 0                         # pending[:scanned] has been searched for breaks
+    in_fence = False
+    for piece in source:
+        pending += piece
+        safe = 0
+        for match in re.finditer(r"```|\n[ \t]*\n", pending[max(0, scanned - 2):]):
+            if match.group() == _FENCE:
+                in_fence = not in_fence
+            elif not in_fence:
+                safe = max(0, scanned - 2) + match.end()
+        scanned = len(pending)
+
+        if safe:
+            for token in _tokens(pending[:safe]):
+                yield from packer.push(*token)
+            pending = pending[safe:]
+            scanned -= safe
+
+    for token in _tokens(pending):
+        yield from packer.push(*token)
+    yield from packer.flush()
+
+
+def split_message(text: str, limit: int = Config.MAX_MESSAGE_LENGTH) -> List[str]:
+    """All chunks of a complete reply"""
+    return list(iter_chunks(text, limit))
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# pdf_export.py
+# Developer: Ahmad Raza
+# Conversation PDF export rendered in a process pool into memory (no temp files)
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FONT = "OstaadExport"
+FALLBACK_FONT = "Helvetica"             # ReportLab built-in, Latin only
+
+_worker_font: Optional[str] = None      # Registered once per worker process
+
+
+class ExportBusyError(Exception):
+    """Raised when EXPORT_MAX_CONCURRENT exports are already running or queued"""
+
+
+def _register_font(font_paths: Sequence[str]) -> str:
+    """Register the first available Unicode TTF in this process (cached) and return its name"""
+    global _worker_font
+    if _worker_font is not None:
+        return _worker_font
+
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    _worker_font = FALLBACK_FONT
+    for path in font_paths:
+        if not os.path.exists(path):
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont(EXPORT_FONT, path))
+            _worker_font = EXPORT_FONT
+            break
+        except Exception as e:
+            logger.error(f"Failed to register export font {path}: {e}")
+
+    if _worker_font == FALLBACK_FONT:
+        logger.warning("No Unicode export font found - non-Latin text will not render")
+    return _worker_font
+
+
+def _init_worker(font_paths: Sequence[str]):
+    """Pool initializer: import ReportLab and register fonts before the first job"""
+    _register_font(font_paths)
+
+
+def render_conversation(title: str, messages: List[Dict[str, str]],
+                        font_paths: Sequence[str] = ()) -> bytes:
+    """Render a conversation to PDF bytes (runs inside a pool worker)"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+    font = _register_font(font_paths or Config.EXPORT_FONT_PATHS)
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle('ExportTitle', parent=styles['Heading1'], fontName=font,
+                                 fontSize=16, spaceAfter=20, alignment=1)
+    meta_style = ParagraphStyle('ExportMeta', parent=styles['Normal'], fontName=font,
+                                fontSize=9, textColor='#666666', alignment=1)
+    role_style = ParagraphStyle('ExportRole', parent=styles['Normal'], fontName=font,
+                                fontSize=10, textColor='#1a5fb4', spaceBefore=8)
+    content_style = ParagraphStyle('ExportContent', parent=styles['Normal'], fontName=font,
+                                   fontSize=11, leading=15, spaceAfter=6, leftIndent=12)
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, title=title, author=Config.BOT_NAME)
+    story = [
+        Paragraph(escape(title), title_style),
+        Paragraph(escape(f"{Config.BOT_NAME} | {datetime.now().strftime('%Y-%m-%d %H:%M')}"), meta_style),
+        Spacer(1, 16),
+    ]
+
+    for message in messages:
+        speaker = "You" if message.get('role') == 'user' else Config.BOT_NAME
+        story.append(Paragraph(speaker, role_style))
+        # Replies are Markdown; ReportLab parses its own markup, so drop emphasis markers and escape
+        content = message.get('content', '').replace('**', '').replace('__', '')
+        for paragraph in content.split('\n\n'):
+            if paragraph.strip():
+                story.append(Paragraph(escape(paragraph.strip()).replace('\n', '<br/>'), content_style))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+class PdfExporter:
+    """Runs PDF renders in worker processes so an export never blocks other chats"""
+
+    def __init__(self, workers: int = Config.EXPORT_WORKERS,
+                 max_concurrent: int = Config.EXPORT_MAX_CONCURRENT):
+        self.workers = workers
+        self.max_concurrent = max_concurrent
+        self.active = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Start the pool on first export"""
+        if self._executor is None:
+            # Not fork: the bot process already runs threads, and a forked child can inherit a lock
+            # one of them held and deadlock on it
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_worker,
+                initargs=(tuple(Config.EXPORT_FONT_PATHS),)
+            )
+        return self._executor
+
+    async def export(self, title: str, messages: List[Dict[str, str]]) -> bytes:
+        """Render in the pool; raises ExportBusyError instead of queueing without bound"""
+        if self.active >= self.max_concurrent:
+            raise ExportBusyError(f"{self.active} exports already in progress")
+
+        self.active += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, render_conversation, title,
+                list(messages[-Config.EXPORT_MAX_MESSAGES:]), tuple(Config.EXPORT_FONT_PATHS)
+            )
+        finally:
+            self.active -= 1
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_exporter: Optional[PdfExporter] = None
+
+
+def get_exporter() -> PdfExporter:
+    """Get the shared PDF exporter"""
+    global _exporter
+    if _exporter is None:
+        _exporter = PdfExporter()
+    return _exporter
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# perf_tracing.py
+# Developer: Ahmad Raza
+# Per-update span tracing: stage timings keyed by update_id, per-stage histograms and slow-update logs
+
+import contextvars
+import functools
+import logging
+import math
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Log-spaced buckets: 0.1 ms * 1.1^i, up to ~3 minutes; percentiles are within ~10%
+_BUCKET_BASE_MS = 0.1
+_BUCKET_GROWTH = 1.1
+_BUCKET_COUNT = 152
+
+
+class Histogram:
+    """Fixed log-bucket latency histogram (constant memory per stage)"""
+
+    __slots__ = ("buckets", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.buckets = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        index = 0 if ms <= _BUCKET_BASE_MS else int(math.log(ms / _BUCKET_BASE_MS, _BUCKET_GROWTH)) + 1
+        self.buckets[min(index, _BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank:
+                return min(_BUCKET_BASE_MS * _BUCKET_GROWTH ** index, self.max_ms)
+        return self.max_ms
+
+
+class Trace:
+    """Stage timings of one update"""
+
+    __slots__ = ("update_id", "name", "started", "spans")
+
+    def __init__(self, update_id: int, name: str):
+        self.update_id = update_id
+        self.name = name
+        self.started = time.perf_counter()
+        self.spans: List[Tuple[str, float]] = []
+
+
+_current: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("perf_trace", default=None)
+
+
+def record(stage: str, seconds: float):
+    """Add a measured stage to the current update's trace (no-op outside a trace)"""
+    trace = _current.get()
+    if trace is not None:
+        trace.spans.append((stage, seconds))
+
+
+@contextmanager
+def span(stage: str):
+    """Time a block as one stage of the current update"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started)
+
+
+class Tracer:
+    """Collects finished traces into per-stage histograms"""
+
+    def __init__(self, slow_ms: float = Config.PERF_SLOW_UPDATE_MS):
+        self.slow_ms = slow_ms
+        self.histograms: Dict[str, Histogram] = {}
+        self.updates = 0
+        self.slow_updates = 0
+        self.last_finished: Optional[float] = None     # time.monotonic() of the last finished update
+
+    def begin(self, update_id: int, name: str) -> contextvars.Token:
+        return _current.set(Trace(update_id, name))
+
+    def finish(self, token: contextvars.Token):
+        trace = _current.get()
+        _current.reset(token)
+        if trace is None:
+            return
+
+        total_ms = (time.perf_counter() - trace.started) * 1e3
+        self.last_finished = time.monotonic()
+        stages: Dict[str, float] = {}
+        for stage, seconds in trace.spans:
+            stages[stage] = stages.get(stage, 0.0) + seconds * 1e3
+
+        self.updates += 1
+        self._histogram("total").add(total_ms)
+        for stage, ms in stages.items():
+            self._histogram(stage).add(ms)
+
+        if total_ms >= self.slow_ms:
+            self.slow_updates += 1
+            breakdown = ", ".join(f"{stage}={ms:.0f}ms" for stage, ms in stages.items())
+            # Nested stages (preferences_write inside language) are counted twice here, hence the floor
+            untraced = max(0.0, total_ms - sum(stages.values()))
+            logger.warning(f"Slow update {trace.update_id} ({trace.name}) took {total_ms:.0f}ms: "
+                           f"{breakdown}, other={untraced:.0f}ms")
+
+    def _histogram(self, stage: str) -> Histogram:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = Histogram()
+        return histogram
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """count, mean, p50/p95/p99 and max (ms) per stage"""
+        return {
+            stage: {
+                "count": histogram.count,
+                "mean": histogram.total_ms / histogram.count,
+                "p50": histogram.percentile(0.50),
+                "p95": histogram.percentile(0.95),
+                "p99": histogram.percentile(0.99),
+                "max": histogram.max_ms,
+            }
+            for stage, histogram in self.histograms.items() if histogram.count
+        }
+
+    def format_stats(self) -> str:
+        """Plain-text table for the admin /perf command"""
+        stats = self.get_stats()
+        if not stats:
+            return "No updates traced yet."
+
+        lines = [f"Updates traced: {self.updates} (slow >= {self.slow_ms:.0f}ms: {self.slow_updates})",
+                 "stage: n  p50 / p95 / p99 / max (ms)"]
+        for stage, entry in sorted(stats.items(), key=lambda item: -item[1]["p95"]):
+            lines.append(f"{stage}: {entry['count']}  {entry['p50']:.0f} / {entry['p95']:.0f} / "
+                         f"{entry['p99']:.0f} / {entry['max']:.0f}")
+        return "\n".join(lines)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Get the shared tracer"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def traced(handler):
+    """Wrap an (update, context) handler so each update gets its own trace"""
+    @functools.wraps(handler)
+    async def wrapper(update, context):
+        tracer = get_tracer()
+        token = tracer.begin(getattr(update, "update_id", 0), handler.__name__)
+        try:
+            return await handler(update, context)
+        finally:
+            tracer.finish(token)
+    return wrapper
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# rate_limiter.py
+# Developer: Ahmad Raza
+# Per-user GCRA rate limiting with escalating temporary bans and admin overrides
+
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+from utils import Utils
+
+# Decisions returned by check()
+ALLOWED = "allowed"
+THROTTLED = "throttled"      # First rejection of a streak - tell the user once
+DROPPED = "dropped"          # Further rejections - ignore silently, replying would cost API calls too
+BANNED = "banned"            # This message earned a ban - tell the user once
+
+
+class RateLimiter:
+    """GCRA limiter: one float (theoretical arrival time) per active user.
+
+    A user may send RATE_LIMIT messages per minute with bursts of RATE_BURST. Rejected messages
+    are strikes; RATE_STRIKES_BEFORE_BAN strikes within RATE_STRIKE_WINDOW seconds ban the user for
+    BAN_DURATION, doubling for each repeat ban up to RATE_MAX_BAN. Bans sit in a dict plus an
+    expiry heap, so expired ones are dropped without scanning.
+    """
+
+    def __init__(self, per_minute: int = Config.RATE_LIMIT, burst: int = Config.RATE_BURST,
+                 strikes_before_ban: int = Config.RATE_STRIKES_BEFORE_BAN):
+        self.configure(per_minute, burst, strikes_before_ban)
+        self.tat: Dict[int, float] = {}
+        self.strikes: Dict[int, Tuple[int, float]] = {}       # user -> (count, streak start)
+        self.bans: Dict[int, float] = {}                        # user -> expiry (monotonic)
+        self.ban_counts: Dict[int, int] = {}                    # user -> automatic bans so far
+        self._expiry: List[Tuple[float, int]] = []
+        self.stats = {"allowed": 0, "throttled": 0, "dropped": 0, "auto_bans": 0, "manual_bans": 0}
+        self._checks = 0
+
+    def configure(self, per_minute: int, burst: int, strikes_before_ban: int):
+        """Set the limits; users keep their current arrival times, so a change applies from their next message"""
+        self.interval = 60.0 / per_minute
+        self.tolerance = self.interval * (burst - 1)
+        self.strikes_before_ban = strikes_before_ban
+
+    def check(self, user_id: int, now: Optional[float] = None) -> str:
+        """Decide one incoming message or button tap"""
+        if Utils.is_admin(user_id):
+            return ALLOWED
+        now = time.monotonic() if now is None else now
+
+        self._expire_bans(now)
+        if user_id in self.bans:
+            self.stats["dropped"] += 1
+            return DROPPED
+
+        self._checks += 1
+        if self._checks % 1000 == 0:
+            self._prune(now)
+
+        tat = max(self.tat.get(user_id, now), now)
+        if tat - now <= self.tolerance:
+            self.tat[user_id] = tat + self.interval
+            self.stats["allowed"] += 1
+            return ALLOWED
+
+        count, started = self.strikes.get(user_id, (0, now))
+        if now - started > Config.RATE_STRIKE_WINDOW:
+            count, started = 0, now
+        count += 1
+        self.strikes[user_id] = (count, started)
+
+        if count >= self.strikes_before_ban:
+            self.ban_counts[user_id] = self.ban_counts.get(user_id, 0) + 1
+            duration = min(Config.BAN_DURATION * 2 ** (self.ban_counts[user_id] - 1), Config.RATE_MAX_BAN)
+            self._ban(user_id, duration, now)
+            self.stats["auto_bans"] += 1
+            return BANNED
+
+        self.stats["throttled" if count == 1 else "dropped"] += 1
+        return THROTTLED if count == 1 else DROPPED
+
+    def retry_after(self, user_id: int, now: Optional[float] = None) -> float:
+        """Seconds until the user may send again"""
+        now = time.monotonic() if now is None else now
+        if user_id in self.bans:
+            return max(0.0, self.bans[user_id] - now)
+        return max(0.0, self.tat.get(user_id, now) - self.tolerance - now)
+
+    def _ban(self, user_id: int, seconds: float, now: float):
+        self.bans[user_id] = now + seconds
+        heapq.heappush(self._expiry, (now + seconds, user_id))
+        self.strikes.pop(user_id, None)
+        self.tat.pop(user_id, None)
+
+    def ban(self, user_id: int, seconds: Optional[float] = None):
+        """Admin ban for a fixed time (BAN_DURATION by default)"""
+        self._ban(user_id, Config.BAN_DURATION if seconds is None else seconds, time.monotonic())
+        self.stats["manual_bans"] += 1
+
+    def unban(self, user_id: int) -> bool:
+        """Lift a ban and forget the user's repeat-ban history; False if they were not banned"""
+        self.ban_counts.pop(user_id, None)
+        return self.bans.pop(user_id, None) is not None
+
+    def _expire_bans(self, now: float):
+        while self._expiry and self._expiry[0][0] <= now:
+            expiry, user_id = heapq.heappop(self._expiry)
+            # A later ban or an unban leaves stale heap entries; only the current expiry counts
+            if self.bans.get(user_id) == expiry:
+                del self.bans[user_id]
+
+    def _prune(self, now: float):
+        """Forget users whose bucket has fully drained and whose strike streak is over"""
+        for user_id in [user for user, tat in self.tat.items() if tat <= now]:
+            del self.tat[user_id]
+        for user_id in [user for user, (_, started) in self.strikes.items()
+                        if now - started > Config.RATE_STRIKE_WINDOW]:
+            del self.strikes[user_id]
+
+    def active_bans(self) -> List[Tuple[int, float]]:
+        """(user_id, seconds left) for every current ban, soonest first"""
+        now = time.monotonic()
+        self._expire_bans(now)
+        return sorted(((user_id, expiry - now) for user_id, expiry in self.bans.items()), key=lambda item: item[1])
+
+    def format_stats(self) -> str:
+        """Plain-text metrics and ban list for the admin /bans command"""
+        bans = self.active_bans()
+        lines = [
+            f"Limit: {60 / self.interval:.0f}/min, burst {self.tolerance / self.interval + 1:.0f}",
+            f"Allowed {self.stats['allowed']}, throttled {self.stats['throttled']}, dropped {self.stats['dropped']}",
+            f"Bans: {self.stats['auto_bans']} automatic, {self.stats['manual_bans']} manual, {len(bans)} active",
+            f"Tracked users: {len(self.tat)}",
+        ]
+        lines.extend(f"  {user_id}: {left / 60:.0f} min left" for user_id, left in bans[:20])
+        return "\n".join(lines)
+
+
+_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the shared rate limiter"""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter()
+    return _limiter
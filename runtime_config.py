@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+# runtime_config.py
+# Developer: Ahmad Raza
+# Hot-reloadable overrides for tunable Config values, validated as a whole and applied without a restart
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import Config
+from generation_profiles import profile_model
+
+logger = logging.getLogger(__name__)
+
+# Config attributes that may change at runtime: name -> (type, minimum, maximum).
+# Worker/process pool sizes are not here; pools are sized once and need a restart.
+TUNABLES: Dict[str, Tuple[type, Optional[float], Optional[float]]] = {
+    # Generation
+    "DEFAULT_MODEL": (str, None, None),
+    "FALLBACK_MODEL": (str, None, None),
+    "MAX_TOKENS": (int, 64, 8192),
+    "TEMPERATURE": (float, 0.0, 2.0),
+    "TOP_P": (float, 0.0, 1.0),
+    "FREQUENCY_PENALTY": (float, -2.0, 2.0),
+    "PRESENCE_PENALTY": (float, -2.0, 2.0),
+    "REQUEST_TIMEOUT": (float, 1, 300),
+    "MAX_RESPONSE_LENGTH": (int, 1000, 20000),
+    "CONVERSATION_MEMORY": (int, 2, 200),
+    "GENERATION_PROFILES": (dict, None, None),
+    # Rate limits and quotas
+    "RATE_LIMIT": (int, 1, 6000),
+    "RATE_BURST": (int, 1, 1000),
+    "RATE_STRIKES_BEFORE_BAN": (int, 1, 10000),
+    "RATE_STRIKE_WINDOW": (int, 1, 86400),
+    "BAN_DURATION": (int, 60, 604800),
+    "RATE_MAX_BAN": (int, 60, 2592000),
+    "DAILY_TOKEN_QUOTA": (int, 0, 10 ** 9),
+    # Cache sizes
+    "GRAMMAR_CACHE_SIZE": (int, 0, 1000000),
+    "LATEX_CACHE_SIZE": (int, 0, 10000),
+    # Concurrency limits
+    "AI_TOOLS_MAX_CONCURRENT": (int, 1, 256),
+    "LONGFORM_MAX_JOBS": (int, 1, 64),
+    "LONGFORM_SECTION_CONCURRENCY": (int, 1, 16),
+    "EXPORT_MAX_CONCURRENT": (int, 1, 64),
+    "GRAMMAR_MAX_CONCURRENT": (int, 1, 64),
+    "LATEX_WORKERS": (int, 1, 32),
+    # Resilience and monitoring
+    "GROQ_BREAKER_FAILURES": (int, 1, 1000),
+    "GROQ_BREAKER_RESET": (float, 1, 3600),
+    "PERF_SLOW_UPDATE_MS": (float, 100, 600000),
+}
+
+PROFILE_FIELDS = {
+    "max_tokens": (int, 64, 8192),
+    "temperature": (float, 0.0, 2.0),
+    "top_p": (float, 0.0, 1.0),
+    "frequency_penalty": (float, -2.0, 2.0),
+    "presence_penalty": (float, -2.0, 2.0),
+    "model": (str, None, None),
+    "light": (bool, None, None),
+}
+
+# Top-level settings a profile can pin with its own field, so changing them skips that profile
+PROFILE_PINS = {"DEFAULT_MODEL": "model", "FALLBACK_MODEL": "model", "TEMPERATURE": "temperature",
+                "TOP_P": "top_p", "FREQUENCY_PENALTY": "frequency_penalty", "PRESENCE_PENALTY": "presence_penalty"}
+
+
+class ConfigError(ValueError):
+    """A runtime config change was rejected; nothing was applied"""
+
+
+def parse_value(raw: str) -> Any:
+    """Admin command argument: JSON if it parses (numbers, objects), else the plain string"""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def _coerce(name: str, value: Any, kind: type, low: Optional[float], high: Optional[float]) -> Any:
+    if kind is bool:
+        if not isinstance(value, bool):
+            raise ConfigError(f"{name}: expected true or false")
+        return value
+    if kind is str:
+        if not isinstance(value, str) or not value.strip():
+            raise ConfigError(f"{name}: expected a non-empty string")
+        return value.strip()
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f"{name}: expected a number, got {value!r}")
+    if kind is int:
+        if value != int(value):
+            raise ConfigError(f"{name}: expected a whole number, got {value}")
+        value = int(value)
+    else:
+        value = float(value)
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise ConfigError(f"{name}: {value} is outside {low}..{high}")
+    return value
+
+
+def _coerce_profiles(value: Any) -> Dict[str, Dict[str, Any]]:
+    if not isinstance(value, dict) or not value:
+        raise ConfigError("GENERATION_PROFILES: expected an object of profiles")
+    profiles = {}
+    for profile, fields in value.items():
+        if not isinstance(fields, dict) or "max_tokens" not in fields:
+            raise ConfigError(f"GENERATION_PROFILES.{profile}: expected an object with max_tokens")
+        unknown = set(fields) - set(PROFILE_FIELDS)
+        if unknown:
+            raise ConfigError(f"GENERATION_PROFILES.{profile}: unknown field(s) {', '.join(sorted(unknown))}")
+        profiles[profile] = {field: _coerce(f"GENERATION_PROFILES.{profile}.{field}", fields[field],
+                                            *PROFILE_FIELDS[field]) for field in fields}
+    return profiles
+
+
+def validate(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce and check a complete set of tunables; raises ConfigError listing every problem"""
+    errors = []
+    clean = {}
+    for name, value in values.items():
+        if name not in TUNABLES:
+            errors.append(f"{name}: not a runtime-tunable setting")
+            continue
+        try:
+            clean[name] = _coerce_profiles(value) if name == "GENERATION_PROFILES" else _coerce(name, value, *TUNABLES[name])
+        except ConfigError as e:
+            errors.append(str(e))
+
+    if not errors:
+        # Cross-field rules on the merged result
+        profiles = clean["GENERATION_PROFILES"]
+        referenced = set(Config.CATEGORY_PROFILES.values()) | set(Config.DOMAIN_PROFILES.values())
+        referenced.update((Config.DEFAULT_GENERATION_PROFILE, Config.LONGFORM_PROFILE))
+        missing = referenced - set(profiles)
+        if missing:
+            errors.append(f"GENERATION_PROFILES: missing profile(s) {', '.join(sorted(missing))}")
+        if clean["RATE_MAX_BAN"] < clean["BAN_DURATION"]:
+            errors.append("RATE_MAX_BAN must be at least BAN_DURATION")
+
+    if errors:
+        raise ConfigError("; ".join(errors))
+    return clean
+
+
+def pinned_by(name: str) -> List[str]:
+    """Profiles that keep their own value for `name`, so a change to it does not reach them"""
+    field = PROFILE_PINS.get(name)
+    if field is None:
+        return []
+    pinned = []
+    for profile, fields in Config.GENERATION_PROFILES.items():
+        follows = field not in fields
+        if name == "DEFAULT_MODEL":
+            follows = follows and not fields.get("light")
+        elif name == "FALLBACK_MODEL":
+            follows = follows and bool(fields.get("light"))
+        if not follows:
+            pinned.append(profile)
+    return pinned
+
+
+def _assign(overrides: Dict[str, Any], key: str, value: Any):
+    """Set KEY or a dotted path into a dict tunable (GENERATION_PROFILES.chat.max_tokens)"""
+    name, _, path = key.partition(".")
+    name = name.upper()
+    if not path:
+        overrides[name] = value
+        return
+    if name not in TUNABLES or TUNABLES[name][0] is not dict:
+        raise ConfigError(f"{key}: only dict settings take a dotted path")
+    root = copy.deepcopy(overrides.get(name, getattr(Config, name)))
+    node = root
+    parts = path.split(".")
+    for part in parts[:-1]:
+        node = node.setdefault(part, {})
+        if not isinstance(node, dict):
+            raise ConfigError(f"{key}: {part} is not an object")
+    node[parts[-1]] = value
+    overrides[name] = root
+
+
+class RuntimeConfig:
+    """Overrides for TUNABLES kept in a JSON file, polled for changes and editable via /config.
+
+    The file holds only the overridden values; everything else keeps its Config default. Every
+    change (file edit or command) is validated as a whole before any value is touched, then all
+    values are set on Config at once, and the listeners of changed keys re-apply them to objects
+    that copied a value at construction (semaphores, cache limits, the rate limiter, ...).
+    """
+
+    def __init__(self, path: str = Config.RUNTIME_CONFIG_FILE):
+        self.path = path
+        self.defaults = {name: copy.deepcopy(getattr(Config, name)) for name in TUNABLES}
+        self.overrides: Dict[str, Any] = {}
+        self.history: deque = deque(maxlen=Config.RUNTIME_CONFIG_HISTORY)
+        self._listeners: List[Tuple[frozenset, Callable[[], None]]] = []
+        self._mtime: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def on_change(self, keys: Iterable[str], callback: Callable[[], None]):
+        """Call `callback()` after any of `keys` changed; it reads the new values from Config"""
+        self._listeners.append((frozenset(keys), callback))
+
+    def _apply(self, overrides: Dict[str, Any], source: str, persist: bool = False) -> Dict[str, Tuple[Any, Any]]:
+        """Validate defaults+overrides, optionally write the file, then swap every value in at once"""
+        clean = validate({**self.defaults, **overrides})
+        changes = {name: (getattr(Config, name), value) for name, value in clean.items()
+                   if getattr(Config, name) != value}
+        if persist:
+            self._write({name: clean[name] for name in overrides})
+
+        # No awaits from here on: handlers never see a half-applied set
+        for name, (_, value) in changes.items():
+            setattr(Config, name, value)
+        self.overrides = {name: clean[name] for name in overrides}
+
+        changed = set(changes)
+        for keys, callback in self._listeners:
+            if keys & changed:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Failed to apply runtime config to {getattr(callback, '__name__', callback)}: {e}")
+
+        if changes:
+            self.history.append({"time": time.time(), "source": source, "changes": changes})
+            summary = ", ".join(f"{name}: {old!r} -> {new!r}" for name, (old, new) in changes.items()
+                                if name != "GENERATION_PROFILES")
+            if "GENERATION_PROFILES" in changes:
+                summary = ", ".join(filter(None, [summary, "GENERATION_PROFILES updated"]))
+            logger.info(f"Runtime config changed by {source}: {summary}")
+        return changes
+
+    def set(self, assignments: Dict[str, Any], source: str) -> Dict[str, Tuple[Any, Any]]:
+        """Apply KEY=value assignments together and save them to the file"""
+        overrides = copy.deepcopy(self.overrides)
+        for key, value in assignments.items():
+            _assign(overrides, key, value)
+        return self._apply(overrides, source, persist=True)
+
+    def reset(self, names: Iterable[str], source: str) -> Dict[str, Tuple[Any, Any]]:
+        """Drop overrides so the settings return to their Config defaults"""
+        overrides = {name: value for name, value in self.overrides.items() if name not in set(names)}
+        return self._apply(overrides, source, persist=True)
+
+    def reload(self, source: str = "file") -> Dict[str, Tuple[Any, Any]]:
+        """Re-read the file; a missing file means no overrides"""
+        overrides = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    overrides = json.load(f)
+            except ValueError as e:
+                raise ConfigError(f"{self.path}: invalid JSON ({e})")
+            if not isinstance(overrides, dict):
+                raise ConfigError(f"{self.path}: expected a JSON object")
+        self._mtime = self._file_mtime()
+        return self._apply(overrides, source)
+
+    def _write(self, overrides: Dict[str, Any]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(overrides, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        os.replace(temp_path, self.path)
+        self._mtime = self._file_mtime()
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def start(self):
+        """Apply the file once, then watch it from the running loop"""
+        try:
+            self.reload("startup")
+        except ConfigError as e:
+            logger.error(f"Runtime config not applied, using defaults: {e}")
+        self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(Config.RUNTIME_CONFIG_POLL)
+            if self._file_mtime() == self._mtime:
+                continue
+            try:
+                self.reload()
+            except ConfigError as e:
+                # A half-edited or bad file keeps the current values until it is fixed
+                self._mtime = self._file_mtime()
+                logger.error(f"Runtime config reload rejected: {e}")
+
+    def format_current(self) -> str:
+        """Plain-text list of tunables for the admin /config command (* = overridden)"""
+        lines = [f"Runtime config ({self.path}), * = overridden:"]
+        for name in TUNABLES:
+            value = getattr(Config, name)
+            if name == "GENERATION_PROFILES":
+                value = "; ".join(f"{profile} {fields.get('max_tokens')}tok "
+                                  f"t={fields.get('temperature', Config.TEMPERATURE)} {profile_model(fields)}"
+                                  for profile, fields in value.items())
+            lines.append(f"{'*' if name in self.overrides else ' '} {name} = {value}")
+        return "\n".join(lines)
+
+    def format_history(self, limit: int = 20) -> str:
+        if not self.history:
+            return "No runtime config changes yet."
+        lines = []
+        for entry in list(self.history)[-limit:]:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["time"]))
+            changes = ", ".join(name if name == "GENERATION_PROFILES" else f"{name} {old} -> {new}"
+                                for name, (old, new) in entry["changes"].items())
+            lines.append(f"{stamp} [{entry['source']}] {changes}")
+        return "\n".join(lines)
+
+
+_runtime_config: Optional[RuntimeConfig] = None
+
+
+def get_runtime_config() -> RuntimeConfig:
+    """Get the shared runtime config"""
+    global _runtime_config
+    if _runtime_config is None:
+        _runtime_config = RuntimeConfig()
+    return _runtime_config
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# startup_profiler.py
+# Developer: Ahmad Raza
+# Cold-start profiling: per-module import time and time until the bot can serve
+#
+# Usage: python main.py --profile-startup [--budget-ms 1500] [--top 20]
+#        python startup_profiler.py --budget-ms 1500
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from config import Config
+
+# Modules that must only be imported on first use, never during startup
+LAZY_MODULES = ["reportlab", "langdetect", "textblob", "requests", "groq", "numpy"]
+
+# Runs in a fresh interpreter: import the bot, build it, and report the timings as JSON
+_CHILD_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+bot = main.EnhancedOstaadAIBot()
+built = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1e3,
+    "build_ms": (built - imported) * 1e3,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def _child_env() -> Dict[str, str]:
+    """Environment for the profiled interpreter; dummy secrets keep Config.validate happy"""
+    env = dict(os.environ)
+    env.setdefault("TELEGRAM_BOT_TOKEN", "123456:profile-startup")
+    env.setdefault("GROQ_API_KEY", "profile-startup")
+    return env
+
+
+def profile_imports(target: str = "main") -> List[Dict[str, float]]:
+    """Per-module import times (ms) from `python -X importtime`, slowest first"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=_child_env()
+    )
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1e3,
+            "cumulative_ms": int(cumulative_us) / 1e3,
+        })
+
+    modules.sort(key=lambda m: m["cumulative_ms"], reverse=True)
+    return modules
+
+
+def measure_startup() -> Dict:
+    """Time from interpreter launch until the bot object is built and could start polling"""
+    launched = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD_SCRIPT],
+        capture_output=True, text=True, env=_child_env()
+    )
+    total_ms = (time.perf_counter() - launched) * 1e3
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Bot failed to start while profiling:\n{result.stderr}")
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report["ready_ms"] = total_ms
+    loaded = set(report.pop("modules"))
+    report["eager_lazy_modules"] = sorted(name for name in LAZY_MODULES if name in loaded)
+    return report
+
+
+def check_startup_budget(budget_ms: float = Config.STARTUP_BUDGET_MS,
+                         report: Optional[Dict] = None) -> List[str]:
+    """Budget check usable from tests/CI: returns a list of violations (empty = OK)"""
+    report = report or measure_startup()
+    violations = []
+    if report["ready_ms"] > budget_ms:
+        violations.append(f"time to ready {report['ready_ms']:.0f} ms exceeds budget {budget_ms:.0f} ms")
+    for name in report["eager_lazy_modules"]:
+        violations.append(f"'{name}' is imported at startup but should be lazy")
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the startup profile and exit non-zero when over budget"""
+    parser = argparse.ArgumentParser(description="Profile Ostaad AI cold start")
+    parser.add_argument("--budget-ms", type=float, default=Config.STARTUP_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"Slowest imports (cumulative, top {args.top}):")
+    for module in profile_imports()[:args.top]:
+        print(f"  {module['cumulative_ms']:8.1f} ms  (self {module['self_ms']:6.1f} ms)  {module['module']}")
+
+    report = measure_startup()
+    print(f"\nImport main:        {report['import_ms']:8.1f} ms")
+    print(f"Build bot:          {report['build_ms']:8.1f} ms")
+    print(f"Launch to ready:    {report['ready_ms']:8.1f} ms  (budget {args.budget_ms:.0f} ms)")
+
+    violations = check_startup_budget(args.budget_ms, report)
+    for violation in violations:
+        print(f"BUDGET: {violation}")
+    if not violations:
+        print("Startup is within budget")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+# text_classifier.py
+# Developer: Ahmad Raza
+# Hashed n-gram linear classifier for query categories and knowledge domains
+#
+# Usage: python text_classifier.py train [--logs logs] [--holdout 5] [--calibration 4]
+#        python text_classifier.py evaluate
+#
+# Training also calibrates, per head, the confidence above which the model may replace a keyword
+# fallback, on a split kept apart from both training and the reported test split. A head gets no
+# threshold (and is never used) unless that beats keywords there, at or above CLASSIFIER_MIN_CONFIDENCE.
+
+import argparse
+import glob
+import logging
+import os
+import re
+import sys
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+from language_identifier import split_corpus
+
+logger = logging.getLogger(__name__)
+
+HEADS = ("category", "domain")
+HASH_BITS = 14                      # 16384 shared feature buckets
+CHAR_ORDERS = (2, 3, 4, 5)          # Byte n-gram orders, ascending (a Devanagari letter is 3 bytes)
+EPOCHS = 150
+LEARNING_RATE = 0.5
+L2 = 1e-4
+
+DEFAULT_CORPUS = os.path.join(Config.DATA_DIR, "category_corpus.tsv")
+DEFAULT_WEIGHTS = os.path.join(Config.DATA_DIR, "category_classifier.npz")
+
+_NON_WORD = re.compile(r"[\W_]+")
+_LOG_MESSAGE = re.compile(r"\| Message: \[(\w+)\] (.*?)(?:\.\.\.)? \| Response Length:")
+_WORD_SALT = b"w\x00"
+
+# Same multipliers as the language identifier's rolling byte hash
+_ROLL = np.uint32(16777619)
+_MIX = np.uint32(2654435761)
+_SEED = np.uint32(0x9E37)
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace to single spaces (any script)"""
+    return " " + _NON_WORD.sub(" ", text.lower()).strip() + " "
+
+
+def featurize(text: str) -> np.ndarray:
+    """Bucket indices of hashed char n-grams plus word unigrams/bigrams"""
+    normalized = normalize(text)
+    data = np.frombuffer(normalized.encode("utf-8"), dtype=np.uint8).astype(np.uint32)
+    shift = np.uint32(32 - HASH_BITS)
+    mask = (1 << HASH_BITS) - 1
+
+    # Order-k hashes extend the order-(k-1) ones; all orders are mixed in one go
+    parts = [np.zeros(0, dtype=np.uint32)]
+    rolling = data + _SEED
+    with np.errstate(over="ignore"):
+        for order in range(2, CHAR_ORDERS[-1] + 1):
+            rolling = rolling[:-1] * _ROLL + data[order - 1:]
+            if not rolling.shape[0]:
+                break
+            if order >= CHAR_ORDERS[0]:
+                parts.append(rolling)
+        parts = [(np.concatenate(parts) * _MIX) >> shift]
+
+    words = normalized.split()
+    word_features = [zlib.crc32(_WORD_SALT + w.encode("utf-8")) & mask for w in words]
+    word_features += [
+        zlib.crc32(_WORD_SALT + f"{a} {b}".encode("utf-8")) & mask for a, b in zip(words, words[1:])
+    ]
+    parts.append(np.array(word_features, dtype=np.uint32))
+    return np.concatenate(parts)
+
+
+def _batch_features(texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenated indices, start offset of each text, and per-text 1/sqrt(n) scale"""
+    features = [featurize(text) for text in texts]
+    lengths = np.fromiter((max(len(idx), 1) for idx in features), dtype=np.int64, count=len(features))
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    indices = np.concatenate([idx if len(idx) else np.zeros(1, dtype=np.uint32) for idx in features])
+    return indices, offsets, (1.0 / np.sqrt(lengths)).astype(np.float32)
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+class LinearHead:
+    """One softmax output layer over the shared hashed features"""
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray, labels: Tuple[str, ...],
+                 threshold: Optional[float] = None):
+        self.weights = np.ascontiguousarray(weights, dtype=np.float32)     # (buckets, classes)
+        self.bias = bias.astype(np.float32)                                 # (classes,)
+        self.labels = tuple(labels)
+        self.threshold = threshold          # Min confidence to override keywords; None = never
+
+    def probabilities(self, indices: np.ndarray, offsets: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        """Class probabilities (texts, classes) for a featurized batch"""
+        logits = np.add.reduceat(self.weights[indices], offsets, axis=0) * scales[:, None] + self.bias
+        return _softmax(logits)
+
+    @classmethod
+    def train(cls, indices: np.ndarray, offsets: np.ndarray, scales: np.ndarray,
+              targets: List[str], epochs: int = EPOCHS) -> "LinearHead":
+        """Fit with full-batch AdaGrad on the softmax cross-entropy"""
+        labels = tuple(sorted(set(targets)))
+        y = np.array([labels.index(t) for t in targets])
+        samples, classes, buckets = len(targets), len(labels), 1 << HASH_BITS
+
+        head = cls(np.zeros((buckets, classes), dtype=np.float32), np.zeros(classes, dtype=np.float32), labels)
+        rows = np.repeat(np.arange(samples), np.diff(np.append(offsets, len(indices))))
+        weight_history = np.full((buckets, classes), 1e-8, dtype=np.float32)
+        bias_history = np.full(classes, 1e-8, dtype=np.float32)
+
+        for _ in range(epochs):
+            residual = head.probabilities(indices, offsets, scales)
+            residual[np.arange(samples), y] -= 1.0
+            residual /= samples
+
+            contributions = residual[rows] * scales[rows, None]
+            gradient = np.stack([
+                np.bincount(indices, weights=contributions[:, c], minlength=buckets) for c in range(classes)
+            ], axis=1).astype(np.float32) + L2 * head.weights
+            bias_gradient = residual.sum(axis=0)
+
+            weight_history += gradient ** 2
+            bias_history += bias_gradient ** 2
+            head.weights -= LEARNING_RATE * gradient / np.sqrt(weight_history)
+            head.bias -= LEARNING_RATE * bias_gradient / np.sqrt(bias_history)
+
+        return head
+
+
+class QueryClassifier:
+    """Category and domain heads sharing one featurization pass"""
+
+    def __init__(self, heads: Dict[str, LinearHead]):
+        self.heads = heads
+        # Heads side by side, so a batch needs a single gather over the feature rows
+        self._weights = np.hstack([head.weights for head in heads.values()])
+        self._bias = np.concatenate([head.bias for head in heads.values()])
+        self._bounds = np.cumsum([0] + [len(head.labels) for head in heads.values()])
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_WEIGHTS) -> "QueryClassifier":
+        """Load both heads from a NumPy archive"""
+        with np.load(path) as tables:
+            return cls({
+                name: LinearHead(
+                    tables[f"{name}_weights"],
+                    tables[f"{name}_bias"],
+                    tuple(str(label) for label in tables[f"{name}_labels"]),
+                    _threshold(tables, name)
+                )
+                for name in HEADS
+            })
+
+    def save(self, path: str = DEFAULT_WEIGHTS):
+        """Save both heads as a compact NumPy archive"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        arrays = {}
+        for name, head in self.heads.items():
+            arrays[f"{name}_weights"] = head.weights.astype(np.float16)
+            arrays[f"{name}_bias"] = head.bias
+            arrays[f"{name}_labels"] = np.array(head.labels)
+            arrays[f"{name}_threshold"] = np.float32(np.nan if head.threshold is None else head.threshold)
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def train(cls, samples: List[Tuple[str, str, str]]) -> "QueryClassifier":
+        """Train from (category, domain, text) samples"""
+        features = _batch_features([text for _, _, text in samples])
+        return cls({
+            "category": LinearHead.train(*features, [c for c, _, _ in samples]),
+            "domain": LinearHead.train(*features, [d for _, d, _ in samples]),
+        })
+
+    def predict_batch(self, texts: List[str]) -> List[Dict]:
+        """Category and domain with confidences for every text, vectorized per batch"""
+        if not texts:
+            return []
+
+        indices, offsets, scales = _batch_features(texts)
+        logits = np.add.reduceat(self._weights[indices], offsets, axis=0) * scales[:, None] + self._bias
+        results = [{} for _ in texts]
+        for (name, head), start, stop in zip(self.heads.items(), self._bounds, self._bounds[1:]):
+            probabilities = _softmax(logits[:, start:stop])
+            best = probabilities.argmax(axis=1)
+            for result, label, confidence in zip(results, best, probabilities[np.arange(len(texts)), best]):
+                result[name] = head.labels[label]
+                result[f"{name}_confidence"] = float(confidence)
+                result[f"{name}_trusted"] = (head.threshold is not None
+                                             and confidence >= max(head.threshold, Config.CLASSIFIER_MIN_CONFIDENCE))
+        return results
+
+    def predict(self, text: str) -> Dict:
+        """Category and domain with confidences for a single text"""
+        return self.predict_batch([text])[0]
+
+
+def _threshold(tables, name: str) -> Optional[float]:
+    """Saved threshold of a head; archives without one (or NaN) never override keywords"""
+    key = f"{name}_threshold"
+    if key not in tables.files or np.isnan(tables[key]):
+        return None
+    return float(tables[key])
+
+
+_classifier: Optional[QueryClassifier] = None
+_load_failed = False
+
+
+def get_classifier() -> Optional[QueryClassifier]:
+    """Get the shared classifier, loading the weights on first use"""
+    global _classifier, _load_failed
+    if _classifier is None and not _load_failed:
+        try:
+            _classifier = QueryClassifier.load()
+        except Exception as e:
+            _load_failed = True
+            logger.error(f"Failed to load query classifier weights: {e}")
+    return _classifier
+
+
+def read_corpus(path: str = DEFAULT_CORPUS) -> List[Tuple[str, str, str]]:
+    """Read a 'category<TAB>domain<TAB>text' corpus, skipping comments and blank lines"""
+    samples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            category, domain, text = line.split("\t", 2)
+            samples.append((category, domain, text))
+    return samples
+
+
+def read_interaction_logs(logs_dir: str = Config.LOGS_DIR) -> List[Tuple[str, str, str]]:
+    """Samples from interactions_*.log, labelled by the keyword analyzer at the time
+
+    Queries logged as general_knowledge are skipped: that is also the fallback
+    when no keyword matched, so the label carries no signal.
+    """
+    from message_analyzer import MessageAnalyzer
+
+    analyzer = MessageAnalyzer(use_model=False)
+    samples = []
+    for path in sorted(glob.glob(os.path.join(logs_dir, "interactions_*.log"))):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                match = _LOG_MESSAGE.search(line)
+                if not match or match.group(1) == "general_knowledge":
+                    continue
+                text = match.group(2)
+                samples.append((match.group(1), analyzer.analyze(text)["domain"], text))
+    return samples
+
+
+def evaluate(classifier: QueryClassifier, samples: List[Tuple[str, str, str]]) -> Dict[str, float]:
+    """Per-head accuracy of the classifier, the keyword analyzer, and keywords backed by the model
+    where they fell back and the model cleared its threshold (what CLASSIFIER_FALLBACK would do)"""
+    if not samples:
+        return {"samples": 0}
+
+    from message_analyzer import DEFAULT_DOMAIN, MessageAnalyzer
+
+    analyzer = MessageAnalyzer(use_model=False)
+    texts = [text for _, _, text in samples]
+    predictions = classifier.predict_batch(texts)
+    keywords = [analyzer.analyze(text) for text in texts]
+
+    result = {"samples": len(samples)}
+    for position, name in enumerate(HEADS):
+        expected = [sample[position] for sample in samples]
+        result[f"{name}_accuracy"] = sum(p[name] == e for p, e in zip(predictions, expected)) / len(samples)
+        result[f"keyword_{name}_accuracy"] = sum(k[name] == e for k, e in zip(keywords, expected)) / len(samples)
+        fell_back = [k["category_source"] == "default" if name == "category" else k["domain"] == DEFAULT_DOMAIN
+                     for k in keywords]
+        combined = [p[name] if fallback and p[f"{name}_trusted"] else k[name]
+                    for p, k, fallback in zip(predictions, keywords, fell_back)]
+        result[f"combined_{name}_accuracy"] = sum(c == e for c, e in zip(combined, expected)) / len(samples)
+    return result
+
+
+def _keyword_fallbacks(samples: List[Tuple[str, str, str]]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Per head, the samples where the keyword analyzer found nothing and fell back to its default"""
+    from message_analyzer import DEFAULT_DOMAIN, MessageAnalyzer
+
+    analyzer = MessageAnalyzer(use_model=False)
+    fallbacks = {name: [] for name in HEADS}
+    for sample in samples:
+        analysis = analyzer.analyze(sample[2])
+        if analysis["category_source"] == "default":
+            fallbacks["category"].append((sample, analysis["category"]))
+        if analysis["domain"] == DEFAULT_DOMAIN:
+            fallbacks["domain"].append((sample, analysis["domain"]))
+    return fallbacks
+
+
+def calibrate(classifier: QueryClassifier, samples: List[Tuple[str, str, str]],
+              min_support: int = Config.CLASSIFIER_MIN_SUPPORT,
+              floor: float = Config.CLASSIFIER_MIN_CONFIDENCE) -> Dict[str, Optional[float]]:
+    """Set each head's threshold from calibration samples where keywords fell back.
+
+    The threshold is the confidence cutoff, no lower than `floor`, that makes "model above cutoff,
+    else keyword default" most accurate on those samples. A head keeps None unless that accuracy is
+    strictly better than the keyword default alone and at least `min_support` samples clear the
+    cutoff. Pass samples that are neither trained on nor used to report accuracy.
+    """
+    thresholds = {}
+    for position, (name, fallbacks) in enumerate(_keyword_fallbacks(samples).items()):
+        head = classifier.heads[name]
+        head.threshold = None
+        if not fallbacks:
+            thresholds[name] = None
+            continue
+
+        predictions = classifier.predict_batch([sample[2] for sample, _ in fallbacks])
+        expected = [sample[position] for sample, _ in fallbacks]
+        keyword_correct = [default == e for (_, default), e in zip(fallbacks, expected)]
+        best_correct, best_cutoff = sum(keyword_correct), None
+        for cutoff in sorted({p[f"{name}_confidence"] for p in predictions if p[f"{name}_confidence"] >= floor}):
+            used = [p[f"{name}_confidence"] >= cutoff for p in predictions]
+            if sum(used) < min_support:
+                break
+            correct = sum((p[name] == e) if use else keyword
+                          for p, e, use, keyword in zip(predictions, expected, used, keyword_correct))
+            if correct > best_correct:
+                best_correct, best_cutoff = correct, cutoff
+        head.threshold = thresholds[name] = best_cutoff
+    return thresholds
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point to retrain and evaluate the classifier"""
+    parser = argparse.ArgumentParser(description="Train or evaluate the query category/domain classifier")
+    parser.add_argument("command", choices=["train", "evaluate"])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--weights", default=DEFAULT_WEIGHTS)
+    parser.add_argument("--logs", help="Also train on interaction logs from this directory")
+    parser.add_argument("--holdout", type=int, default=5, help="Hold out every Nth sample for evaluation")
+    parser.add_argument("--calibration", type=int, default=4,
+                        help="Of the rest, keep every Nth sample out of training to calibrate thresholds")
+    args = parser.parse_args(argv)
+
+    # Three disjoint splits: thresholds tuned on the test split would make its accuracy optimistic
+    train, held_out = split_corpus(read_corpus(args.corpus), args.holdout)
+    train, calibration = split_corpus(train, args.calibration)
+
+    if args.command == "train":
+        if args.logs:
+            logged = read_interaction_logs(args.logs)
+            print(f"Loaded {len(logged)} samples from interaction logs")
+            train = train + logged
+        classifier = QueryClassifier.train(train)
+        calibrate(classifier, calibration)
+        classifier.save(args.weights)
+        print(f"Trained on {len(train)} samples, calibrated on {len(calibration)} -> {args.weights}")
+    else:
+        classifier = QueryClassifier.load(args.weights)
+
+    result = evaluate(classifier, held_out)
+    print(f"Held-out samples: {result['samples']}")
+    for name in HEADS if result["samples"] else ():
+        print(f"  {name:8} model {result[f'{name}_accuracy']:.3f}   keywords {result[f'keyword_{name}_accuracy']:.3f}"
+              f"   keywords+model {result[f'combined_{name}_accuracy']:.3f}")
+    for name, head in classifier.heads.items():
+        threshold = "none (never overrides keywords)" if head.threshold is None else f"{head.threshold:.3f}"
+        print(f"  {name:8} fallback threshold: {threshold}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# usage_tracker.py
+# Developer: Ahmad Raza
+# Token accounting per user, category, language and model per day, daily quotas and the /cost report
+
+import json
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from config import Config
+from utils import Utils
+
+logger = logging.getLogger(__name__)
+
+# Counters kept for every bucket; the *_time ones are Groq's own timings in seconds
+FIELDS = ("calls", "prompt_tokens", "completion_tokens", "queue_time", "prompt_time", "completion_time")
+DIMENSIONS = ("users", "categories", "languages", "models")
+
+
+def _new_bucket() -> Dict[str, float]:
+    return dict.fromkeys(FIELDS, 0)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """USD at Config.TOKEN_PRICES (per million input / output tokens)"""
+    input_price, output_price = Config.TOKEN_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1e6
+
+
+class UsageTracker:
+    """Daily token totals kept in memory and saved to temp/usage.json at most every USAGE_SAVE_INTERVAL"""
+
+    def __init__(self, path: str = os.path.join(Config.TEMP_DIR, "usage.json"),
+                 daily_quota: int = Config.DAILY_TOKEN_QUOTA):
+        self.path = path
+        self.daily_quota = daily_quota
+        self.days: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = self._load()
+        self._last_save = time.monotonic()
+        self._dirty = False
+
+    def _load(self) -> Dict:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load usage totals: {e}")
+        return {}
+
+    def save(self):
+        """Write the retained days to disk"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.days, f, ensure_ascii=False)
+            self._dirty = False
+        except Exception as e:
+            logger.error(f"Failed to save usage totals: {e}")
+        self._last_save = time.monotonic()
+
+    def _today(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        key = date.today().isoformat()
+        day = self.days.get(key)
+        if day is None:
+            day = self.days[key] = {dimension: {} for dimension in DIMENSIONS}
+            cutoff = (date.today() - timedelta(days=Config.USAGE_RETENTION_DAYS)).isoformat()
+            for old in [old for old in self.days if old < cutoff]:
+                del self.days[old]
+        return day
+
+    def record(self, user_id: int, category: Optional[str], language: str, model: str, usage):
+        """Add one completion's `usage` (Groq response.usage) to today's totals"""
+        if usage is None:
+            return
+        values = {
+            "calls": 1,
+            "prompt_tokens": getattr(usage, "prompt_tokens", None) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", None) or 0,
+            "queue_time": getattr(usage, "queue_time", None) or 0.0,
+            "prompt_time": getattr(usage, "prompt_time", None) or 0.0,
+            "completion_time": getattr(usage, "completion_time", None) or 0.0,
+        }
+
+        day = self._today()
+        for dimension, key in (("users", str(user_id)), ("categories", category or "unknown"),
+                               ("languages", language), ("models", model)):
+            bucket = day[dimension].setdefault(key, _new_bucket())
+            for field, value in values.items():
+                bucket[field] += value
+
+        self._dirty = True
+        if time.monotonic() - self._last_save >= Config.USAGE_SAVE_INTERVAL:
+            self.save()
+
+    def tokens_today(self, user_id: int) -> int:
+        bucket = self._today()["users"].get(str(user_id))
+        return int(bucket["prompt_tokens"] + bucket["completion_tokens"]) if bucket else 0
+
+    def over_quota(self, user_id: int) -> bool:
+        """User has used their daily tokens (admins and a quota of 0 are unlimited)"""
+        if not self.daily_quota or Utils.is_admin(user_id):
+            return False
+        return self.tokens_today(user_id) >= self.daily_quota
+
+    def seconds_until_reset(self) -> int:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return int((midnight - now).total_seconds())
+
+    def format_report(self, days: int = 1, top: int = 10) -> str:
+        """Plain-text cost report over the last `days` days for the admin /cost command"""
+        first = (date.today() - timedelta(days=days - 1)).isoformat()
+        totals = {dimension: {} for dimension in DIMENSIONS}
+        for key, day in self.days.items():
+            if key < first:
+                continue
+            for dimension in DIMENSIONS:
+                for name, bucket in day.get(dimension, {}).items():
+                    merged = totals[dimension].setdefault(name, _new_bucket())
+                    for field in FIELDS:
+                        merged[field] += bucket.get(field, 0)
+
+        models = totals["models"]
+        if not models:
+            return f"No model calls in the last {days} day(s)."
+
+        calls = sum(bucket["calls"] for bucket in models.values())
+        prompt = sum(bucket["prompt_tokens"] for bucket in models.values())
+        completion = sum(bucket["completion_tokens"] for bucket in models.values())
+        cost = sum(estimate_cost(name, bucket["prompt_tokens"], bucket["completion_tokens"])
+                   for name, bucket in models.items())
+
+        def timing(field: str) -> float:
+            return sum(bucket[field] for bucket in models.values()) / calls * 1000
+
+        lines = [
+            f"Usage, last {days} day(s): {calls} calls, {prompt:,} prompt + {completion:,} completion tokens, "
+            f"~${cost:.3f}",
+            f"Avg Groq time: queue {timing('queue_time'):.0f}ms, prompt {timing('prompt_time'):.0f}ms, "
+            f"completion {timing('completion_time'):.0f}ms",
+            "",
+            "Models:",
+        ]
+        for name, bucket in sorted(models.items(), key=lambda item: -item[1]["completion_tokens"]):
+            lines.append(f"  {name}: {bucket['calls']} calls, "
+                         f"{bucket['prompt_tokens'] + bucket['completion_tokens']:,} tokens, "
+                         f"~${estimate_cost(name, bucket['prompt_tokens'], bucket['completion_tokens']):.3f}")
+
+        for dimension, title in (("users", f"Top {top} users"), ("categories", "Categories"),
+                                 ("languages", "Languages")):
+            lines.append("")
+            lines.append(f"{title}:")
+            ranked = sorted(totals[dimension].items(),
+                            key=lambda item: -(item[1]["prompt_tokens"] + item[1]["completion_tokens"]))
+            for name, bucket in ranked[:top]:
+                tokens = bucket["prompt_tokens"] + bucket["completion_tokens"]
+                lines.append(f"  {name}: {tokens:,} tokens ({tokens / max(1, prompt + completion):.0%}), "
+                             f"{bucket['calls']} calls")
+
+        if self.daily_quota:
+            over = sum(1 for user in totals["users"] if self.over_quota(int(user)))
+            lines.append("")
+            lines.append(f"Daily quota: {self.daily_quota:,} tokens per user, {over} user(s) over it today")
+        return "\n".join(lines)
+
+
+_tracker: Optional[UsageTracker] = None
+
+
+def get_usage_tracker() -> UsageTracker:
+    """Get the shared usage tracker"""
+    global _tracker
+    if _tracker is None:
+        _tracker = UsageTracker()
+    return _tracker
@@ -6,6 +6,7 @@ import json
 import os
 from typing import Dict, Optional
 from config import Config
+from perf_tracing import span
 
 class UserPreferences:
     def __init__(self):
@@ -25,21 +26,28 @@ class UserPreferences:
     def _save_preferences(self):
         """Save user preferences to file"""
         try:
-            os.makedirs(os.path.dirname(self.preferences_file), exist_ok=True)
-            with open(self.preferences_file, 'w', encoding='utf-8') as f:
-                json.dump(self.user_data, f, ensure_ascii=False, indent=2)
+            with span("preferences_write"):
+                os.makedirs(os.path.dirname(self.preferences_file), exist_ok=True)
+                with open(self.preferences_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.user_data, f, ensure_ascii=False, indent=2)
         except Exception:
             pass
     
-    def set_user_language(self, user_id: int, language: str):
-        """Set user's preferred language"""
+    def set_user_language(self, user_id: int, language: str, explicit: bool = False):
+        """Set user's preferred language (explicit = chosen from settings, not detected)"""
         user_key = str(user_id)
         if user_key not in self.user_data:
             self.user_data[user_key] = {}
         
         self.user_data[user_key]['language'] = language
+        self.user_data[user_key]['language_explicit'] = explicit
         self._save_preferences()
     
+    def is_language_explicit(self, user_id: int) -> bool:
+        """Check whether the user picked their language from the settings menu"""
+        user_key = str(user_id)
+        return bool(self.user_data.get(user_key, {}).get('language_explicit', False))
+    
     def get_user_language(self, user_id: int) -> Optional[str]:
         """Get user's preferred language"""
         user_key = str(user_id)
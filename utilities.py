@@ -3,8 +3,7 @@
 # Utility functions for the Telegram bot
 
 import os
-from langdetect import detect
-import subprocess
+from language_identifier import get_identifier, is_latin_script
 import logging
 
 # Configure logging
@@ -14,7 +13,12 @@ logger = logging.getLogger(__name__)
 def detect_language(text):
     """Detect the language of input text."""
     try:
-        lang = detect(text)
+        identifier = get_identifier()
+        if identifier is not None and is_latin_script(text):
+            lang = identifier.detect(text)[0]
+        else:
+            from langdetect import detect
+            lang = detect(text)
         logger.info(f"Detected language: {lang}")
         return lang
     except Exception as e:
@@ -39,19 +43,14 @@ def log_interaction(user_id, command, action):
     except Exception as e:
         logger.error(f"Failed to log interaction: {e}")
 
-def generate_pdf(content, lang="en"):
-    """Generate a PDF using LaTeX."""
+async def generate_pdf(content, lang="en"):
+    """Generate a PDF using LaTeX (sandboxed, cached render service); returns the PDF bytes."""
+    from latex_renderer import get_renderer
     try:
-        with open("latex_template.tex", "r") as f:
-            template = f.read()
         title = "AI-Powered Bot Output" if lang == "en" else "AI-पावर्ड बॉट आउटपुट"
-        content = content.replace('\n', '\\\\\n').replace('"', '\\"')
-        latex_content = template.format(title=title, content=content, developer="G A RAZA")
-        with open("output.tex", "w") as f:
-            f.write(latex_content)
-        subprocess.run(["latexmk", "-pdf", "output.tex"], check=True)
+        pdf = await get_renderer().render(content, title)
         logger.info("PDF generated successfully")
-        return "output.pdf"
+        return pdf
     except Exception as e:
         logger.error(f"Failed to generate PDF: {e}")
         raise
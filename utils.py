@@ -7,11 +7,8 @@ import logging
 import asyncio
 from datetime import datetime
 from typing import Optional
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 from config import Config
+from message_chunker import split_message
 
 logger = logging.getLogger(__name__)
 
@@ -38,86 +35,16 @@ class Utils:
     
     @staticmethod
     def split_long_message(text: str, max_length: int = Config.MAX_MESSAGE_LENGTH) -> list:
-        """Split long messages into chunks"""
-        if len(text) <= max_length:
-            return [text]
-        
-        chunks = []
-        current_chunk = ""
-        
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
-        
-        for paragraph in paragraphs:
-            if len(current_chunk + paragraph) <= max_length:
-                current_chunk += paragraph + '\n\n'
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-                
-                # If paragraph is too long, split by sentences
-                if len(paragraph) > max_length:
-                    sentences = paragraph.split('. ')
-                    for sentence in sentences:
-                        if len(current_chunk + sentence) <= max_length:
-                            current_chunk += sentence + '. '
-                        else:
-                            if current_chunk:
-                                chunks.append(current_chunk.strip())
-                            current_chunk = sentence + '. '
-                else:
-                    current_chunk = paragraph + '\n\n'
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-        
-        return chunks
+        """Split long messages into Telegram-sized chunks (UTF-16 units, Markdown-safe breaks)"""
+        return split_message(text, max_length)
     
     @staticmethod
-    async def generate_pdf(content: str, title: str = "AI Chat Export") -> str:
-        """Generate PDF from text content"""
+    async def generate_pdf(content: str, title: str = "AI Chat Export") -> bytes:
+        """Render text content to PDF bytes in the export process pool"""
+        from pdf_export import get_exporter
+        
         try:
-            filename = f"chat_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            filepath = os.path.join(Config.TEMP_DIR, filename)
-            
-            # Create PDF
-            doc = SimpleDocTemplate(filepath, pagesize=letter)
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
-            
-            content_style = ParagraphStyle(
-                'CustomContent',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=12,
-                leftIndent=20,
-                rightIndent=20
-            )
-            
-            # Build PDF content
-            story = []
-            story.append(Paragraph(title, title_style))
-            story.append(Spacer(1, 20))
-            
-            # Split content into paragraphs
-            paragraphs = content.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    story.append(Paragraph(para.strip(), content_style))
-                    story.append(Spacer(1, 10))
-            
-            doc.build(story)
-            return filepath
-            
+            return await get_exporter().export(title, [{'role': 'assistant', 'content': content}])
         except Exception as e:
             logger.error(f"Failed to generate PDF: {e}")
             raise
@@ -125,8 +52,10 @@ class Utils:
     @staticmethod
     def format_response_with_emojis(text: str, language: str) -> str:
         """Add appropriate emojis based on content and language"""
+        lowered = text.lower()
+        
         # Add thinking emoji for questions
-        if '?' in text or 'how' in text.lower() or 'what' in text.lower():
+        if '?' in text or 'how' in lowered or 'what' in lowered:
             text = f"{Config.THINKING_EMOJI} {text}"
         
         # Add success emoji for positive responses
@@ -138,7 +67,7 @@ class Utils:
         }
         
         words = positive_words.get(language, positive_words['en'])
-        if any(word in text.lower() for word in words):
+        if any(word in lowered for word in words):
             text = f"{Config.SUCCESS_EMOJI} {text}"
         
         return text
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# warmup.py
+# Developer: Ahmad Raza
+# Background warm-up of detectors, caches and upstream connections at startup
+
+import asyncio
+import logging
+import time
+from typing import Dict
+
+from config import Config
+from message_catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+
+class StartupWarmup:
+    """Pays the one-time costs before the first user does, then keeps connections warm"""
+
+    def __init__(self, handlers, application):
+        self.handlers = handlers
+        self.application = application
+        self.ready = asyncio.Event()
+        self.timings: Dict[str, float] = {}
+        self.failures: Dict[str, str] = {}
+        self._keepalive_task = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready.is_set()
+
+    def _warm_language_detection(self):
+        """Load the n-gram tables and langdetect's language profiles"""
+        from language_identifier import get_identifier
+
+        get_identifier()
+        self.handlers.language_detector._langdetect_best("warming up the language profiles")
+
+    def _warm_classifier(self):
+        """Compile the keyword automaton and, if the model fallback is on, load its weights"""
+        from message_analyzer import get_analyzer
+
+        get_analyzer()
+        if Config.CLASSIFIER_FALLBACK:
+            from text_classifier import get_classifier
+            get_classifier()
+
+    def _warm_screens(self):
+        """Compile every language of the message catalog"""
+        get_catalog().preload()
+
+    def _warm_groq(self):
+        """Import the SDK, open the TLS connection and build the system prompts"""
+        self.handlers.ai_service.warm_up(Config.SUPPORTED_LANGUAGES)
+
+    async def _warm_bot_api(self):
+        """Open the Bot API connection used for sending replies"""
+        await self.application.bot.get_me()
+
+    async def _timed(self, name: str, step):
+        started = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(step):
+                await step()
+            else:
+                await asyncio.to_thread(step)
+        except Exception as e:
+            self.failures[name] = str(e)
+            logger.warning(f"Warm-up step '{name}' failed: {e}")
+        finally:
+            self.timings[name] = (time.perf_counter() - started) * 1e3
+
+    async def run(self):
+        """Run all warm-up steps concurrently and mark the bot ready"""
+        started = time.perf_counter()
+        await asyncio.gather(
+            self._timed("language_detection", self._warm_language_detection),
+            self._timed("classifier", self._warm_classifier),
+            self._timed("screens", self._warm_screens),
+            self._timed("groq", self._warm_groq),
+            self._timed("bot_api", self._warm_bot_api),
+        )
+        self.timings["total"] = (time.perf_counter() - started) * 1e3
+
+        summary = ", ".join(f"{name} {ms:.0f} ms" for name, ms in self.timings.items())
+        logger.info(f"Warm-up finished: {summary}")
+        self.ready.set()
+
+        self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def _keepalive(self):
+        """Ping upstreams periodically so the first request after a quiet spell stays fast"""
+        while True:
+            await asyncio.sleep(Config.UPSTREAM_KEEPALIVE_SECONDS)
+            await self._timed("groq_keepalive", self.handlers.ai_service.ping_upstream)
+            await self._timed("bot_api_keepalive", self._warm_bot_api)
+
+    async def stop(self):
+        """Cancel the keep-alive loop"""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass